@@ -28,6 +28,11 @@ if not os.path.exists(exiftool_bin):
     print("Install with: brew install exiftool")
     sys.exit(1)
 
+# Pre-rendered window icon (generate first with: python scripts/create_icns.py)
+icon_datas = []
+if os.path.exists('resources/app_icon.png'):
+    icon_datas.append(('resources/app_icon.png', 'resources'))
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -39,7 +44,7 @@ a = Analysis(
         (exiftool_lib, 'exiftool_perl/lib'),
         # sensor_camera module (imported dynamically)
         ('sensor_camera.py', '.'),
-    ] + plotly_datas,
+    ] + icon_datas + plotly_datas,
     hiddenimports=[
         # Qt WebEngine (often missed)
         'PyQt6.QtWebEngineWidgets',
@@ -91,6 +96,10 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    # Bundle bytecode compiled with -O (asserts stripped). Docstrings are kept
+    # (-OO) because some bundled libraries read __doc__ at import time.
+    # Needs PyInstaller >= 6.0.
+    optimize=1,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -3,26 +3,185 @@ Application controller for managing state and coordinating between views.
 Handles application logic and signal/slot connections.
 """
 
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QRunnable, QThreadPool, QTimer
 from PyQt6.QtWidgets import QMessageBox
-from typing import Optional, Dict, Any
+from PyQt6.QtGui import QPixmap, QImage, QPixmapCache
+from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
 from pathlib import Path
+import os
+import threading
 import numpy as np
 
 from models.data_model import DataModel
+from models.image_model import ImageModel
+from sensor_camera import Sensor
+from utils.db_manager import get_db_manager
 from utils.plot_generator import get_plot_generator
 from utils.image_loader import get_image_loader
-from views.image_window import ImageWindow
-
-
-class BackgroundImageLoader(QThread):
-    """Background thread for loading images"""
+from utils.stats_kernel import image_stats, normalize_to_u8, high_byte_to_u8
+from utils.exiftool_helper import close_exiftool_helper
+
+
+# Camera-specific sensor crops (row slice, column slice), resolved once
+_CAMERA_CROPS: Dict[str, Tuple[slice, slice]] = dict(Sensor.CAMERA_CROPS)
+
+
+def _decode_raw(file_path: str, camera_model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Decode raw sensor data and prepare an 8-bit greyscale display buffer.
+
+    Safe to call from a worker thread: only numpy/rawpy are touched here,
+    QImage/QPixmap construction is left to the GUI thread.
+
+    Args:
+        file_path: Path to raw file
+        camera_model: Camera model for crop lookup
+
+    Returns:
+        Dictionary with file_path, raw_data, display_array and stats
+    """
+    import rawpy
+
+    crop = _CAMERA_CROPS.get(camera_model)
+
+    # Load raw data directly without color processing
+    with rawpy.imread(str(file_path)) as raw:
+        # raw_image is only valid while the file is open: copy out just the
+        # camera-specific crop (if any) in one pass, into a contiguous array.
+        # LibRaw has no sub-image unpack, so the full frame is still decoded;
+        # the decode cache and embedded preview hide that cost on repeat views.
+        sensor_view = raw.raw_image if crop is None else raw.raw_image[crop]
+        raw_data = np.empty(sensor_view.shape, dtype=sensor_view.dtype)
+        np.copyto(raw_data, sensor_view)
+
+    # Calculate statistics (single pass over the sensor data)
+    mean_val, std_val, min_val, max_val = image_stats(raw_data)
+    min_val = int(min_val)
+    max_val = int(max_val)
+    ydim, xdim = raw_data.shape
+    bit_depth = raw_data.dtype.itemsize * 8
+
+    # Normalize to 8-bit for display (contiguous buffer, as QImage requires)
+    if raw_data.dtype == np.uint16:
+        # High byte of each sample, x >> 8 == x / 65535 * 255 within 1 LSB
+        display_array = high_byte_to_u8(raw_data)
+    elif raw_data.dtype == np.uint8:
+        display_array = np.ascontiguousarray(raw_data)
+    else:
+        # For other types, normalize to full range
+        display_array = normalize_to_u8(raw_data, min_val, max_val)
+
+    stats = {
+        'bit_depth': bit_depth,
+        'width': xdim,
+        'height': ydim,
+        'mean': mean_val,
+        'std': std_val,
+        'min': min_val,
+        'max': max_val
+    }
+
+    return {
+        'file_path': str(file_path),
+        'raw_data': raw_data,
+        'display_array': display_array,
+        'stats': stats,
+    }
+
+
+# Number of decoded raw files kept in memory for instant re-selection
+_DECODE_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=_DECODE_CACHE_SIZE)
+def _decode_raw_cached(file_path: str, mtime_ns: int,
+                       camera_model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Memoized _decode_raw. The modification time is part of the key so a file
+    that changed on disk is decoded again.
+
+    The returned dictionary and its arrays are shared between callers: copy
+    the dictionary before adding keys and never modify the arrays in place.
+    """
+    decoded = _decode_raw(file_path, camera_model)
+    decoded['raw_data'].setflags(write=False)
+    return decoded
+
+
+# Per-key locks so a row load waits for an in-flight prefetch of the same file
+# instead of decoding it a second time
+_decode_inflight_lock = threading.Lock()
+_decode_inflight: Dict[tuple, threading.Lock] = {}
+
+
+def _decode_raw_shared(file_path: str, mtime_ns: int,
+                       camera_model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    _decode_raw_cached that decodes each file at most once when called
+    concurrently from several pool threads.
+    """
+    key = (file_path, mtime_ns, camera_model)
+    with _decode_inflight_lock:
+        key_lock = _decode_inflight.setdefault(key, threading.Lock())
+    try:
+        with key_lock:
+            return _decode_raw_cached(file_path, mtime_ns, camera_model)
+    finally:
+        with _decode_inflight_lock:
+            _decode_inflight.pop(key, None)
+
+
+@lru_cache(maxsize=512)
+def _file_hash(file_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Memoized database file hash, keyed on path, modification time and size.
+
+    Resolved through the stored file fingerprint, so only files the database
+    has not seen unchanged are hashed in full.
+    """
+    return get_db_manager().lookup_file_hash(Path(file_path))
+
+
+@lru_cache(maxsize=512)
+def _camera_id_for_hash(file_hash: str) -> Optional[int]:
+    """Memoized camera ID lookup (cleared when the data is reloaded)."""
+    return get_db_manager().get_camera_id_by_file_hash(file_hash)
+
+
+def _lookup_file_identity(file_path: str, file_stat) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Get the file hash and camera ID of an image, or (None, None) on failure.
+
+    Args:
+        file_path: Path to image file
+        file_stat: os.stat_result of the file
+
+    Returns:
+        Tuple of (file_hash, camera_id)
+    """
+    try:
+        file_hash = _file_hash(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+        return file_hash, _camera_id_for_hash(file_hash)
+    except Exception as e:
+        print(f"Could not look up camera ID: {e}")
+        return None, None
+
+
+class BackgroundImageLoaderSignals(QObject):
+    """Signals for BackgroundImageLoader (QRunnable is not a QObject)"""
 
     image_loaded = pyqtSignal(object, str)  # image_array, file_path
+    raw_ready = pyqtSignal(object)          # decoded raw payload (dict)
     error_occurred = pyqtSignal(str)        # error_message
 
+
+class BackgroundImageLoader(QRunnable):
+    """Pooled background task for loading images"""
+
     def __init__(self, file_path: str, camera_model: Optional[str] = None,
-                 fast_preview: bool = False):
+                 fast_preview: bool = False, render_mode: str = 'image',
+                 token: int = 0):
         """
         Initialize background loader.
 
@@ -30,24 +189,53 @@ class BackgroundImageLoader(QThread):
             file_path: Path to image file
             camera_model: Camera model for crop
             fast_preview: Use fast preview mode
+            render_mode: 'image' for a processed RGB array (image_loaded),
+                         'raw' for greyscale sensor data + stats (raw_ready)
+            token: Load token echoed back in the raw_ready payload
         """
         super().__init__()
+        self.signals = BackgroundImageLoaderSignals()
         self.file_path = file_path
         self.camera_model = camera_model
         self.fast_preview = fast_preview
+        self.render_mode = render_mode
+        self.token = token
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """
+        Discard this load. A queued load is skipped; a decode already in
+        progress cannot be interrupted, but nothing is emitted once it finishes.
+        """
+        self._cancelled = True
 
     def run(self) -> None:
         """Load image in background"""
+        if self._cancelled:
+            return
+
         try:
+            if self.render_mode == 'raw':
+                file_stat = Path(self.file_path).stat()
+                payload = dict(_decode_raw_shared(self.file_path, file_stat.st_mtime_ns, self.camera_model))
+                payload['file_hash'], payload['camera_id'] = _lookup_file_identity(self.file_path, file_stat)
+                payload['camera_model'] = self.camera_model
+                payload['token'] = self.token
+                if not self._cancelled:
+                    self.signals.raw_ready.emit(payload)
+                return
+
             loader = get_image_loader()
             image_array = loader.load_image(
                 self.file_path,
                 fast_preview=self.fast_preview,
                 camera_model=self.camera_model
             )
-            self.image_loaded.emit(image_array, self.file_path)
+            if not self._cancelled:
+                self.signals.image_loaded.emit(image_array, self.file_path)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            if not self._cancelled:
+                self.signals.error_occurred.emit(str(e))
 
 
 class AppController(QObject):
@@ -71,11 +259,15 @@ class AppController(QObject):
         self.data_model: Optional[DataModel] = None
         self.plot_generator = get_plot_generator()
         self.image_loader = get_image_loader()
+        self.image_model = ImageModel()
 
+        # Reused worker threads for image loading (no thread start per click)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(os.cpu_count() or 1)
         self.background_loader: Optional[BackgroundImageLoader] = None
-
-        # Create image viewer window (reusable, persists across image loads)
-        self.image_window = ImageWindow(main_window)
+        self._prefetch_loaders: list = []  # Neighbouring-row decodes queued on the pool
+        self._pending_status: list = []  # Status messages waiting for the next flush
+        self._load_token = 0  # Incremented per row load; stale results are dropped
 
         # Initialize
         self._initialize_data_model()
@@ -84,7 +276,8 @@ class AppController(QObject):
     def _initialize_data_model(self) -> None:
         """Initialize data model"""
         try:
-            self.data_model = DataModel()
+            # Share the data browser's model rather than querying the database again
+            self.data_model = self.main_window.data_browser.data_model
             self.status_message.emit(
                 f"Loaded {self.data_model.get_total_row_count()} records from database"
             )
@@ -107,15 +300,47 @@ class AppController(QObject):
         data_browser.data_filtered.connect(self._on_data_filtered)
 
         # Connect plot viewer signals
-        self.main_window.plot_viewer.plot_updated.connect(
-            lambda: self.status_message.emit("Plot updated")
-        )
+        self.main_window.plot_viewer.plot_updated.connect(self._on_plot_updated)
 
         # Connect image viewer signals
-        self.main_window.image_viewer.image_loaded.connect(
-            lambda path: self.status_message.emit(f"Image loaded: {Path(path).name}")
-        )
+        self.main_window.image_viewer.image_loaded.connect(self._on_viewer_image_loaded)
 
+    def _post_status(self, message: str) -> None:
+        """
+        Queue a status message. Messages posted during one event-loop iteration
+        (e.g. "Selected ..." and "Loading image..." for one click) are shown as
+        a single status bar update.
+
+        Args:
+            message: Status message
+        """
+        if not self._pending_status:
+            QTimer.singleShot(0, self._flush_status)
+        self._pending_status.append(message)
+
+    def _flush_status(self) -> None:
+        """Emit queued status messages as one message"""
+        if self._pending_status:
+            message = " — ".join(self._pending_status)
+            self._pending_status = []
+            self.status_message.emit(message)
+
+    @pyqtSlot()
+    def _on_plot_updated(self) -> None:
+        """Handle plot update"""
+        self.status_message.emit("Plot updated")
+
+    @pyqtSlot(str)
+    def _on_viewer_image_loaded(self, file_path: str) -> None:
+        """
+        Handle image loaded in the embedded image viewer.
+
+        Args:
+            file_path: Path to loaded image
+        """
+        self._post_status(f"Image loaded: {Path(file_path).name}")
+
+    @pyqtSlot(int)
     def _on_data_row_selected(self, row_index: int) -> None:
         """
         Handle data row selection.
@@ -124,27 +349,26 @@ class AppController(QObject):
             row_index: Selected row index
         """
         try:
-            row_data = self.main_window.data_browser.get_row_data(row_index)
+            data_browser = self.main_window.data_browser
+            row = data_browser.get_row_view(row_index)
 
             # Extract information
-            camera = row_data.get('camera', 'Unknown')
-            iso = row_data.get('iso', 'N/A')
-            exposure_time = row_data.get('exposure_time', 'N/A')
-
-            self.status_message.emit(
+            camera = row.camera if row.camera is not None else 'Unknown'
+            iso = row.iso if row.iso is not None else 'N/A'
+            exposure_time = row.exposure_time if row.exposure_time is not None else 'N/A'
+            source = row.source if row.source is not None else ''
+
+            # Resolve the image file from the row's source column
+            file_path = data_browser.get_file_path_for_row(row_index)
+            if not file_path:
+                self._post_status(f"⚠️ File not found: {camera} | ISO {iso} | File: {source}")
+                return
+
+            self._post_status(
                 f"Selected: {camera} | ISO {iso} | Exp: {exposure_time}s"
             )
-
-            # If file_path is available, load image
-            if 'file_path' in row_data and row_data['file_path']:
-                file_path = row_data['file_path']
-                if Path(file_path).exists():
-                    self._load_image_for_row(file_path, camera)
-                else:
-                    # File not found, try to construct path
-                    self.status_message.emit(
-                        f"Image file not found: {file_path}"
-                    )
+            self._load_image_for_row(file_path, camera)
+            self._prefetch_neighbour_rows(row_index)
 
         except Exception as e:
             self.error_occurred.emit(
@@ -154,86 +378,114 @@ class AppController(QObject):
 
     def _load_image_for_row(self, file_path: str, camera_model: str) -> None:
         """
-        Load image for selected row and open in popup window with raw data.
+        Load image for selected row into the image viewer.
+
+        The raw decode runs on a BackgroundImageLoader, the GUI stays
+        responsive; the result is displayed in _on_raw_ready. An open image
+        window shows the embedded preview until then.
 
         Args:
             file_path: Path to image file
             camera_model: Camera model name
         """
+        self._load_token += 1
+        if self.main_window.image_viewer.is_image_window_open():
+            self._load_preview_fast(file_path)
+        self.load_image_background(file_path, camera_model, render_mode='raw')
+
+    def _prefetch_neighbour_rows(self, row_index: int) -> None:
+        """
+        Decode the rows above and below the selection into the raw cache at low
+        priority, so stepping through the table is served from memory.
+
+        Args:
+            row_index: Currently selected row index
+        """
+        # Prefetches for the previous selection that have not started become no-ops
+        for loader in self._prefetch_loaders:
+            loader.cancel()
+        self._prefetch_loaders = []
+
+        data_browser = self.main_window.data_browser
+        row_count = data_browser.data_model.get_row_count()
+        for neighbour in (row_index + 1, row_index - 1):
+            if not 0 <= neighbour < row_count:
+                continue
+            # Same path resolution and camera key as _on_data_row_selected,
+            # so the row load finds the prefetched decode in the cache
+            file_path = data_browser.get_file_path_for_row(neighbour)
+            if not file_path:
+                continue
+
+            # Result lands in the decode cache; no signals are connected
+            row = data_browser.get_row_view(neighbour)
+            camera = row.camera if row.camera is not None else 'Unknown'
+            loader = BackgroundImageLoader(file_path, camera, render_mode='raw')
+            self._prefetch_loaders.append(loader)
+            self.thread_pool.start(loader, priority=-1)
+
+    def _load_preview_fast(self, file_path: str) -> None:
+        """
+        Show the embedded camera preview while the full raw decode runs.
+
+        Args:
+            file_path: Path to raw file
+        """
         try:
-            from PyQt6.QtGui import QPixmap, QImage
-            import rawpy
-
-            # Load raw data directly without color processing
-            with rawpy.imread(str(file_path)) as raw:
-                # Get raw pixel data (greyscale)
-                raw_data = raw.raw_image.copy()
-
-                # Apply camera-specific crop if available
-                from sensor_camera import Sensor
-                crop = Sensor.CAMERA_CROPS.get(camera_model)
-                if crop is not None:
-                    raw_data = raw_data[crop]
-
-                # Calculate statistics
-                mean_val = float(np.mean(raw_data))
-                std_val = float(np.std(raw_data))
-                ydim, xdim = raw_data.shape
-                bit_depth = raw_data.dtype.itemsize * 8
-                min_val = int(np.min(raw_data))
-                max_val = int(np.max(raw_data))
-
-                # Normalize to 8-bit for display
-                if raw_data.dtype == np.uint16:
-                    display_array = (raw_data.astype(np.float32) / 65535.0 * 255.0).astype(np.uint8)
-                elif raw_data.dtype == np.uint8:
-                    display_array = raw_data
+            # Previews of recently viewed files come from Qt's pixmap cache
+            cache_key = f"preview:{file_path}:{Path(file_path).stat().st_mtime_ns}"
+            pixmap = QPixmapCache.find(cache_key)
+
+            if pixmap is None:
+                preview = self.image_model.load_raw_preview_bytes(file_path)
+                if preview is None:
+                    return
+
+                if isinstance(preview, bytes):
+                    # JPEG decoded by Qt, no PIL or numpy copy
+                    qimage = QImage.fromData(preview, "JPEG")
                 else:
-                    # For other types, normalize to full range
-                    min_val = np.min(raw_data)
-                    max_val = np.max(raw_data)
-                    if max_val > min_val:
-                        display_array = ((raw_data.astype(np.float32) - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                    else:
-                        display_array = np.zeros_like(raw_data, dtype=np.uint8)
-
-                # Convert to QImage (greyscale)
-                bytes_per_line = xdim
-                qimage = QImage(display_array.data, xdim, ydim, bytes_per_line, QImage.Format.Format_Grayscale8)
+                    # Bitmap thumbnail (height, width, 3) RGB
+                    thumb_array = np.ascontiguousarray(preview)
+                    height, width = thumb_array.shape[:2]
+                    qimage = QImage(thumb_array.data, width, height, width * 3,
+                                    QImage.Format.Format_RGB888).copy()
+
+                if qimage.isNull():
+                    return
+
                 pixmap = QPixmap.fromImage(qimage)
+                QPixmapCache.insert(cache_key, pixmap)
+
+            self.main_window.image_viewer.show_preview(pixmap, file_path)
+
+        except Exception as e:
+            # No usable preview - the full decode still follows
+            print(f"No embedded preview for {Path(file_path).name}: {e}")
+
+    @pyqtSlot(object)
+    def _on_raw_ready(self, payload: Dict[str, Any]) -> None:
+        """
+        Display decoded raw data in the image viewer (GUI thread).
 
-                # Prepare statistics dictionary
-                stats = {
-                    'bit_depth': bit_depth,
-                    'width': xdim,
-                    'height': ydim,
-                    'mean': mean_val,
-                    'std': std_val,
-                    'min': min_val,
-                    'max': max_val
-                }
-
-            # Calculate file hash and look up camera ID for histogram settings
-            file_hash = None
-            camera_id = None
-            try:
-                from utils.db_manager import get_db_manager
-                db = get_db_manager()
-                file_hash = db.calculate_file_hash(Path(file_path))
-                camera_id = db.get_camera_id_by_file_hash(file_hash)
-                print(f"Loaded image with camera_id={camera_id}")
-            except Exception as e:
-                print(f"Could not look up camera ID: {e}")
-
-            # Open image window with loaded image and statistics
-            self.image_window.load_image(
-                pixmap, display_array, file_path,
-                stats=stats, raw_data=raw_data,
-                file_hash=file_hash, camera_id=camera_id
+        Args:
+            payload: Dictionary produced by _decode_raw plus file_hash, camera_id,
+                     camera_model and token
+        """
+        # Ignore results for rows the user has already moved away from
+        if payload.get('token') != self._load_token:
+            return
+
+        file_path = payload['file_path']
+
+        try:
+            # File hash and camera ID were looked up on the worker thread;
+            # the viewer reports the load through its image_loaded signal
+            self.main_window.image_viewer.show_raw_data(
+                file_path, payload['display_array'], payload['stats'], payload['raw_data'],
+                file_hash=payload.get('file_hash'), camera_id=payload.get('camera_id'),
+                camera_model=payload.get('camera_model')
             )
-            self.image_window.show()
-            self.image_window.raise_()
-            self.image_window.activateWindow()
 
         except Exception as e:
             self.error_occurred.emit(
@@ -241,6 +493,7 @@ class AppController(QObject):
                 f"Failed to load image:\n{str(e)}"
             )
 
+    @pyqtSlot()
     def _on_data_filtered(self) -> None:
         """Handle data filter change - update status only.
         Plot regeneration is handled by main_window._on_data_filtered()."""
@@ -253,36 +506,42 @@ class AppController(QObject):
 
     def load_image_background(self, file_path: str,
                             camera_model: Optional[str] = None,
-                            fast_preview: bool = False) -> None:
+                            fast_preview: bool = False,
+                            render_mode: str = 'image') -> None:
         """
-        Load image in background thread.
+        Load image on the background thread pool.
 
         Args:
             file_path: Path to image file
             camera_model: Camera model for crop
             fast_preview: Use fast preview mode
+            render_mode: 'image' (processed RGB) or 'raw' (greyscale sensor data)
         """
-        # Stop any existing background loading
-        if self.background_loader and self.background_loader.isRunning():
-            self.background_loader.quit()
-            self.background_loader.wait()
+        # Drop the result of any load still in flight
+        if self.background_loader is not None:
+            self.background_loader.cancel()
 
-        # Create and start new loader
+        # Queue new loader on the pool
         self.background_loader = BackgroundImageLoader(
-            file_path, camera_model, fast_preview
+            file_path, camera_model, fast_preview, render_mode,
+            token=self._load_token
         )
-        self.background_loader.image_loaded.connect(self._on_background_image_loaded)
-        self.background_loader.error_occurred.connect(self._on_background_error)
-        self.background_loader.start()
+        signals = self.background_loader.signals
+        signals.image_loaded.connect(self._on_background_image_loaded)
+        signals.raw_ready.connect(self._on_raw_ready)
+        signals.error_occurred.connect(self._on_background_error)
+        self.thread_pool.start(self.background_loader)
 
-        self.status_message.emit("Loading image...")
+        self._post_status("Loading image...")
 
+    @pyqtSlot(object, str)
     def _on_background_image_loaded(self, image_array, file_path: str) -> None:
         """Handle background image loaded"""
         # Update image viewer with loaded image
         # (This would require modifying ImageViewer to accept numpy array directly)
-        self.status_message.emit(f"Image loaded: {Path(file_path).name}")
+        self._post_status(f"Image loaded: {Path(file_path).name}")
 
+    @pyqtSlot(str)
     def _on_background_error(self, error_message: str) -> None:
         """Handle background loading error"""
         self.error_occurred.emit("Image Loading Error", error_message)
@@ -309,21 +568,28 @@ class AppController(QObject):
     def clear_all_caches(self) -> None:
         """Clear all caches"""
         self.image_loader.clear_cache()
+        _decode_raw_cached.cache_clear()
         self.status_message.emit("All caches cleared")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        return self.image_loader.get_cache_stats()
+        stats = self.image_loader.get_cache_stats()
+        decode_info = _decode_raw_cached.cache_info()
+        stats['decode_cache_size'] = decode_info.currsize
+        stats['decode_cache_max'] = decode_info.maxsize
+        return stats
 
     def reload_data(self) -> None:
         """Reload all data from sources"""
         try:
-            # Reload data model from database
-            self.data_model = DataModel()
+            # Camera assignments may have changed with the new data
+            _camera_id_for_hash.cache_clear()
+
+            # Reload data model from database (shared with the data browser)
             self.main_window.data_browser.reload_data()
+            self.data_model = self.main_window.data_browser.data_model
 
-            # Reload plot generator
-            self.plot_generator.reload_data()
+            # Reload plot generator (refresh_data reloads the shared generator)
             self.main_window.plot_viewer.refresh_data()
 
             self.status_message.emit("Data reloaded successfully")
@@ -336,10 +602,14 @@ class AppController(QObject):
 
     def shutdown(self) -> None:
         """Cleanup before shutdown"""
-        # Stop any background threads
-        if self.background_loader and self.background_loader.isRunning():
-            self.background_loader.quit()
-            self.background_loader.wait()
+        # Stop any background loads
+        if self.background_loader is not None:
+            self.background_loader.cancel()
+        self.thread_pool.clear()
+        self.thread_pool.waitForDone()
+
+        # Stop the shared exiftool process
+        close_exiftool_helper()
 
         # Clear caches to free memory
         self.clear_all_caches()
@@ -10,6 +10,10 @@ from raw DNG/ERF files and aggregate analysis data.
 import sys
 import os
 import stat
+import threading
+import multiprocessing
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 # Version tracking
@@ -59,24 +63,58 @@ def _set_macos_app_name(name: str) -> None:
         pass  # PyObjC not available
 
 
-# Set macOS app name BEFORE any Qt imports
+def _import_pyobjc() -> None:
+    """Load the PyObjC AppKit/Foundation bindings (slow: registers many classes)."""
+    try:
+        import AppKit  # noqa: F401
+        import Foundation  # noqa: F401
+    except ImportError:
+        pass  # PyObjC not available
+
+
+# Load PyObjC on a background thread while Qt is imported on this one; the app
+# name is set from the main thread just before the QApplication is created
+_pyobjc_import_thread = None
 if sys.platform == 'darwin':
-    _set_macos_app_name("Sensor Analysis")
+    _pyobjc_import_thread = threading.Thread(target=_import_pyobjc, name="pyobjc-import", daemon=True)
+    _pyobjc_import_thread.start()
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont
+from PyQt6.QtCore import Qt, QRect, QTimer
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont, QPixmapCache
+
 
-from views.main_window import MainWindow
-from controllers.app_controller import AppController
+def _app_icon_path() -> Path:
+    """Location of the pre-rendered icon written by scripts/create_icns.py."""
+    base_dir = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else Path(__file__).parent
+    return base_dir / 'resources' / 'app_icon.png'
 
 
+@lru_cache(maxsize=1)
 def create_app_icon() -> QIcon:
     """
-    Create application icon programmatically.
+    Create application icon.
+
+    Loads resources/app_icon.png when it exists and only draws the icon
+    when it has not been generated yet. The icon is built once per process;
+    call only after the QApplication exists (QPixmap requires it).
+
+    Returns:
+        QIcon for the application
+    """
+    icon_path = _app_icon_path()
+    if icon_path.exists():
+        return QIcon(str(icon_path))
+
+    return _render_app_icon()
+
+
+def _render_app_icon() -> QIcon:
+    """
+    Draw the application icon programmatically.
 
     Returns:
         QIcon for the application
@@ -98,13 +136,12 @@ def create_app_icon() -> QIcon:
     painter.setPen(QPen(QColor(40, 80, 140), 10))
     painter.drawEllipse(20, 20, 472, 472)
 
-    # Draw camera sensor grid (simplified representation)
+    # Draw camera sensor grid (simplified representation, one call)
     painter.setPen(QPen(QColor(255, 255, 255, 180), 3))
-    for i in range(3):
-        for j in range(3):
-            x = 140 + i * 90
-            y = 140 + j * 90
-            painter.drawRect(x, y, 70, 70)
+    painter.drawRects([
+        QRect(140 + i * 90, 140 + j * 90, 70, 70)
+        for i in range(3) for j in range(3)
+    ])
 
     # Draw "S" letter
     font = QFont("Arial", 280, QFont.Weight.Bold)
@@ -129,6 +166,12 @@ def setup_application() -> QApplication:
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
 
+    # Set macOS app name BEFORE creating QApplication instance (Qt takes over
+    # the NSApplication delegate)
+    if _pyobjc_import_thread is not None:
+        _pyobjc_import_thread.join()
+        _set_macos_app_name("Sensor Analysis")
+
     # Set application name BEFORE creating QApplication instance
     QApplication.setApplicationName("Sensor Analysis")
 
@@ -139,6 +182,11 @@ def setup_application() -> QApplication:
     app.setOrganizationName("Sensor Analysis")
     app.setApplicationVersion(VERSION)
 
+    # Only the controller's embedded raw previews use the pixmap cache. Qt's
+    # 10 MB default cannot hold one full-size preview (~24 MP at 4 bytes per
+    # pixel), so allow room for two or three recently viewed files (limit in KB)
+    QPixmapCache.setCacheLimit(256 * 1024)
+
     # Set application icon
     app_icon = create_app_icon()
     app.setWindowIcon(app_icon)
@@ -160,10 +208,8 @@ def check_dependencies() -> bool:
     # Note: Analysis data is now stored in SQLite database
     # Database will be created in working directory under db/analysis.db
 
-    # Check for sensor_camera module
-    try:
-        import sensor_camera
-    except ImportError:
+    # Check for sensor_camera module (find_spec locates it without executing it)
+    if importlib.util.find_spec('sensor_camera') is None:
         print("ERROR: sensor_camera.py module not found")
         print("Please ensure sensor_camera.py is in the current directory")
         return False
@@ -182,8 +228,10 @@ def check_dependencies() -> bool:
     missing_packages = []
     for package, pip_name in required_packages:
         try:
-            __import__(package)
+            found = importlib.util.find_spec(package) is not None
         except ImportError:
+            found = False  # Parent package missing
+        if not found:
             missing_packages.append(pip_name)
 
     if missing_packages:
@@ -197,6 +245,20 @@ def check_dependencies() -> bool:
     return True
 
 
+def _warm_imports() -> None:
+    """
+    Import ExifTool on a background thread, so the first metadata read
+    does not pay for the import.
+    """
+    def _import_exiftool():
+        try:
+            import exiftool  # noqa: F401
+        except ImportError:
+            pass
+
+    threading.Thread(target=_import_exiftool, name="warm-imports", daemon=True).start()
+
+
 def backup_database(config) -> bool:
     """
     Create a timestamped backup of the database file.
@@ -272,17 +334,34 @@ def main():
     # Create application
     app = setup_application()
 
+    # Import the UI only after the dependency check: it pulls in pandas, plotly,
+    # rawpy and QtWebEngine, which would otherwise fail before the check can report
+    from views.main_window import MainWindow
+    from controllers.app_controller import AppController
+
     # Create main window
     logger.info("Creating main window")
     main_window = MainWindow(version=VERSION)
 
-    # Create controller and connect to main window
-    logger.info("Creating application controller")
-    controller = AppController(main_window)
-
-    # Show main window
+    # Show main window before the controller exists: the controller loads the
+    # plot data, which would delay the first paint
     logger.info("Showing main window")
     main_window.show()
+    main_window.show_message("Loading data...", 0)
+    app.processEvents()  # Paint the window now
+
+    controllers = []  # Filled once the deferred controller has been created
+
+    def create_controller():
+        logger.info("Creating application controller")
+        controllers.append(AppController(main_window))
+        main_window.show_message("Ready")
+
+    # Create controller on the first event-loop iteration
+    QTimer.singleShot(0, create_controller)
+
+    # Warm up the ExifTool import while the UI is idle
+    _warm_imports()
 
     print("✓ Application started successfully")
     logger.info("Application started successfully")
@@ -302,7 +381,8 @@ def main():
     # Cleanup
     print("\nShutting down...")
     logger.info("Application shutting down")
-    controller.shutdown()
+    for controller in controllers:
+        controller.shutdown()
     logger.info("Application closed successfully")
     print("✓ Application closed")
 
@@ -310,4 +390,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Worker processes (e.g. Sensor.scan) re-launch the frozen executable
+    multiprocessing.freeze_support()
     main()
@@ -3,18 +3,60 @@ Data model for managing aggregate camera analysis data.
 Handles loading data from database and provides filtering capabilities.
 """
 
+import numpy as np
 import pandas as pd
-from typing import List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 from pathlib import Path
 
+# Columns whose distinct values are cached for the filter widgets
+_UNIQUE_COLUMNS = ('camera', 'iso', 'exposure_time', 'bits_per_sample', 'megapixels')
+
+
+def sorted_unique(series: pd.Series) -> list:
+    """
+    Get the sorted distinct non-null values of a column.
+
+    Args:
+        series: Column to scan
+
+    Returns:
+        Sorted list of Python values
+    """
+    values = series.dropna().unique()
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+        values.sort()  # C sort on the numeric array
+        return values.tolist()
+    return sorted(values.tolist())
+
+
+class RowView(NamedTuple):
+    """Fields used when a row is selected (None if the column is absent)"""
+    camera: Any = None
+    iso: Any = None
+    exposure_time: Any = None
+    source: Optional[str] = None
+    file_path: Optional[str] = None
+
 
 class DataModel:
-    """Model for camera sensor analysis data from database"""
+    """
+    Model for camera sensor analysis data from database.
+
+    full_data and filtered_data are treated as read-only: filters build new
+    frames (or share full_data) and never modify them in place. Callers that
+    need to change the data should use get_data_copy().
+    """
 
     def __init__(self):
         """Initialize the data model."""
         self.full_data: Optional[pd.DataFrame] = None
         self.filtered_data: Optional[pd.DataFrame] = None
+        self._uniques: Dict[str, list] = {}
+        # numpy copies of the filter columns (see _cache_columns)
+        self._exposure_np: Optional[np.ndarray] = None
+        self._iso_np: Optional[np.ndarray] = None
+        self._camera_codes: Optional[np.ndarray] = None
+        self._camera_code_map: Dict[str, int] = {}
         self._load_data()
 
     def _load_data(self) -> None:
@@ -22,9 +64,10 @@ class DataModel:
         from utils.db_manager import get_db_manager
 
         db = get_db_manager()
-        data_list = db.get_all_analysis_data(include_archived=False)
+        # The 'time' alias (backward compatibility) comes from the query itself
+        data = db.get_all_analysis_dataframe(include_archived=False, time_alias=True)
 
-        if not data_list:
+        if data.empty:
             # Create empty DataFrame with expected columns
             self.full_data = pd.DataFrame(columns=[
                 'camera', 'iso', 'exposure_time', 'ev',
@@ -33,10 +76,14 @@ class DataModel:
                 'black_level', 'white_level'
             ])
             self.filtered_data = self.full_data.copy()
+            self._cache_columns()
+            self._cache_uniques()
             return
 
-        self.full_data = pd.DataFrame(data_list)
-        self.filtered_data = self.full_data.copy()
+        self.full_data = data
+        self._compact_dtypes(self.full_data)
+        # Filters build new frames and never modify full_data in place
+        self.filtered_data = self.full_data
 
         # Ensure required columns exist
         required_cols = ['camera', 'iso', 'exposure_time']
@@ -44,19 +91,160 @@ class DataModel:
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
 
-        # Add 'time' alias for backward compatibility
-        if 'exposure_time' in self.full_data.columns and 'time' not in self.full_data.columns:
-            self.full_data['time'] = self.full_data['exposure_time']
-            self.filtered_data['time'] = self.filtered_data['exposure_time']
+        self._cache_columns()
+        self._cache_uniques()
+
+    @staticmethod
+    def _compact_dtypes(data: pd.DataFrame) -> None:
+        """
+        Store low-cardinality columns in compact dtypes (in place).
+
+        camera becomes categorical, so isin compares integer codes instead of
+        Python strings; iso and bits_per_sample are downcast to the smallest
+        unsigned integer type that holds them (left as float if any are NULL).
+        """
+        if 'camera' in data.columns:
+            data['camera'] = data['camera'].astype('category')
+        for col in ('iso', 'bits_per_sample'):
+            if col in data.columns:
+                data[col] = pd.to_numeric(data[col], downcast='unsigned')
+
+    def _cache_columns(self) -> None:
+        """
+        Keep numpy arrays of the filter columns, so building a mask compares
+        raw arrays instead of going through pandas Series operators.
+        """
+        data = self.full_data
+        self._exposure_np = data['exposure_time'].to_numpy(dtype=np.float64, na_value=np.nan)
+        self._iso_np = data['iso'].to_numpy()
+
+        camera = data['camera']
+        if isinstance(camera.dtype, pd.CategoricalDtype):
+            # Cameras are matched by integer category code
+            self._camera_codes = camera.cat.codes.to_numpy()
+            self._camera_code_map = {name: code for code, name in enumerate(camera.cat.categories)}
+        else:
+            self._camera_codes = None
+            self._camera_code_map = {}
+
+    def _isin(self, field: str, values: list) -> np.ndarray:
+        """Boolean array of full_data rows whose field is one of values"""
+        if field == 'camera' and self._camera_codes is not None:
+            codes = [self._camera_code_map[name] for name in values if name in self._camera_code_map]
+            return np.isin(self._camera_codes, codes)
+        if field == 'iso' and self._iso_np is not None:
+            return np.isin(self._iso_np, values)
+        return self.full_data[field].isin(values).to_numpy(dtype=bool)
+
+    def _cache_uniques(self) -> None:
+        """Precompute the sorted distinct values used to populate filter widgets"""
+        self._uniques = {
+            col: sorted_unique(self.full_data[col])
+            if col in self.full_data.columns else []
+            for col in _UNIQUE_COLUMNS
+        }
 
 
     def get_data(self) -> pd.DataFrame:
-        """Get the currently filtered data"""
+        """Get the currently filtered data (read-only, not a copy)"""
+        return self.filtered_data if self.filtered_data is not None else pd.DataFrame()
+
+    def get_data_copy(self) -> pd.DataFrame:
+        """Get a copy of the currently filtered data that the caller may modify"""
         return self.filtered_data.copy() if self.filtered_data is not None else pd.DataFrame()
 
     def reset_filters(self) -> None:
         """Reset all filters to show full dataset"""
-        self.filtered_data = self.full_data.copy()
+        # Filters never modify full_data in place, so it can be shared
+        self.filtered_data = self.full_data
+
+    def _select(self, mask: Optional[np.ndarray]) -> None:
+        """
+        Set filtered data to the rows of full_data selected by a boolean mask.
+
+        Args:
+            mask: Boolean array over full_data rows (None selects all rows)
+        """
+        if mask is None:
+            self.filtered_data = self.full_data
+        else:
+            self.filtered_data = self.full_data.loc[mask]
+
+    def _build_mask(self, cameras: Optional[List[str]] = None,
+                    iso_values: Optional[List[int]] = None,
+                    min_time: Optional[float] = None,
+                    max_time: Optional[float] = None,
+                    fields: Optional[Dict[str, list]] = None) -> Optional[np.ndarray]:
+        """
+        Build one boolean mask over full_data for all active filters.
+
+        Args:
+            cameras: Camera models to include
+            iso_values: ISO values to include
+            min_time: Minimum exposure time
+            max_time: Maximum exposure time
+            fields: Other field names mapped to values to include
+
+        Returns:
+            Boolean numpy array, or None if no filter is active
+        """
+        conditions = []
+
+        if cameras:
+            conditions.append(self._isin('camera', cameras))
+
+        if iso_values:
+            conditions.append(self._isin('iso', iso_values))
+
+        # NaN exposure times compare False, so they are excluded by a range
+        if min_time is not None:
+            conditions.append(self._exposure_np >= min_time)
+
+        if max_time is not None:
+            conditions.append(self._exposure_np <= max_time)
+
+        for field, values in (fields or {}).items():
+            if values:  # Only apply if values are selected
+                conditions.append(self._isin(field, values))
+
+        if not conditions:
+            return None
+        return np.logical_and.reduce(conditions)
+
+    def apply_filters(self, cameras: Optional[List[str]] = None,
+                      iso_values: Optional[List[int]] = None,
+                      min_time: Optional[float] = None,
+                      max_time: Optional[float] = None,
+                      fields: Optional[Dict[str, list]] = None) -> None:
+        """
+        Apply all filters in one pass over full_data.
+
+        Filters are combined with AND; empty or None filters are ignored.
+        The filter_by_* methods delegate here.
+
+        Args:
+            cameras: Camera models to include
+            iso_values: ISO values to include
+            min_time: Minimum exposure time
+            max_time: Maximum exposure time
+            fields: Other field names mapped to values to include
+                    e.g. {'bits_per_sample': [12, 14]}
+        """
+        self._select(self._build_mask(cameras, iso_values, min_time, max_time, fields))
+
+    def get_matching_rows(self, fields: Dict[str, list]) -> pd.DataFrame:
+        """
+        Get the rows of full_data matching field filters, without changing
+        the current filter.
+
+        Args:
+            fields: Field names mapped to values to include
+
+        Returns:
+            Matching rows (full_data itself if no filter is active)
+        """
+        mask = self._build_mask(fields=fields)
+        return self.full_data if mask is None else self.full_data.loc[mask]
 
     def filter_by_camera(self, cameras: List[str]) -> None:
         """
@@ -65,13 +253,7 @@ class DataModel:
         Args:
             cameras: List of camera model names to include
         """
-        if not cameras:
-            self.filtered_data = self.full_data.copy()
-            return
-
-        self.filtered_data = self.full_data[
-            self.full_data['camera'].isin(cameras)
-        ].copy()
+        self.apply_filters(cameras=cameras)
 
     def filter_by_iso(self, iso_values: List[int]) -> None:
         """
@@ -80,13 +262,7 @@ class DataModel:
         Args:
             iso_values: List of ISO values to include
         """
-        if not iso_values:
-            self.filtered_data = self.full_data.copy()
-            return
-
-        self.filtered_data = self.full_data[
-            self.full_data['iso'].isin(iso_values)
-        ].copy()
+        self.apply_filters(iso_values=iso_values)
 
     def filter_by_exposure_time(self, min_time: Optional[float] = None,
                                  max_time: Optional[float] = None) -> None:
@@ -97,15 +273,7 @@ class DataModel:
             min_time: Minimum exposure time (seconds)
             max_time: Maximum exposure time (seconds)
         """
-        data = self.full_data.copy()
-
-        if min_time is not None:
-            data = data[data['exposure_time'] >= min_time]
-
-        if max_time is not None:
-            data = data[data['exposure_time'] <= max_time]
-
-        self.filtered_data = data
+        self.apply_filters(min_time=min_time, max_time=max_time)
 
     def filter_combined(self, cameras: Optional[List[str]] = None,
                        iso_values: Optional[List[int]] = None,
@@ -120,21 +288,7 @@ class DataModel:
             min_time: Minimum exposure time
             max_time: Maximum exposure time
         """
-        data = self.full_data.copy()
-
-        if cameras:
-            data = data[data['camera'].isin(cameras)]
-
-        if iso_values:
-            data = data[data['iso'].isin(iso_values)]
-
-        if min_time is not None:
-            data = data[data['exposure_time'] >= min_time]
-
-        if max_time is not None:
-            data = data[data['exposure_time'] <= max_time]
-
-        self.filtered_data = data
+        self.apply_filters(cameras, iso_values, min_time, max_time)
 
     def search(self, query: str, columns: Optional[List[str]] = None) -> None:
         """
@@ -150,46 +304,41 @@ class DataModel:
         data = self.filtered_data if self.filtered_data is not None else self.full_data
 
         if columns is None:
-            # Search in all string/object columns
-            columns = data.select_dtypes(include=['object']).columns.tolist()
-
-        # Create mask for rows matching query in any column
-        mask = pd.Series([False] * len(data), index=data.index)
-        for col in columns:
-            if col in data.columns:
-                mask |= data[col].astype(str).str.contains(query, case=False, na=False)
+            # Search in all string/object/categorical columns
+            columns = data.select_dtypes(include=['object', 'category']).columns.tolist()
+
+        # Match the query literally in each column, then OR the column masks
+        # in a single reduction
+        column_masks = [
+            data[col].astype(str).str.contains(query, case=False, na=False, regex=False).to_numpy()
+            for col in columns if col in data.columns
+        ]
+        if column_masks:
+            mask = np.logical_or.reduce(column_masks)
+        else:
+            mask = np.zeros(len(data), dtype=bool)
 
         self.filtered_data = data[mask].copy()
 
     def get_unique_cameras(self) -> List[str]:
         """Get list of unique camera models in the full dataset"""
-        if self.full_data is None:
-            return []
-        return sorted(self.full_data['camera'].unique().tolist())
+        return list(self._uniques.get('camera', []))
 
     def get_unique_isos(self) -> List[int]:
         """Get list of unique ISO values in the full dataset"""
-        if self.full_data is None:
-            return []
-        return sorted(self.full_data['iso'].unique().tolist())
+        return list(self._uniques.get('iso', []))
 
     def get_unique_exposure_times(self) -> List[float]:
         """Get list of unique exposure times in the full dataset"""
-        if self.full_data is None:
-            return []
-        return sorted([x for x in self.full_data['exposure_time'].unique().tolist() if pd.notna(x)])
+        return list(self._uniques.get('exposure_time', []))
 
     def get_unique_bit_depths(self) -> List[int]:
         """Get list of unique bit depths in the full dataset"""
-        if self.full_data is None:
-            return []
-        return sorted([x for x in self.full_data['bits_per_sample'].unique().tolist() if pd.notna(x)])
+        return list(self._uniques.get('bits_per_sample', []))
 
     def get_unique_megapixels(self) -> List[float]:
         """Get list of unique megapixel values in the full dataset"""
-        if self.full_data is None:
-            return []
-        return sorted([x for x in self.full_data['megapixels'].unique().tolist() if pd.notna(x)])
+        return list(self._uniques.get('megapixels', []))
 
     def get_row_count(self) -> int:
         """Get the number of rows in filtered data"""
@@ -214,6 +363,19 @@ class DataModel:
 
         return self.filtered_data.iloc[index]
 
+    def get_row_view(self, index: int) -> RowView:
+        """
+        Get the selection fields of a row from filtered data.
+
+        Args:
+            index: Row index
+
+        Returns:
+            RowView with camera, iso, exposure_time, source and file_path
+        """
+        row = self.get_row(index)
+        return RowView._make(row.get(field) for field in RowView._fields)
+
     def filter_by_multiple_fields(self, filters: dict) -> None:
         """
         Filter data by multiple fields.
@@ -222,13 +384,7 @@ class DataModel:
             filters: Dictionary mapping field names to list of values to include
                     e.g. {'camera': ['Leica M11'], 'iso': [100, 200]}
         """
-        data = self.full_data.copy()
-
-        for field, values in filters.items():
-            if values:  # Only apply if values are selected
-                data = data[data[field].isin(values)]
-
-        self.filtered_data = data
+        self.apply_filters(fields=filters)
 
     def export_filtered_data(self, output_path: str) -> None:
         """
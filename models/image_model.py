@@ -3,13 +3,72 @@ Image model for loading and processing camera raw files and TIFFs.
 Handles DNG, ERF, and TIFF formats with metadata extraction.
 """
 
-import rawpy
 import numpy as np
-from PIL import Image
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, Optional, Tuple, Any, Union
+
+# rawpy, PIL, ExifTool and the stats kernel (Numba) are imported on first
+# use: constructing an ImageModel (e.g. for get_simple_metadata) should not
+# load them
+
+
+def _decode_raw(file_path: str, fast_preview: bool) -> np.ndarray:
+    """
+    Decode a raw file for display.
+
+    Not cached: the app's raw display goes through the controller's decode
+    cache and ImageLoader, this path only serves direct ImageModel users.
+    """
+    import rawpy
+    from PIL import Image
+
+    with rawpy.imread(file_path) as raw:
+        if fast_preview:
+            try:
+                # Extract embedded JPEG thumbnail
+                thumb = raw.extract_thumb()
+                if thumb.format == rawpy.ThumbFormat.JPEG:
+                    # Callers that only display the preview should use
+                    # load_raw_preview_bytes() and skip this decode
+                    image = Image.open(BytesIO(thumb.data))
+                    image_array = np.array(image)
+                else:
+                    # Fallback to bitmap thumbnail
+                    image_array = thumb.data
+            except Exception:
+                # Fallback to postprocessing if thumbnail extraction fails
+                image_array = raw.postprocess(
+                    use_camera_wb=True,
+                    half_size=True,
+                    no_auto_bright=False
+                )
+        else:
+            # Full quality postprocessing
+            image_array = raw.postprocess(
+                use_camera_wb=True,
+                half_size=False,
+                no_auto_bright=False,
+                output_bps=8  # 8-bit output for display
+            )
+
+    return image_array
+
+
+@lru_cache(maxsize=64)
+def _read_metadata_cached(file_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Read all ExifTool metadata of a file, memoized per (path, mtime).
+
+    Errors propagate (and are not cached). The dictionary is shared between
+    callers; do not modify it.
+    """
+    from utils.exiftool_helper import get_exiftool_helper
 
-from utils.exiftool_helper import get_exiftool_helper
+    with get_exiftool_helper() as et:
+        metadata_list = et.get_metadata([file_path])
+    return metadata_list[0] if metadata_list else {}
 
 
 class ImageModel:
@@ -36,37 +95,42 @@ class ImageModel:
         if not file_path.exists():
             raise FileNotFoundError(f"Raw file not found: {file_path}")
 
-        with rawpy.imread(str(file_path)) as raw:
-            if fast_preview:
-                try:
-                    # Extract embedded JPEG thumbnail
-                    thumb = raw.extract_thumb()
-                    if thumb.format == rawpy.ThumbFormat.JPEG:
-                        image = Image.open(thumb.data)
-                        image_array = np.array(image)
-                    else:
-                        # Fallback to bitmap thumbnail
-                        image_array = thumb.data
-                except Exception:
-                    # Fallback to postprocessing if thumbnail extraction fails
-                    image_array = raw.postprocess(
-                        use_camera_wb=True,
-                        half_size=True,
-                        no_auto_bright=False
-                    )
-            else:
-                # Full quality postprocessing
-                image_array = raw.postprocess(
-                    use_camera_wb=True,
-                    half_size=False,
-                    no_auto_bright=False,
-                    output_bps=8  # 8-bit output for display
-                )
+        image_array = _decode_raw(str(file_path), fast_preview)
 
         self.current_image = image_array
         self.current_file_path = file_path
         return image_array
 
+    def load_raw_preview_bytes(self, file_path: str) -> Union[bytes, np.ndarray, None]:
+        """
+        Get the embedded preview of a raw file without decoding it.
+
+        JPEG bytes can be handed straight to QImage.fromData(data, "JPEG"),
+        which avoids decoding through PIL and copying into a numpy array.
+
+        Args:
+            file_path: Path to raw file
+
+        Returns:
+            Encoded JPEG bytes; for a bitmap thumbnail its (height, width, 3)
+            RGB array; None if the file has no thumbnail
+        """
+        import rawpy
+
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Raw file not found: {file_path}")
+
+        with rawpy.imread(str(file_path)) as raw:
+            try:
+                thumb = raw.extract_thumb()
+            except Exception:
+                return None
+
+        if thumb.format in (rawpy.ThumbFormat.JPEG, rawpy.ThumbFormat.BITMAP):
+            return thumb.data
+        return None
+
     def load_tiff_file(self, file_path: str) -> np.ndarray:
         """
         Load a TIFF file.
@@ -77,6 +141,8 @@ class ImageModel:
         Returns:
             Image array as numpy ndarray
         """
+        from PIL import Image
+
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"TIFF file not found: {file_path}")
@@ -87,7 +153,7 @@ class ImageModel:
         # Convert 16-bit to 8-bit for display
         if image_array.dtype == np.uint16:
             # Normalize to 8-bit
-            image_array = (image_array / 256).astype(np.uint8)
+            image_array = (image_array >> 8).astype(np.uint8)
 
         self.current_image = image_array
         self.current_file_path = file_path
@@ -113,6 +179,7 @@ class ImageModel:
             return self.load_tiff_file(str(file_path))
         elif suffix in ['.jpg', '.jpeg', '.png']:
             # Standard image formats
+            from PIL import Image
             image = Image.open(file_path)
             image_array = np.array(image)
             self.current_image = image_array
@@ -135,13 +202,9 @@ class ImageModel:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        file_stat = file_path.stat()
         try:
-            with get_exiftool_helper() as et:
-                metadata_list = et.get_metadata([str(file_path)])
-                if metadata_list:
-                    raw_metadata = metadata_list[0]
-                else:
-                    raw_metadata = {}
+            raw_metadata = _read_metadata_cached(str(file_path), file_stat.st_mtime_ns)
         except Exception as e:
             print(f"Warning: Could not extract metadata with exiftool: {e}")
             raw_metadata = {}
@@ -155,7 +218,7 @@ class ImageModel:
             'width': raw_metadata.get('EXIF:ImageWidth', None),
             'height': raw_metadata.get('EXIF:ImageHeight', None),
             'bit_depth': raw_metadata.get('EXIF:BitsPerSample', None),
-            'file_size': file_path.stat().st_size,
+            'file_size': file_stat.st_size,
             'file_name': file_path.name,
             'file_path': str(file_path),
             'raw_metadata': raw_metadata  # Keep full metadata for reference
@@ -205,8 +268,8 @@ class ImageModel:
             Normalized 8-bit image array
         """
         if image_array.dtype == np.uint16:
-            # Convert 16-bit to 8-bit
-            return (image_array / 256).astype(np.uint8)
+            # Convert 16-bit to 8-bit (high byte, no float64 intermediate)
+            return (image_array >> 8).astype(np.uint8)
         elif image_array.dtype == np.float32 or image_array.dtype == np.float64:
             # Assume float values are in [0, 1] range
             return (image_array * 255).astype(np.uint8)
@@ -230,13 +293,18 @@ class ImageModel:
         if image_array is None:
             return {}
 
+        from utils.stats_kernel import image_stats
+
+        # One pass over the pixels instead of four separate reductions
+        mean_val, std_val, min_val, max_val = image_stats(image_array)
+
         stats = {
             'shape': image_array.shape,
             'dtype': str(image_array.dtype),
-            'min': float(np.min(image_array)),
-            'max': float(np.max(image_array)),
-            'mean': float(np.mean(image_array)),
-            'std': float(np.std(image_array))
+            'min': min_val,
+            'max': max_val,
+            'mean': mean_val,
+            'std': std_val
         }
 
         return stats
@@ -18,21 +18,41 @@ import numpy as np
 import rawpy
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QPixmap, QImage
 from views.image_window import ImageWindow
 from sensor_camera import Sensor
 from utils.config_manager import get_config
+from utils.stats_kernel import image_stats, high_byte_to_u8, normalize_to_u8
+
+
+# 8-bit display buffer shared by successive load_raw_image calls
+_DISPLAY_SCRATCH = None
+
+
+def _display_scratch(ydim: int, xdim: int) -> np.ndarray:
+    """Return a (ydim, xdim) uint8 view of the scratch buffer, growing it when needed."""
+    global _DISPLAY_SCRATCH
+    need = ydim * xdim
+    if _DISPLAY_SCRATCH is None or _DISPLAY_SCRATCH.size < need:
+        _DISPLAY_SCRATCH = np.empty(need, dtype=np.uint8)
+    return _DISPLAY_SCRATCH[:need].reshape(ydim, xdim)
 
 
 def load_raw_image(file_path: str) -> tuple:
     """
-    Load a raw image file and return pixmap with statistics.
+    Load a raw image file and return display data with statistics.
+
+    No pixmap is built here: ImageWindow.load_image renders raw_data with the
+    current scale mode into its own reusable QImage, so a pixmap made here
+    would be a discarded full-frame copy.
+
+    display_array is written into a buffer that the next call reuses; it is
+    only valid until then (ImageWindow.load_image does not keep it).
 
     Args:
         file_path: Path to raw image file
 
     Returns:
-        tuple: (pixmap, display_array, stats_dict, raw_data, file_hash, camera_id)
+        tuple: (None, display_array, stats_dict, raw_data, file_hash, camera_id)
     """
     print(f"Loading: {file_path}")
 
@@ -53,8 +73,8 @@ def load_raw_image(file_path: str) -> tuple:
 
     # Load raw data directly without color processing
     with rawpy.imread(str(file_path)) as raw:
-        # Get raw pixel data (greyscale)
-        raw_data = raw.raw_image.copy()
+        # Get raw pixel data (greyscale); a view into rawpy's buffer
+        raw_data = raw.raw_image
 
         # Apply camera-specific crop if available
         if camera_model:
@@ -63,36 +83,29 @@ def load_raw_image(file_path: str) -> tuple:
                 print(f"Applying crop for {camera_model}")
                 raw_data = raw_data[crop]
 
-        # Calculate statistics
-        mean_val = float(np.mean(raw_data))
-        std_val = float(np.std(raw_data))
+        # The buffer is freed when the file is closed: copy only the cropped region
+        raw_data = raw_data.copy()
+
+        # Calculate statistics in one pass; min/max are reused for display
+        mean_val, std_val, min_val, max_val = image_stats(raw_data)
         ydim, xdim = raw_data.shape
         bit_depth = raw_data.dtype.itemsize * 8
-        min_val = int(np.min(raw_data))
-        max_val = int(np.max(raw_data))
+        min_val = int(min_val)
+        max_val = int(max_val)
 
         print(f"  Dimensions: {xdim} × {ydim}")
         print(f"  Bit depth: {bit_depth}")
         print(f"  Mean: {mean_val:.2f}, Std: {std_val:.2f}")
         print(f"  Min: {min_val}, Max: {max_val}")
 
-        # Normalize to 8-bit for display
+        # Normalize to 8-bit for display (one fused pass, no float32 copy)
         if raw_data.dtype == np.uint16:
-            display_array = (raw_data.astype(np.float32) / 65535.0 * 255.0).astype(np.uint8)
+            display_array = high_byte_to_u8(raw_data, out=_display_scratch(ydim, xdim))
         elif raw_data.dtype == np.uint8:
             display_array = raw_data
         else:
             # For other types, normalize to full range
-            min_val = np.min(raw_data)
-            if max_val > min_val:
-                display_array = ((raw_data.astype(np.float32) - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-            else:
-                display_array = np.zeros_like(raw_data, dtype=np.uint8)
-
-        # Convert to QImage (greyscale)
-        bytes_per_line = xdim
-        qimage = QImage(display_array.data, xdim, ydim, bytes_per_line, QImage.Format.Format_Grayscale8)
-        pixmap = QPixmap.fromImage(qimage)
+            display_array = normalize_to_u8(raw_data, min_val, max_val, out=_display_scratch(ydim, xdim))
 
         # Prepare statistics dictionary
         stats = {
@@ -111,13 +124,13 @@ def load_raw_image(file_path: str) -> tuple:
     try:
         from utils.db_manager import get_db_manager
         db = get_db_manager()
-        file_hash = db.calculate_file_hash(Path(file_path))
+        file_hash = db.lookup_file_hash(Path(file_path))
         camera_id = db.get_camera_id_by_file_hash(file_hash)
         print(f"  Camera ID: {camera_id}")
     except Exception as e:
         print(f"  Could not look up camera ID: {e}")
 
-    return pixmap, display_array, stats, raw_data, file_hash, camera_id
+    return None, display_array, stats, raw_data, file_hash, camera_id
 
 
 def main():
@@ -30,6 +30,9 @@ if [ -d "venv" ]; then
     source venv/bin/activate
 fi
 
+# Compile app modules to bytecode up front (parallel, only stale files)
+python3 -m compileall -q -j 0 main.py sensor_camera.py controllers models utils views > /dev/null 2>&1
+
 # Run the application
 echo "Starting Camera Sensor Analyzer..."
 echo ""
@@ -5,6 +5,9 @@ Generate macOS .icns icon file from the app's programmatic icon.
 Creates an .iconset directory with all required sizes and converts to .icns
 using macOS iconutil. Output: resources/SensorAnalysis.icns
 
+Also writes resources/app_icon.png, which the app loads at startup instead of
+drawing the icon.
+
 Usage:
     python scripts/create_icns.py
 """
@@ -22,7 +25,7 @@ sys.path.insert(0, str(project_root))
 
 def create_icon_pixmap(size: int):
     """Create the app icon at a specific pixel size."""
-    from PyQt6.QtCore import Qt
+    from PyQt6.QtCore import Qt, QRect
     from PyQt6.QtGui import (
         QPixmap, QPainter, QColor, QFont,
         QRadialGradient, QPen
@@ -47,14 +50,13 @@ def create_icon_pixmap(size: int):
     margin = int(20 * s)
     painter.drawEllipse(margin, margin, size - 2 * margin, size - 2 * margin)
 
-    # Draw camera sensor grid
+    # Draw camera sensor grid (all nine cells in one call)
     painter.setPen(QPen(QColor(255, 255, 255, 180), max(1, int(3 * s))))
-    for i in range(3):
-        for j in range(3):
-            x = int((140 + i * 90) * s)
-            y = int((140 + j * 90) * s)
-            w = int(70 * s)
-            painter.drawRect(x, y, w, w)
+    w = int(70 * s)
+    painter.drawRects([
+        QRect(int((140 + i * 90) * s), int((140 + j * 90) * s), w, w)
+        for i in range(3) for j in range(3)
+    ])
 
     # Draw "S" letter
     font = QFont("Arial", max(1, int(280 * s)), QFont.Weight.Bold)
@@ -66,6 +68,20 @@ def create_icon_pixmap(size: int):
     return pixmap
 
 
+def render_icon_png(size: int, rendered: dict) -> bytes:
+    """Return the icon at a pixel size as PNG bytes, rendering each size once."""
+    if size not in rendered:
+        from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        create_icon_pixmap(size).save(buffer, "PNG")
+        buffer.close()
+        rendered[size] = bytes(data)
+    return rendered[size]
+
+
 def main():
     from PyQt6.QtWidgets import QApplication
 
@@ -77,6 +93,14 @@ def main():
 
     icns_path = output_dir / "SensorAnalysis.icns"
 
+    # PNG bytes per pixel size: several iconset entries share a size
+    rendered = {}
+
+    # Window icon loaded by main.create_app_icon()
+    png_path = output_dir / "app_icon.png"
+    png_path.write_bytes(render_icon_png(512, rendered))
+    print(f"  Created {png_path.name} (512x512)")
+
     # Required icon sizes for macOS .iconset
     # Format: (filename, pixel_size)
     icon_specs = [
@@ -97,9 +121,8 @@ def main():
         iconset_dir.mkdir()
 
         for filename, pixel_size in icon_specs:
-            pixmap = create_icon_pixmap(pixel_size)
             icon_path = iconset_dir / filename
-            pixmap.save(str(icon_path), "PNG")
+            icon_path.write_bytes(render_icon_png(pixel_size, rendered))
             print(f"  Created {filename} ({pixel_size}x{pixel_size})")
 
         # Convert to .icns using iconutil
@@ -1,5 +1,9 @@
 # Standard modules
 import os
+import json
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
 # Common 3rd party
 import numpy as np
@@ -17,6 +21,28 @@ except ImportError:
     def get_exiftool_helper(**kwargs):
         return exiftool.ExifToolHelper(**kwargs)
 
+try:
+    from utils.stats_kernel import image_stats
+except ImportError:
+    # Fallback for standalone use of sensor_camera.py
+    def image_stats(image):
+        return float(np.mean(image)), float(np.std(image)), float(np.min(image)), float(np.max(image))
+
+# Fast CSV writer (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Direct DNG reads without LibRaw (optional)
+try:
+    import tifffile
+    TIFFFILE_AVAILABLE = True
+except ImportError:
+    TIFFFILE_AVAILABLE = False
+
 # GPU acceleration (optional)
 try:
     import cupy as cp
@@ -27,6 +53,33 @@ except ImportError:
     GPU_AVAILABLE = False
     print("GPU acceleration not available (CuPy not installed)")
 
+_gpu_sums_kernel = None
+
+
+def _get_gpu_sums_kernel():
+    """Reduction producing the shifted sum (real) and sum of squares (imag) in one pass."""
+    global _gpu_sums_kernel
+    if _gpu_sums_kernel is None:
+        _gpu_sums_kernel = cp.ReductionKernel(
+            'T x, float64 shift',
+            'complex128 y',
+            'thrust::complex<double>(x - shift, (x - shift) * (x - shift))',
+            'a + b',
+            'y = a',
+            '0',
+            'shifted_sums'
+        )
+    return _gpu_sums_kernel
+
+
+def _process_raw_file_worker(filepath, metadata):
+    """Process one raw file in a worker process (CPU statistics).
+    
+    Module-level so it can be pickled by ProcessPoolExecutor; builds a
+    lightweight Sensor instead of pickling the caller's instance.
+    """
+    return Sensor(use_gpu=False)._process_raw_file(filepath, metadata)
+
 
 class Sensor(object):
     """Analyzes noise characteristics of camera sensors from raw image files."""
@@ -40,6 +93,35 @@ class Sensor(object):
         "LEICA SL2-S": (slice(0, 4000), slice(0, 6000)),
     }
     
+    # Metadata keys tried in order for each extracted field
+    METADATA_KEYS = {
+        'black_level': ('EXIF:BlackLevel', 'MakerNotes:BlackLevel'),
+        'white_level': ('EXIF:WhiteLevel',),
+        'camera': ('EXIF:UniqueCameraModel', 'EXIF:Model'),
+        'width': ('EXIF:ExifImageWidth', 'EXIF:ImageWidth'),
+        'height': ('EXIF:ExifImageHeight', 'EXIF:ImageHeight'),
+    }
+    
+    # Every metadata key read by _process_raw_file
+    PROCESS_METADATA_KEYS = (
+        ('SourceFile', 'EXIF:BitsPerSample', 'EXIF:ISO', 'EXIF:ExposureTime')
+        + tuple(key for keys in METADATA_KEYS.values() for key in keys)
+    )
+    
+    # Compact dtypes of the integer scan result columns (nullable: EXIF fields may be missing)
+    RESULT_DTYPES = {
+        'black_level': 'Int32',
+        'white_level': 'Int32',
+        'width': 'Int32',
+        'height': 'Int32',
+        'iso': 'Int32',
+        'min': 'Int32',
+        'max': 'Int32',
+    }
+    
+    # Trimmed EXIF metadata per file, kept next to noise_results.csv
+    METADATA_CACHE_FILE = '.exif_cache.json'
+    
     def __init__(self, path='.', use_gpu=True):
         """Initialize Sensor with a base path for scanning.
         
@@ -50,6 +132,8 @@ class Sensor(object):
         self.path = path
         self.data = None
         self.use_gpu = use_gpu and GPU_AVAILABLE
+        # Pinned host buffer, device buffer and stream reused across files
+        self._gpu_buffers = None
         
         if use_gpu and not GPU_AVAILABLE:
             print("Warning: GPU requested but not available, falling back to CPU")
@@ -67,169 +151,279 @@ class Sensor(object):
             return self.path
         return os.path.join(self.path, path)
     
-    def _get_file_list(self, directory, suffix):
-        """Get sorted list of raw files with given suffix.
+    def _get_file_entries(self, directory, suffix):
+        """Get directory entries of raw files with given suffix, sorted by name.
         
         Args:
             directory: Directory to scan
             suffix: File extension to filter by
             
         Returns:
-            Sorted list of filenames
+            Sorted list of os.DirEntry objects (their stat() result is cached)
         """
-        return sorted([
-            filename for filename in os.listdir(directory) 
-            if filename.upper().endswith(suffix.upper())
-        ])
+        suffix = suffix.upper()
+        with os.scandir(directory) as entries:
+            return sorted(
+                (entry for entry in entries
+                 if entry.name.upper().endswith(suffix) and entry.is_file()),
+                key=lambda entry: entry.name
+            )
     
-    def _extract_black_level(self, metadata, raw):
-        """Extract black level from metadata or raw file.
+    def _get_file_list(self, directory, suffix):
+        """Get sorted list of raw files with given suffix.
         
         Args:
-            metadata: EXIF metadata dictionary
-            raw: rawpy RawImage object
+            directory: Directory to scan
+            suffix: File extension to filter by
             
         Returns:
-            Black level value as integer
+            Sorted list of filenames
         """
-        black_level = metadata.get('EXIF:BlackLevel')
-        if black_level is None:
-            black_level = metadata.get('MakerNotes:BlackLevel')
-        
-        if isinstance(black_level, str):
-            return int(black_level.split()[0])
-        elif black_level is None:
-            return raw.black_level_per_channel[0]
-        
-        return black_level
+        return [entry.name for entry in self._get_file_entries(directory, suffix)]
     
-    def _extract_white_level(self, metadata):
-        """Extract white level from metadata.
+    def _extract_fields(self, metadata, raw, filepath=None):
+        """Extract black/white level, camera name and dimensions from metadata.
         
         Args:
             metadata: EXIF metadata dictionary
+            raw: rawpy RawImage object (black level fallback), or None to
+                 open filepath only if the metadata has no black level
+            filepath: Path to raw file (used when raw is None)
             
         Returns:
-            White level value as integer
+            Tuple of (black_level, white_level, camera, width, height)
         """
-        white_level = metadata.get('EXIF:WhiteLevel')
+        # First key present in this file, per field
+        values = {}
+        for field, keys in self.METADATA_KEYS.items():
+            for key in keys:
+                value = metadata.get(key)
+                if value is not None:
+                    values[field] = value
+                    break
+        
+        black_level = values.get('black_level')
+        if isinstance(black_level, str):
+            black_level = int(black_level.split()[0])
+        elif black_level is None:
+            if raw is None:
+                with rawpy.imread(filepath) as raw_file:
+                    black_level = raw_file.black_level_per_channel[0]
+            else:
+                black_level = raw.black_level_per_channel[0]
         
+        white_level = values.get('white_level')
         if white_level is None:
             # Assume white level is based on bit depth
             bits = metadata.get('EXIF:BitsPerSample')
             if bits is not None:
                 white_level = 2**bits
+        elif isinstance(white_level, str):
+            white_level = int(white_level.split()[0])
         
-        if isinstance(white_level, str):
-            return int(white_level.split()[0])
-        
-        return white_level
+        return (black_level, white_level, values.get('camera'),
+                values.get('width'), values.get('height'))
     
-    def _extract_camera_name(self, metadata):
-        """Extract camera name from metadata.
+    def _apply_camera_crop(self, image, camera):
+        """Apply camera-specific crop to remove artifacts.
         
         Args:
-            metadata: EXIF metadata dictionary
+            image: numpy array of raw image data
+            camera: Camera name string
             
         Returns:
-            Camera name string
+            Cropped image array
         """
-        camera = metadata.get('EXIF:UniqueCameraModel')
-        if camera is None:
-            camera = metadata.get('EXIF:Model')
-        return camera
+        crop = self.CAMERA_CROPS.get(camera)
+        return image if crop is None else image[crop]
     
-    def _apply_camera_crop(self, image, camera):
-        """Apply camera-specific crop to remove artifacts.
+    def _calculate_image_stats(self, image):
+        """Calculate statistical measures of image data.
+        
+        Uses GPU acceleration if enabled and available.
         
         Args:
             image: numpy array of raw image data
-            camera: Camera name string
             
         Returns:
-            Cropped image array
+            Dictionary with std, mean, min, max values
         """
-        if camera in self.CAMERA_CROPS:
-            crop = self.CAMERA_CROPS[camera]
-            return image[crop[0], crop[1]]
-        return image
+        if self.use_gpu:
+            mean_val, std_val, min_val, max_val = self._calculate_image_stats_gpu(image)
+        else:
+            # CPU computation (one pass over the image for all four values)
+            mean_val, std_val, min_val, max_val = image_stats(image)
+        
+        if image.dtype.kind in 'ui':
+            # Keep integer min/max, as np.min/np.max returned them
+            min_val, max_val = int(min_val), int(max_val)
+        stats = {
+            'std': std_val,
+            'mean': mean_val,
+            'min': min_val,
+            'max': max_val,
+        }
+        
+        return stats
     
-    def _extract_dimensions(self, metadata):
-        """Extract image dimensions from metadata.
+    def _calculate_image_stats_gpu(self, image):
+        """Calculate mean, std, min and max on the GPU with a single sync.
+        
+        The image is staged in pinned host memory and copied asynchronously
+        on a non-blocking stream; the host and device buffers are allocated
+        once per image shape and reused for the following files.
         
         Args:
-            metadata: EXIF metadata dictionary
+            image: numpy array of raw image data (may be a cropped view)
             
         Returns:
-            Tuple of (width, height)
+            Tuple of (mean, std, min, max) as Python floats
         """
-        width = metadata.get('EXIF:ExifImageWidth')
-        if width is None:
-            width = metadata.get('EXIF:ImageWidth')
+        key = (image.shape, image.dtype)
+        if self._gpu_buffers is None or self._gpu_buffers[0] != key:
+            pinned = cp.cuda.alloc_pinned_memory(image.nbytes)
+            host = np.frombuffer(pinned, image.dtype, image.size).reshape(image.shape)
+            device = cp.empty(image.shape, dtype=image.dtype)
+            self._gpu_buffers = (key, host, device, cp.cuda.Stream(non_blocking=True))
+        _, host, device, stream = self._gpu_buffers
+        
+        np.copyto(host, image)
+        # Accumulate around the first pixel to avoid cancellation (as image_stats)
+        shift = float(host.flat[0])
+        
+        with stream:
+            device.set(host, stream=stream)
+            sums = _get_gpu_sums_kernel()(device, shift)
+            packed = cp.stack([
+                sums.real, sums.imag,
+                device.min().astype(cp.float64), device.max().astype(cp.float64),
+            ])
+        # The only synchronization point: copy the four results back
+        total, total_sq, min_val, max_val = packed.get(stream=stream)
+        
+        n = image.size
+        mean_offset = total / n
+        variance = max(total_sq / n - mean_offset * mean_offset, 0.0)
+        return (float(shift + mean_offset), float(np.sqrt(variance)),
+                float(min_val), float(max_val))
+    
+    def _drop_cached_pages(self, filepath):
+        """Tell the kernel a raw file's pages will not be needed again.
         
-        height = metadata.get('EXIF:ExifImageHeight')
-        if height is None:
-            height = metadata.get('EXIF:ImageHeight')
+        Raw files are read once: dropping them from the page cache once the
+        file is analyzed keeps a large scan from evicting more useful cached
+        data. The advice acts on the shared page cache, so it applies to the
+        reads rawpy and tifffile made through their own descriptors. No-op
+        where posix_fadvise is not available (macOS, Windows).
         
-        return width, height
+        Args:
+            filepath: Path to raw file
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
     
-    def _calculate_image_stats(self, image):
-        """Calculate statistical measures of image data.
+    def _load_raw(self, filepath):
+        """Read the sensor data of a raw file.
         
-        Uses GPU acceleration if enabled and available.
+        Plain DNG CFA data is read straight from the file; everything else
+        goes through LibRaw.
         
         Args:
-            image: numpy array of raw image data
+            filepath: Path to raw file
             
         Returns:
-            Dictionary with std, mean, min, max values
+            Tuple of (image, raw): the raw sensor array and the open rawpy
+            object it belongs to (None if rawpy was not needed; close it
+            after use otherwise)
         """
-        if self.use_gpu:
-            # Transfer to GPU, compute, and transfer back
-            gpu_image = cp.asarray(image)
-            stats = {
-                'std': float(cp.std(gpu_image)),
-                'mean': float(cp.mean(gpu_image)),
-                'min': float(cp.min(gpu_image)),
-                'max': float(cp.max(gpu_image)),
-            }
-            # Explicitly free GPU memory
-            del gpu_image
-        else:
-            # CPU computation
-            stats = {
-                'std': np.std(image),
-                'mean': np.mean(image),
-                'min': np.min(image),
-                'max': np.max(image),
-            }
+        image = self._read_dng_cfa(filepath) if TIFFFILE_AVAILABLE else None
+        if image is not None:
+            return image, None
+        raw = rawpy.imread(filepath)
+        return raw.raw_image, raw
+    
+    def _prefetch_raw(self, filepaths, depth=2):
+        """Load raw files ahead of their use on a background thread.
         
-        return stats
+        File reads and LibRaw unpacking overlap with the analysis of the
+        previous file. At most depth loaded files wait in the queue.
+        
+        Args:
+            filepaths: Paths of the files to load, in order
+            depth: Number of files loaded ahead
+            
+        Yields:
+            (image, raw) tuples as returned by _load_raw, in file order
+        """
+        loaded = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+        
+        def producer():
+            for filepath in filepaths:
+                if stop.is_set():
+                    return
+                try:
+                    item = self._load_raw(filepath)
+                except Exception as e:
+                    item = e
+                loaded.put(item)
+        
+        thread = threading.Thread(target=producer, name='raw-prefetch', daemon=True)
+        thread.start()
+        try:
+            for _ in filepaths:
+                item = loaded.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Stopped early (error in the consumer): release files loaded ahead
+            stop.set()
+            while thread.is_alive() or not loaded.empty():
+                try:
+                    item = loaded.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if isinstance(item, tuple) and item[1] is not None:
+                    item[1].close()
     
-    def _process_raw_file(self, filepath, metadata):
+    def _process_raw_file(self, filepath, metadata, loaded=None):
         """Process a single raw file and extract noise characteristics.
         
         Args:
             filepath: Path to raw file
             metadata: EXIF metadata dictionary
+            loaded: Optional (image, raw) from _load_raw, e.g. prefetched
             
         Returns:
             Dictionary with processed data for this file
         """
-        raw = rawpy.imread(filepath)
-        
-        # Extract metadata
-        black_level = self._extract_black_level(metadata, raw)
-        white_level = self._extract_white_level(metadata)
-        camera = self._extract_camera_name(metadata)
-        width, height = self._extract_dimensions(metadata)
-        
-        # Process image
-        image = raw.raw_image
-        image = self._apply_camera_crop(image, camera)
-        stats = self._calculate_image_stats(image)
+        image, raw = loaded if loaded is not None else self._load_raw(filepath)
         
-        raw.close()
+        # LibRaw's buffer is released as soon as the statistics are taken (also
+        # on errors); only scalars leave this block
+        try:
+            # Extract metadata
+            black_level, white_level, camera, width, height = self._extract_fields(metadata, raw, filepath)
+            
+            # Process image
+            image = self._apply_camera_crop(image, camera)
+            stats = self._calculate_image_stats(image)
+        finally:
+            del image
+            if raw is not None:
+                raw.close()
+            self._drop_cached_pages(filepath)
         
         # Build result dictionary
         return {
@@ -244,6 +438,127 @@ class Sensor(object):
             **stats
         }
     
+    def _read_dng_cfa(self, filepath):
+        """Read the CFA data of a DNG file without LibRaw.
+        
+        Only used where the stored values are what LibRaw's raw_image would
+        hold: a full-resolution CFA image without a linearization table.
+        Anything else (other formats, LinearRaw, codecs tifffile cannot
+        decode) returns None so the caller falls back to rawpy.
+        
+        Args:
+            filepath: Path to raw file
+            
+        Returns:
+            2D array of raw sensor values, or None
+        """
+        if not filepath.upper().endswith('.DNG'):
+            return None
+        try:
+            with tifffile.TiffFile(filepath) as tif:
+                first = tif.pages[0]
+                for page in [first] + list(first.pages or []):
+                    subfile_type = page.tags.get('NewSubfileType')
+                    if (page.photometric == 32803  # CFA
+                            and (subfile_type is None or subfile_type.value == 0)
+                            and 50712 not in page.tags  # LinearizationTable
+                            and page.samplesperpixel == 1):
+                        return page.asarray()
+        except Exception:
+            pass
+        return None
+    
+    def _worker_metadata(self, metadata):
+        """Reduce a metadata dictionary to the keys _process_raw_file reads.
+        
+        Args:
+            metadata: EXIF metadata dictionary
+            
+        Returns:
+            Dictionary with only the keys in PROCESS_METADATA_KEYS
+        """
+        return {key: metadata[key] for key in self.PROCESS_METADATA_KEYS if key in metadata}
+    
+    def _load_metadata_cache(self, directory):
+        """Load the EXIF metadata cache of a scan directory.
+        
+        Args:
+            directory: Scanned directory
+            
+        Returns:
+            Dictionary mapping filename to {'size', 'mtime_ns', 'metadata'}
+            (empty if there is no readable cache)
+        """
+        try:
+            with open(os.path.join(directory, self.METADATA_CACHE_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_metadata_cache(self, directory, cache, file_list):
+        """Write the EXIF metadata cache of a scan directory atomically.
+        
+        Args:
+            directory: Scanned directory
+            cache: Dictionary mapping filename to cache entry
+            file_list: Current raw files; entries of other files are dropped
+        """
+        cache_file = os.path.join(directory, self.METADATA_CACHE_FILE)
+        names = set(file_list)
+        try:
+            tmp_file = cache_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump({name: entry for name, entry in cache.items() if name in names}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            # Read-only directory: the scan itself still succeeds
+            print(f'Could not write metadata cache: {e}')
+    
+    def _read_metadata(self, et, filepaths):
+        """Read EXIF metadata for many files with a single exiftool request.
+        
+        Args:
+            et: Running ExifToolHelper
+            filepaths: List of file paths
+            
+        Returns:
+            List of metadata dictionaries in the same order as filepaths
+        """
+        if not filepaths:
+            return []
+        
+        by_source = {
+            os.path.normpath(metadata.get('SourceFile', '')): metadata
+            for metadata in et.get_metadata(filepaths)
+        }
+        
+        # Files missing from the batch result are read on their own
+        return [
+            by_source.get(os.path.normpath(filepath)) or et.get_metadata(filepath)[0]
+            for filepath in filepaths
+        ]
+    
+    def _apply_result_dtypes(self, data):
+        """Store the integer result columns as nullable 32-bit integers.
+        
+        Without a schema pandas keeps these columns as int64 or, as soon as a
+        value is missing, as float64/object. A column whose values are not
+        all integral (e.g. a fractional DNG black level) keeps its dtype.
+        
+        Args:
+            data: DataFrame with scan results
+            
+        Returns:
+            The same DataFrame with RESULT_DTYPES applied where possible
+        """
+        for column, dtype in self.RESULT_DTYPES.items():
+            if column in data.columns:
+                try:
+                    data[column] = data[column].astype(dtype)
+                except (TypeError, ValueError):
+                    pass
+        return data
+    
     def _calculate_exposure_value(self, data):
         """Calculate exposure value (EV) from noise data.
         
@@ -255,10 +570,16 @@ class Sensor(object):
         Returns:
             DataFrame with EV column added
         """
-        data['EV'] = data.apply(
-            lambda x: np.log((x['white_level'] - x['black_level']) / x['std']) / np.log(2),
-            axis='columns'
-        )
+        # Whole columns at once, in float64 so wide integer levels cannot overflow
+        white = data['white_level'].to_numpy(dtype=np.float64, na_value=np.nan)
+        black = data['black_level'].to_numpy(dtype=np.float64, na_value=np.nan)
+        std = data['std'].to_numpy(dtype=np.float64, na_value=np.nan)
+        # In place in one output array: no temporaries for the difference/ratio
+        ev = np.empty_like(white)
+        np.subtract(white, black, out=ev)
+        np.divide(ev, std, out=ev)
+        np.log2(ev, out=ev)
+        data['EV'] = ev
         return data
     
     def _save_results(self, data, directory):
@@ -269,16 +590,33 @@ class Sensor(object):
             directory: Directory to save results in
         """
         output_file = os.path.join(directory, 'noise_results.csv')
-        data.to_csv(output_file, index=False)
+        if PYARROW_AVAILABLE:
+            try:
+                # Columnar writer: much faster than pandas' row formatter
+                pa_csv.write_csv(pa.Table.from_pandas(data, preserve_index=False), output_file)
+            except pa.ArrowException:
+                # Object columns with mixed types cannot be converted
+                data.to_csv(output_file, index=False)
+        else:
+            data.to_csv(output_file, index=False)
         print(f'Results saved to: {output_file}')
     
-    def scan(self, path=None, suffix='DNG', force_rescan=False):
+    def scan(self, path=None, suffix='DNG', force_rescan=False, max_workers=None):
         """Scan a directory for raw files and analyze noise characteristics.
         
+        Results are cached in noise_results.csv together with each file's size
+        and modification time; only new or changed files are processed again.
+        EXIF metadata is cached the same way in .exif_cache.json, and files
+        without cached metadata are read in one exiftool request. Files
+        are decoded in parallel worker processes on the CPU path; with GPU
+        acceleration they are processed one at a time in this process.
+        
         Args:
             path: Relative path from base directory (None to use base path)
             suffix: File extension to scan for (default: 'DNG')
             force_rescan: If True, rescan even if results exist (default: False)
+            max_workers: Worker processes for decoding (default: CPU count,
+                         1 processes files in this process)
             
         Returns:
             DataFrame with noise analysis results for all scanned files
@@ -286,35 +624,119 @@ class Sensor(object):
         full_path = self._get_scan_path(path)
         results_file = os.path.join(full_path, 'noise_results.csv')
         
+        file_entries = self._get_file_entries(full_path, suffix)
+        file_list = [entry.name for entry in file_entries]
+        filepaths = [entry.path for entry in file_entries]
+        
         # Check if results already exist
+        cached = None
         if not force_rescan and os.path.exists(results_file):
-            print(f'Loading existing results from: {results_file}')
-            data = pd.read_csv(results_file)
-            self.data = data
-            return data
-        
-        file_list = self._get_file_list(full_path, suffix)
-        
-        results = []
-        
-        with get_exiftool_helper() as et:
-            # Create progress bar
-            with tqdm(total=len(file_list), desc='Scanning files', unit='file') as pbar:
-                for filename in file_list:
-                    # Update progress bar with current filename
-                    pbar.set_postfix_str(f'Processing: {filename}')
+            cached = pd.read_csv(results_file)
+            if not file_list or not {'file_size', 'file_mtime_ns'}.issubset(cached.columns):
+                # Results without per-file stamps, or without the raw files
+                # next to them, cannot be checked and are used as they are
+                print(f'Loading existing results from: {results_file}')
+                self.data = cached
+                return cached
+        
+        # Reuse cached rows of files whose size and modification time match
+        cached_rows = {}
+        if cached is not None:
+            for row in cached.to_dict('records'):
+                cached_rows[os.path.basename(str(row['source']))] = row
+        
+        results = [None] * len(file_list)
+        file_stats = {}
+        pending = []
+        for index, filename in enumerate(file_list):
+            st = file_entries[index].stat()
+            file_stats[index] = st
+            row = cached_rows.get(filename)
+            if (row is not None and row['file_size'] == st.st_size
+                    and row['file_mtime_ns'] == st.st_mtime_ns):
+                results[index] = row
+            else:
+                pending.append(index)
+        
+        if cached is not None:
+            if not pending and len(cached) == len(file_list):
+                print(f'Loading existing results from: {results_file}')
+                self.data = cached
+                return cached
+            print(f'Reusing {len(file_list) - len(pending)} cached results, '
+                  f'processing {len(pending)} new or changed files')
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        # CuPy state cannot be shared with worker processes
+        parallel = not self.use_gpu and max_workers > 1 and len(pending) > 1
+        
+        # Metadata of unchanged files comes from the on-disk cache (e.g. on force_rescan)
+        metadata_cache = self._load_metadata_cache(full_path)
+        metadata_by_index = {}
+        misses = []
+        for index in pending:
+            st = file_stats[index]
+            entry = metadata_cache.get(file_list[index])
+            if (entry is not None and entry.get('size') == st.st_size
+                    and entry.get('mtime_ns') == st.st_mtime_ns):
+                metadata_by_index[index] = dict(entry['metadata'], SourceFile=filepaths[index])
+            else:
+                misses.append(index)
+        
+        if misses:
+            with get_exiftool_helper() as et:
+                # One exiftool request for all files without cached metadata
+                metadata_list = self._read_metadata(et, [filepaths[index] for index in misses])
+            for index, metadata in zip(misses, metadata_list):
+                metadata = self._worker_metadata(metadata)
+                metadata_by_index[index] = metadata
+                st = file_stats[index]
+                metadata_cache[file_list[index]] = {
+                    'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'metadata': metadata
+                }
+            self._save_metadata_cache(full_path, metadata_cache, file_list)
+        
+        def store(index, file_data):
+            # Stamp the result so the next scan can tell whether the file changed
+            st = file_stats[index]
+            file_data['file_size'] = st.st_size
+            file_data['file_mtime_ns'] = st.st_mtime_ns
+            results[index] = file_data
+        
+        # Create progress bar
+        with tqdm(total=len(pending), desc='Scanning files', unit='file') as pbar:
+            if parallel:
+                # Decode files in worker processes; tasks are sent in chunks with
+                # the trimmed metadata (only the fields the workers read)
+                chunksize = max(1, len(pending) // (max_workers * 4))
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    file_results = executor.map(
+                        _process_raw_file_worker,
+                        [filepaths[index] for index in pending],
+                        [metadata_by_index[index] for index in pending],
+                        chunksize=chunksize
+                    )
                     
-                    filepath = os.path.join(full_path, filename)
-                    metadata = et.get_metadata(filepath)[0]
+                    # Results arrive in file order
+                    for index, file_data in zip(pending, file_results):
+                        pbar.set_postfix_str(f'Processed: {file_list[index]}')
+                        store(index, file_data)
+                        pbar.update(1)
+            else:
+                # The next files are read on a background thread while this one is analyzed
+                loaded_files = self._prefetch_raw([filepaths[index] for index in pending])
+                for index, loaded in zip(pending, loaded_files):
+                    # Update progress bar with current filename
+                    pbar.set_postfix_str(f'Processing: {file_list[index]}')
                     
-                    file_data = self._process_raw_file(filepath, metadata)
-                    results.append(file_data)
+                    store(index, self._process_raw_file(filepaths[index], metadata_by_index[index], loaded))
                     
                     # Update progress bar
                     pbar.update(1)
         
         # Create DataFrame and calculate derived metrics
-        data = pd.DataFrame(results)
+        data = self._apply_result_dtypes(pd.DataFrame(results))
         data = self._calculate_exposure_value(data)
         
         # Store and save results
@@ -390,19 +812,17 @@ class Analysis(object):
         if camera_list is None:
             camera_list = list(self.scan_results.keys())
         
-        # Concatenate selected camera data, preserving the scan_specs key as camera name
-        data_frames = []
-        for name in camera_list:
-            if name in self.scan_results:
-                df = self.scan_results[name].copy()
-                # Override the EXIF camera name with the scan_specs key to preserve variant info
-                df['camera'] = name
-                data_frames.append(df)
-        
-        if not data_frames:
+        # Concatenate selected camera data once (no per-camera copies)
+        names = [name for name in camera_list if name in self.scan_results]
+        if not names:
             raise ValueError("No valid cameras found in scan results")
+        data_frames = [self.scan_results[name] for name in names]
+        
+        aggregate = pd.concat(data_frames, ignore_index=True)
+        # Override the EXIF camera name with the scan_specs key to preserve variant info
+        aggregate['camera'] = np.repeat(names, [len(df) for df in data_frames])
         
-        self.aggregate_data = pd.concat(data_frames, ignore_index=True)
+        self.aggregate_data = aggregate
         return self.aggregate_data
     
     def save_aggregate(self, filename='aggregate_analysis.csv'):
@@ -490,8 +910,8 @@ class Analysis(object):
     
     def _create_ev_vs_iso_plot(self, data, exposure_time, title, height, ev_range):
         """Internal method to create a single EV vs ISO plot."""
-        # Filter data by exposure time
-        filtered_data = data[data['time'] == exposure_time]
+        # Filter data by exposure time (compare the raw column, select positionally)
+        filtered_data = data.iloc[data['time'].to_numpy() == exposure_time]
         
         # Generate title if not provided
         if title is None:
@@ -661,8 +1081,8 @@ class Analysis(object):
     
     def _create_ev_vs_time_plot(self, data, iso, title, height, ev_range):
         """Internal method to create a single EV vs Time plot."""
-        # Filter data by ISO
-        filtered_data = data[data['iso'] == iso]
+        # Filter data by ISO (compare the raw column, select positionally)
+        filtered_data = data.iloc[data['iso'].to_numpy() == iso]
         if len(filtered_data) == 0:
             raise ValueError(f"No data found for ISO {iso}")
         
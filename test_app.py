@@ -40,6 +40,47 @@ except Exception as e:
 
 print()
 
+# Test 1b: Grouping by the categorical camera column
+print("1b. Testing Camera Grouping...")
+try:
+    import warnings
+    import pandas as pd
+    from models.data_model import DataModel
+    from views.plot_viewer import PlotViewer
+
+    frame = pd.DataFrame({
+        'camera': ['Cam B', 'Cam A', 'Cam C', 'Cam A', 'Cam B'],
+        'iso': [100, 100, 200, 400, 800],
+        'exposure_time': [0.01, 0.02, 0.01, 0.5, 2.0],
+        'ev': [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+    DataModel._compact_dtypes(frame)
+    assert isinstance(frame['camera'].dtype, pd.CategoricalDtype), "camera is not categorical"
+
+    # Cam C is filtered out but stays a category of the column
+    filtered = frame[frame['camera'] != 'Cam C']
+
+    with warnings.catch_warnings():
+        # Grouping a categorical without observed= warns under pandas 2.x
+        warnings.simplefilter('error', FutureWarning)
+        groups = [camera for camera, _ in filtered.groupby('camera', observed=True)]
+        assert groups == ['Cam A', 'Cam B'], f"unexpected camera groups {groups}"
+
+        # The plot viewer draws one trace per camera left in the data
+        # (the plot builders do not use the viewer instance)
+        for build_plot in (PlotViewer._generate_ev_vs_iso_plot, PlotViewer._generate_ev_vs_time_plot):
+            fig = build_plot(None, filtered)
+            names = [trace.name for trace in fig.data]
+            assert names == ['Cam A', 'Cam B'], f"{build_plot.__name__} traces {names}"
+
+    print(f"   ✓ Filtered-out cameras form no groups or traces (pandas {pd.__version__})")
+
+except Exception as e:
+    print(f"   ✗ FAILED: {e}")
+    sys.exit(1)
+
+print()
+
 # Test 2: Image Model
 print("2. Testing Image Model...")
 try:
@@ -70,6 +111,105 @@ except Exception as e:
 
 print()
 
+# Test 3b: Stats Kernel
+print("3b. Testing Stats Kernel...")
+try:
+    import numpy as np
+    from utils.stats_kernel import image_stats, NUMBA_AVAILABLE
+
+    test_data = np.random.default_rng(0).integers(500, 4000, size=(301, 257), dtype=np.uint16)
+    view = test_data[10:-10, 3:-3]
+    mean_val, std_val, min_val, max_val = image_stats(view)
+    assert np.isclose(mean_val, np.mean(view)) and np.isclose(std_val, np.std(view))
+    assert min_val == np.min(view) and max_val == np.max(view)
+    print(f"   ✓ image_stats matches numpy reductions (numba: {NUMBA_AVAILABLE})")
+
+except Exception as e:
+    print(f"   ✗ FAILED: {e}")
+    sys.exit(1)
+
+print()
+
+# Test 3c: Database Manager (temporary database)
+print("3c. Testing Database Manager...")
+try:
+    import os
+    import shutil
+    import sqlite3
+    import tempfile
+    from utils.db_manager import DatabaseManager
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        # Database created before the file_fingerprint column existed
+        db_path = temp_dir / 'test.db'
+        with sqlite3.connect(str(db_path)) as conn:
+            conn.execute(
+                "CREATE TABLE images (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "file_path TEXT UNIQUE NOT NULL, filename TEXT NOT NULL, file_type TEXT, "
+                "file_hash TEXT UNIQUE, file_size INTEGER, file_modified TIMESTAMP, "
+                "xdim INTEGER NOT NULL, ydim INTEGER NOT NULL, camera_id INTEGER, "
+                "last_analyzed TIMESTAMP, archived BOOLEAN DEFAULT 0)"
+            )
+        db = DatabaseManager(db_path)
+        with db.get_connection() as conn:
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(images)")}
+        assert 'file_fingerprint' in columns
+        print(f"   ✓ Schema migration added file_fingerprint")
+
+        # Two distinct files and a copy of the first
+        first = temp_dir / 'a.dng'
+        first.write_bytes(os.urandom(200_000))
+        copy = temp_dir / 'b.dng'
+        shutil.copyfile(first, copy)
+        other = temp_dir / 'c.dng'
+        other.write_bytes(os.urandom(100_000))
+
+        records = [
+            {
+                'image': dict(file_path=file_path, xdim=10, ydim=10,
+                              camera_make='Test', camera_model='Cam'),
+                'analysis': dict(ev=10.0, noise_std=2.0, noise_mean=100.0),
+                'exif': dict(exif_dict={'EXIF:ISO': 100}, iso=100, exposure_time=0.01),
+            }
+            for file_path in (first, copy, other)
+        ]
+        image_ids = db.insert_images_bulk(records)
+        assert image_ids[0] is not None and image_ids[1] is None and image_ids[2] is not None
+        with db.get_connection() as conn:
+            for table in ('images', 'analysis_results', 'exif_data'):
+                count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                assert count == 2, f"{table} has {count} rows"
+        print(f"   ✓ insert_images_bulk rolled back the duplicate only ({image_ids})")
+
+        assert db.get_file_sizes() == {200_000, 100_000}
+        print(f"   ✓ get_file_sizes returns stored sizes")
+
+        # Fingerprint is unknown first (as for images stored before the
+        # migration), then written back and used
+        file_hash = db.calculate_file_hash(other)
+        with db.get_connection() as conn:
+            conn.execute("UPDATE images SET file_fingerprint = NULL")
+        assert db.lookup_file_hash(other) == file_hash
+        with db.get_connection() as conn:
+            fingerprint = conn.execute(
+                "SELECT file_fingerprint FROM images WHERE file_hash = ?", (file_hash,)
+            ).fetchone()['file_fingerprint']
+        assert fingerprint == db.calculate_file_fingerprint(other)
+        assert db.lookup_file_hash(other) == file_hash
+        print(f"   ✓ lookup_file_hash matches calculate_file_hash before and after fingerprinting")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+except Exception as e:
+    print(f"   ✗ FAILED: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
+
+print()
+
 # Test 4: Plot Generator
 print("4. Testing Plot Generator...")
 try:
@@ -147,6 +287,157 @@ except Exception as e:
     print(f"   ✗ FAILED: {e}")
     sys.exit(1)
 
+print()
+
+# Test 6b: Row selection (offscreen, stand-in main window and thread pool)
+print("6b. Testing Row Selection...")
+try:
+    import os
+    import shutil
+    import tempfile
+    import numpy as np
+    from types import SimpleNamespace
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtCore import QObject, pyqtSignal
+    from PyQt6.QtWidgets import QApplication, QWidget
+    import controllers.app_controller as app_controller
+    from models.data_model import RowView
+
+    qt_app = QApplication.instance() or QApplication(sys.argv)
+
+    class _DataBrowser(QObject):
+        row_selected = pyqtSignal(int)
+        data_filtered = pyqtSignal()
+
+        def __init__(self, file_paths):
+            super().__init__()
+            self.file_paths = file_paths
+            self.data_model = SimpleNamespace(get_row_count=lambda: len(file_paths),
+                                              get_total_row_count=lambda: len(file_paths))
+
+        def get_row_view(self, row):
+            # Rows carry the file name in 'source' only, like the database frame
+            return RowView(camera='Test Camera', iso=100, exposure_time=0.01,
+                           source=self.file_paths[row].name)
+
+        def get_file_path_for_row(self, row):
+            return str(self.file_paths[row])
+
+    class _ImageViewer(QObject):
+        image_loaded = pyqtSignal(str)
+
+        def __init__(self):
+            super().__init__()
+            self.shown = []
+            self.previews = []
+            self.window_open = False
+
+        def is_image_window_open(self):
+            return self.window_open
+
+        def show_preview(self, pixmap, file_path):
+            self.previews.append(file_path)
+
+        def show_raw_data(self, file_path, display_array, stats, raw_data, **kwargs):
+            self.shown.append(file_path)
+
+    class _PlotViewer(QObject):
+        plot_updated = pyqtSignal()
+
+    class _MainWindow(QWidget):
+        def __init__(self, file_paths):
+            super().__init__()
+            self.data_browser = _DataBrowser(file_paths)
+            self.image_viewer = _ImageViewer()
+            self.plot_viewer = _PlotViewer()
+
+        def show_message(self, message, timeout=5000):
+            pass
+
+        def show_error(self, title, message):
+            pass
+
+        def show_info(self, title, message):
+            pass
+
+    class _ThreadPool:
+        """Records started loaders instead of running them"""
+        def __init__(self):
+            self.started = []
+
+        def start(self, runnable, priority=0):
+            self.started.append((runnable, priority))
+
+    decoded_files = []
+
+    def _fake_decode(file_path, camera_model=None):
+        decoded_files.append(str(file_path))
+        raw_data = np.zeros((4, 4), dtype=np.uint16)
+        return {'file_path': str(file_path), 'raw_data': raw_data,
+                'display_array': raw_data.astype(np.uint8), 'stats': {}}
+
+    temp_dir = Path(tempfile.mkdtemp())
+    decode_raw = app_controller._decode_raw
+    try:
+        file_paths = []
+        for i in range(3):
+            file_path = temp_dir / f'row{i}.dng'
+            file_path.write_bytes(os.urandom(1000))
+            file_paths.append(file_path)
+
+        main_window = _MainWindow(file_paths)
+        controller = app_controller.AppController(main_window)
+        controller.thread_pool = _ThreadPool()
+
+        main_window.data_browser.row_selected.emit(1)
+        loader, priority = controller.thread_pool.started[0]
+        assert loader is controller.background_loader
+        assert loader.file_path == str(file_paths[1]) and loader.render_mode == 'raw'
+        print(f"   ✓ Selecting a row starts a background raw load of its file")
+
+        # The decoded result is handed to the image viewer
+        app_controller._decode_raw = _fake_decode
+        app_controller._decode_raw_cached.cache_clear()
+        loader.run()
+        assert main_window.image_viewer.shown == [str(file_paths[1])]
+        print(f"   ✓ Decoded raw data is shown in the image viewer")
+
+        # Neighbouring rows are prefetched at low priority ...
+        prefetched = {runnable.file_path: runnable
+                      for runnable, priority in controller.thread_pool.started[1:]
+                      if priority < 0 and runnable.render_mode == 'raw'}
+        assert set(prefetched) == {str(file_paths[0]), str(file_paths[2])}
+        prefetched[str(file_paths[2])].run()
+
+        # ... and selecting the next row is served from the decode cache
+        hits = app_controller._decode_raw_cached.cache_info().hits
+        main_window.data_browser.row_selected.emit(2)
+        controller.background_loader.run()
+        assert decoded_files.count(str(file_paths[2])) == 1
+        assert app_controller._decode_raw_cached.cache_info().hits == hits + 1
+        assert main_window.image_viewer.shown[-1] == str(file_paths[2])
+        print(f"   ✓ Neighbour rows are prefetched and the next row is a decode cache hit")
+
+        # An open image window gets the embedded preview before the decode
+        assert main_window.image_viewer.previews == []
+        main_window.image_viewer.window_open = True
+        controller.image_model.load_raw_preview_bytes = (
+            lambda file_path: np.zeros((8, 12, 3), dtype=np.uint8))
+        main_window.data_browser.row_selected.emit(0)
+        assert main_window.image_viewer.previews == [str(file_paths[0])]
+        print(f"   ✓ Embedded preview is shown in the open image window")
+
+    finally:
+        app_controller._decode_raw = decode_raw
+        app_controller._decode_raw_cached.cache_clear()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+except Exception as e:
+    print(f"   ✗ FAILED: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
+
 print()
 print("=" * 60)
 print("✓ ALL TESTS PASSED!")
@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPixmap, QImage
 from views.image_window import ImageWindow
 from sensor_camera import Sensor
+from utils.stats_kernel import image_stats, normalize_to_u8
 
 
 def load_raw_with_stats(file_path: str, camera_model: str = None) -> tuple:
@@ -25,8 +26,8 @@ def load_raw_with_stats(file_path: str, camera_model: str = None) -> tuple:
 
     # Load raw data directly without color processing
     with rawpy.imread(str(file_path)) as raw:
-        # Get raw pixel data (greyscale)
-        raw_data = raw.raw_image.copy()
+        # Get raw pixel data (greyscale); a view, valid until the file is closed
+        raw_data = raw.raw_image
         print(f"Raw data shape: {raw_data.shape}, dtype: {raw_data.dtype}")
 
         # Apply camera-specific crop if available
@@ -36,12 +37,11 @@ def load_raw_with_stats(file_path: str, camera_model: str = None) -> tuple:
                 print(f"Applying crop for {camera_model}: {crop}")
                 raw_data = raw_data[crop]
 
-        # Calculate statistics
-        mean_val = float(np.mean(raw_data))
-        std_val = float(np.std(raw_data))
+        # Calculate statistics (one pass, no full-frame float64 temporary)
+        mean_val, std_val, min_val, data_max = image_stats(raw_data)
         ydim, xdim = raw_data.shape
         bit_depth = raw_data.dtype.itemsize * 8
-        max_val = np.max(raw_data)
+        max_val = int(data_max)
 
         print(f"Statistics:")
         print(f"  Bit depth: {bit_depth}")
@@ -52,17 +52,15 @@ def load_raw_with_stats(file_path: str, camera_model: str = None) -> tuple:
 
         # Normalize to 8-bit for display
         if raw_data.dtype == np.uint16:
-            display_array = (raw_data.astype(np.float32) / 65535.0 * 255.0).astype(np.uint8)
+            # Keep the high byte: one pass, no float32 copy
+            display_array = np.empty(raw_data.shape, dtype=np.uint8)
+            np.right_shift(raw_data, 8, out=display_array, casting='unsafe')
         elif raw_data.dtype == np.uint8:
-            display_array = raw_data
+            # Returned after the file is closed: needs its own (contiguous) copy
+            display_array = raw_data.copy()
         else:
-            # For other types, normalize to full range
-            min_val = np.min(raw_data)
-            max_val = np.max(raw_data)
-            if max_val > min_val:
-                display_array = ((raw_data.astype(np.float32) - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-            else:
-                display_array = np.zeros_like(raw_data, dtype=np.uint8)
+            # For other types, normalize to the full range found above
+            display_array = normalize_to_u8(raw_data, min_val, data_max)
 
         print(f"Display array shape: {display_array.shape}, dtype: {display_array.dtype}")
 
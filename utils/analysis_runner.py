@@ -3,18 +3,314 @@ Analysis runner for analyzing raw images and storing results in database.
 Uses the existing sensor_camera.Analysis class to scan and analyze images.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
-from collections import OrderedDict
+from collections import OrderedDict, deque
 
 from sensor_camera import Analysis, Sensor
 from utils.exiftool_helper import get_exiftool_helper
 from utils.config_manager import get_config
 from utils.db_manager import get_db_manager
 from utils.app_logger import get_logger
+from utils.stats_kernel import image_stats
 
 logger = get_logger()
 
+# Files per exiftool request when reading EXIF metadata in bulk
+_EXIF_BATCH_SIZE = 200
+
+# Images written per database transaction by the import loops
+_DB_BATCH_SIZE = 500
+
+# Raw file extensions imported from the source directory (lower case)
+_IMAGE_SUFFIXES = ('.dng', '.erf')
+
+# Threads listing the source directory's subdirectories (I/O bound)
+_LIST_WORKERS = 8
+
+
+def _walk_image_files(directory: str) -> List[Path]:
+    """Recursively list the raw image files below a directory."""
+    image_files = []
+    for root, _, filenames in os.walk(directory, followlinks=True):
+        image_files.extend(
+            Path(root, filename) for filename in filenames
+            if filename.lower().endswith(_IMAGE_SUFFIXES)
+        )
+    return image_files
+
+
+def _find_image_files(source_dir: Path) -> List[Path]:
+    """
+    Find all DNG and ERF files below a directory in a single walk.
+
+    Top-level subdirectories (typically one per camera) are listed on
+    separate threads, which hides the latency of network mounts.
+
+    Args:
+        source_dir: Directory to search
+
+    Returns:
+        Sorted list of image file paths
+    """
+    image_files = []
+    subdirs = []
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.path)
+            elif entry.name.lower().endswith(_IMAGE_SUFFIXES) and entry.is_file():
+                image_files.append(Path(entry.path))
+
+    with ThreadPoolExecutor(max_workers=_LIST_WORKERS) as executor:
+        for found in executor.map(_walk_image_files, subdirs):
+            image_files.extend(found)
+
+    return sorted(image_files)
+
+
+def _camera_info(exif_data: Dict) -> tuple:
+    """
+    Get the camera make, model and serial number from EXIF metadata.
+
+    Returns:
+        Tuple of (make, model, serial); make and model default to 'Unknown'
+    """
+    return (exif_data.get('EXIF:Make', 'Unknown'),
+            exif_data.get('EXIF:Model', 'Unknown'),
+            exif_data.get('EXIF:SerialNumber'))
+
+
+def _image_dimensions(exif_data: Dict) -> tuple:
+    """
+    Get the image width and height from EXIF metadata.
+
+    EXIF or File dimensions are used first, SubIFD dimensions if either
+    is missing.
+
+    Returns:
+        Tuple of (xdim, ydim); either may be None
+    """
+    xdim = exif_data.get('EXIF:ImageWidth') or exif_data.get('File:ImageWidth')
+    ydim = exif_data.get('EXIF:ImageHeight') or exif_data.get('File:ImageHeight')
+
+    if not xdim or not ydim:
+        # Try SubIFD dimensions
+        xdim = exif_data.get('SubIFD:ImageWidth')
+        ydim = exif_data.get('SubIFD:ImageHeight')
+    return xdim, ydim
+
+
+def _read_exif_batch(file_paths: List[Path]) -> List:
+    """
+    Read EXIF metadata for several files with one exiftool request.
+
+    Args:
+        file_paths: Paths of the image files
+
+    Returns:
+        One entry per file, in input order: the metadata dictionary, or the
+        exception raised while reading that file
+    """
+    names = [str(file_path) for file_path in file_paths]
+    with get_exiftool_helper() as et:
+        try:
+            by_source = {
+                os.path.normpath(exif_data.get('SourceFile', '')): exif_data
+                for exif_data in et.get_metadata(names)
+            }
+        except Exception:
+            # One unreadable file fails the whole request: read them one by one
+            by_source = {}
+
+        results = []
+        for name in names:
+            exif_data = by_source.get(os.path.normpath(name))
+            if exif_data is None:
+                try:
+                    exif_list = et.get_metadata([name])
+                    exif_data = exif_list[0] if exif_list else {}
+                except Exception as e:
+                    exif_data = e
+            results.append(exif_data)
+    return results
+
+
+def _insert_records(db, records: List[Dict], progress_callback=None) -> int:
+    """
+    Write queued image records with DatabaseManager.insert_images_bulk.
+
+    Args:
+        db: DatabaseManager
+        records: insert_images_bulk records; cleared once written
+        progress_callback: Optional callback for progress updates
+
+    Returns:
+        Number of records that were inserted
+    """
+    if not records:
+        return 0
+    try:
+        image_ids = db.insert_images_bulk(records)
+    except Exception as e:
+        logger.error(f"Error writing {len(records)} images to database: {e}", exc_info=True)
+        image_ids = [None] * len(records)
+
+    for record, image_id in zip(records, image_ids):
+        if image_id is None and progress_callback:
+            progress_callback(f"⚠ Error saving {record['image']['file_path'].name} to database")
+    records.clear()
+    return sum(image_id is not None for image_id in image_ids)
+
+
+def _find_stored_image(db, file_path: Path, stored_sizes: set) -> Optional[Dict]:
+    """
+    Find the stored image with the same content as a file.
+
+    Files whose size matches no stored image are new without being hashed.
+    Otherwise the hash is looked up by fingerprint first, so known files are
+    not read in full either.
+
+    Args:
+        db: DatabaseManager
+        file_path: Path to the image file
+        stored_sizes: Result of db.get_file_sizes()
+
+    Returns:
+        Image record, or None if the file is not in the database
+    """
+    if file_path.stat().st_size not in stored_sizes:
+        return None
+    return db.get_image_by_hash(db.lookup_file_hash(file_path))
+
+
+def _find_repeated_files(db, file_paths: List[Path]) -> set:
+    """
+    Find files that are copies of an earlier file in the list.
+
+    Only files that share their size with another file in the list are
+    hashed; the first file with each hash is kept.
+
+    Args:
+        db: DatabaseManager
+        file_paths: Paths of the new image files, in processing order
+
+    Returns:
+        Set of paths whose content repeats an earlier file
+    """
+    by_size = {}
+    for file_path in file_paths:
+        try:
+            by_size.setdefault(file_path.stat().st_size, []).append(file_path)
+        except OSError:
+            # Reported when the file is processed
+            continue
+
+    seen_hashes = set()
+    repeated = set()
+    for same_size in by_size.values():
+        if len(same_size) < 2:
+            continue
+        for file_path in same_size:
+            try:
+                file_hash = db.calculate_file_hash(file_path)
+            except OSError:
+                continue
+            if file_hash in seen_hashes:
+                repeated.add(file_path)
+            else:
+                seen_hashes.add(file_hash)
+    return repeated
+
+
+def _measure_raw_file(file_path: Path, crop: Optional[tuple]) -> Dict:
+    """
+    Decode a raw file and measure its noise.
+
+    Module-level so it can run in a ProcessPoolExecutor worker.
+
+    Args:
+        file_path: Path to the raw file
+        crop: (row slice, column slice) to measure, or None for the full frame
+
+    Returns:
+        Dictionary with noise_std, noise_mean and the black_level/white_level
+        reported by LibRaw (None where unavailable)
+    """
+    import rawpy
+
+    with rawpy.imread(str(file_path)) as raw:
+        # Measure the crop of LibRaw's buffer directly (no full-frame copy)
+        image = raw.raw_image
+        if crop is not None:
+            image = image[crop]
+
+        # Calculate noise statistics (mean and std in one pass)
+        noise_mean, noise_std, _, _ = image_stats(image)
+
+        try:
+            black_level = raw.black_level_per_channel[0] if hasattr(raw, 'black_level_per_channel') else None
+        except Exception:
+            black_level = None
+
+        try:
+            white_level = raw.camera_whitelevel_per_channel[0] if hasattr(raw, 'camera_whitelevel_per_channel') else None
+        except Exception:
+            white_level = None
+
+    return {
+        'noise_std': noise_std,
+        'noise_mean': noise_mean,
+        'black_level': black_level,
+        'white_level': white_level,
+    }
+
+
+def _iter_exif(file_paths: List[Path], batch_size: int = _EXIF_BATCH_SIZE):
+    """
+    Read EXIF metadata lazily, one exiftool request per batch of files.
+
+    The shared exiftool process is only held while a batch is read, so other
+    callers can use it between batches.
+
+    Args:
+        file_paths: Paths of the image files
+        batch_size: Number of files per exiftool request
+
+    Yields:
+        (file_path, exif_data) tuples in input order; exif_data is the
+        metadata dictionary, or the exception raised while reading that file
+    """
+    for start in range(0, len(file_paths), batch_size):
+        batch = file_paths[start:start + batch_size]
+        try:
+            exif_batch = _read_exif_batch(batch)
+        except Exception as e:
+            # exiftool could not be started
+            exif_batch = [e] * len(batch)
+        yield from zip(batch, exif_batch)
+
+
+def _first_value(metadata: Dict, *keys: str, default=None):
+    """
+    Return the value of the first of keys that is present and not None.
+
+    Args:
+        metadata: EXIF metadata dictionary
+        *keys: Metadata keys in order of preference
+        default: Value returned when none of the keys has a value
+
+    Returns:
+        The first available value, or default
+    """
+    for key in keys:
+        value = metadata.get(key)
+        if value is not None:
+            return value
+    return default
+
 
 class AnalysisRunner:
     """Runs camera sensor analysis and generates aggregate CSV"""
@@ -122,6 +418,8 @@ class AnalysisRunner:
 
         db = get_db_manager()
         images_saved = 0
+        # Records waiting to be written in one transaction
+        pending_records = []
 
         if progress_callback:
             progress_callback("Saving to database...")
@@ -129,29 +427,25 @@ class AnalysisRunner:
         # Process each camera's results
         for camera_name, sensor_list in self.scan_results.items():
             # Apply limit if specified
-            if limit and images_saved >= limit:
+            if limit and images_saved + len(pending_records) >= limit:
                 if progress_callback:
                     progress_callback(f"Reached limit of {limit} images")
                 break
             if progress_callback:
                 progress_callback(f"Processing {camera_name}...")
 
-            for sensor in sensor_list:
+            # EXIF data of the existing files, read in batches
+            sensors = [sensor for sensor in sensor_list if Path(sensor.file).exists()]
+            exif_results = _iter_exif([Path(sensor.file) for sensor in sensors])
+
+            for sensor, (file_path, exif_data) in zip(sensors, exif_results):
                 # Check limit
-                if limit and images_saved >= limit:
+                if limit and images_saved + len(pending_records) >= limit:
                     break
 
                 try:
-                    # Get image file path
-                    file_path = Path(sensor.file)
-
-                    if not file_path.exists():
-                        continue
-
-                    # Get EXIF data
-                    with get_exiftool_helper() as et:
-                        exif_list = et.get_metadata([str(file_path)])
-                        exif_data = exif_list[0] if exif_list else {}
+                    if isinstance(exif_data, Exception):
+                        raise exif_data
 
                     # Extract camera info
                     camera_make = exif_data.get('EXIF:Make', 'Unknown')
@@ -162,42 +456,39 @@ class AnalysisRunner:
                     xdim = sensor.xdim
                     ydim = sensor.ydim
 
-                    # Insert image record
-                    image_id = db.insert_image(
-                        file_path=file_path,
-                        xdim=xdim,
-                        ydim=ydim,
-                        camera_make=camera_make,
-                        camera_model=camera_model,
-                        camera_serial=camera_serial
-                    )
-
-                    # Insert noise analysis results
-                    db.insert_analysis_results(
-                        image_id=image_id,
-                        ev=sensor.ev
-                    )
-
-                    # Insert EXIF data with exposure settings and levels
-                    db.insert_exif_data(
-                        image_id,
-                        exif_data,
-                        iso=sensor.iso,
-                        exposure_time=sensor.time,
-                        black_level=sensor.black_level,
-                        white_level=sensor.white_level
-                    )
-
-                    images_saved += 1
-
-                    if images_saved % 10 == 0 and progress_callback:
-                        progress_callback(f"Saved {images_saved} images...")
+                    # Queue image record, noise analysis results and EXIF data
+                    # with exposure settings and levels
+                    pending_records.append({
+                        'image': dict(
+                            file_path=file_path,
+                            xdim=xdim,
+                            ydim=ydim,
+                            camera_make=camera_make,
+                            camera_model=camera_model,
+                            camera_serial=camera_serial
+                        ),
+                        'analysis': dict(ev=sensor.ev),
+                        'exif': dict(
+                            exif_dict=exif_data,
+                            iso=sensor.iso,
+                            exposure_time=sensor.time,
+                            black_level=sensor.black_level,
+                            white_level=sensor.white_level
+                        ),
+                    })
+
+                    if len(pending_records) >= _DB_BATCH_SIZE:
+                        images_saved += _insert_records(db, pending_records, progress_callback)
+                        if progress_callback:
+                            progress_callback(f"Saved {images_saved} images...")
 
                 except Exception as e:
                     if progress_callback:
                         progress_callback(f"Error processing {file_path.name}: {e}")
                     continue
 
+        images_saved += _insert_records(db, pending_records, progress_callback)
+
         if progress_callback:
             progress_callback(f"Saved {images_saved} images to database")
 
@@ -274,10 +565,7 @@ class AnalysisRunner:
             progress_callback("Scanning source directory...")
 
         # Find all DNG and ERF files recursively
-        image_extensions = ['.dng', '.DNG', '.erf', '.ERF']
-        image_files = []
-        for ext in image_extensions:
-            image_files.extend(source_dir.rglob(f'*{ext}'))
+        image_files = _find_image_files(source_dir)
 
         # Apply limit if specified
         if limit:
@@ -290,36 +578,34 @@ class AnalysisRunner:
                 msg += f" (limited to {limit})"
             progress_callback(msg)
 
-        # Process each image file
-        for idx, file_path in enumerate(image_files):
-            if progress_callback and idx % 10 == 0:
-                progress_callback(f"Processing {idx + 1}/{total_files}...")
-
+        # Skip images already in the database before reading any EXIF data
+        new_files = []
+        for file_path in image_files:
             try:
-                # Check if image already exists in database
                 existing = db.get_image_by_path(file_path)
-                if existing:
-                    images_skipped += 1
-                    continue
+            except Exception as e:
+                if progress_callback:
+                    progress_callback(f"⚠ Error processing {file_path.name}: {e}")
+                continue
+            if existing:
+                images_skipped += 1
+            else:
+                new_files.append(file_path)
 
-                # Get EXIF data
-                with get_exiftool_helper() as et:
-                    exif_list = et.get_metadata([str(file_path)])
-                    exif_data = exif_list[0] if exif_list else {}
+        # Process each new image file (EXIF data is read in batches)
+        for idx, (file_path, exif_data) in enumerate(_iter_exif(new_files)):
+            if progress_callback and idx % 10 == 0:
+                progress_callback(f"Processing {idx + 1}/{len(new_files)}...")
+
+            try:
+                if isinstance(exif_data, Exception):
+                    raise exif_data
 
                 # Extract basic image info
-                camera_make = exif_data.get('EXIF:Make', 'Unknown')
-                camera_model = exif_data.get('EXIF:Model', 'Unknown')
-                camera_serial = exif_data.get('EXIF:SerialNumber')
+                camera_make, camera_model, camera_serial = _camera_info(exif_data)
 
                 # Get image dimensions
-                xdim = exif_data.get('EXIF:ImageWidth') or exif_data.get('File:ImageWidth')
-                ydim = exif_data.get('EXIF:ImageHeight') or exif_data.get('File:ImageHeight')
-
-                if not xdim or not ydim:
-                    # Try SubIFD dimensions
-                    xdim = exif_data.get('SubIFD:ImageWidth')
-                    ydim = exif_data.get('SubIFD:ImageHeight')
+                xdim, ydim = _image_dimensions(exif_data)
 
                 if not xdim or not ydim:
                     if progress_callback:
@@ -380,10 +666,7 @@ class AnalysisRunner:
             progress_callback("Quick scanning source directory...")
 
         # Find all DNG and ERF files recursively
-        image_extensions = ['.dng', '.DNG', '.erf', '.ERF']
-        image_files = []
-        for ext in image_extensions:
-            image_files.extend(source_dir.rglob(f'*{ext}'))
+        image_files = _find_image_files(source_dir)
 
         # Apply limit if specified
         if limit:
@@ -396,39 +679,42 @@ class AnalysisRunner:
                 msg += f" (limited to {limit})"
             progress_callback(msg)
 
-        # Process each image file
+        # Check each image file against the database before reading any EXIF data
+        stored_sizes = db.get_file_sizes()
+        new_files = []
         for idx, file_path in enumerate(image_files):
             if progress_callback and idx % 50 == 0:
                 progress_callback(f"Checking {idx + 1}/{total_files}...")
 
             try:
-                # Calculate file hash
-                file_hash = db.calculate_file_hash(file_path)
+                # Check if image with the same content already exists
+                existing = _find_stored_image(db, file_path, stored_sizes)
+            except Exception as e:
+                if progress_callback:
+                    progress_callback(f"⚠ Error processing {file_path.name}: {e}")
+                images_skipped += 1
+                continue
+            if existing:
+                images_skipped += 1
+            else:
+                new_files.append(file_path)
 
-                # Check if image with this hash already exists
-                existing = db.get_image_by_hash(file_hash)
-                if existing:
-                    images_skipped += 1
-                    continue
+        # Copies of a file added by this scan are already in the database too
+        repeated = _find_repeated_files(db, new_files)
+        images_skipped += len(repeated)
+        new_files = [file_path for file_path in new_files if file_path not in repeated]
 
-                # Get EXIF data
-                with get_exiftool_helper() as et:
-                    exif_list = et.get_metadata([str(file_path)])
-                    exif_data = exif_list[0] if exif_list else {}
+        # Process each new image file (EXIF data is read in batches)
+        for file_path, exif_data in _iter_exif(new_files):
+            try:
+                if isinstance(exif_data, Exception):
+                    raise exif_data
 
                 # Extract basic image info
-                camera_make = exif_data.get('EXIF:Make', 'Unknown')
-                camera_model = exif_data.get('EXIF:Model', 'Unknown')
-                camera_serial = exif_data.get('EXIF:SerialNumber')
+                camera_make, camera_model, camera_serial = _camera_info(exif_data)
 
                 # Get image dimensions
-                xdim = exif_data.get('EXIF:ImageWidth') or exif_data.get('File:ImageWidth')
-                ydim = exif_data.get('EXIF:ImageHeight') or exif_data.get('File:ImageHeight')
-
-                if not xdim or not ydim:
-                    # Try SubIFD dimensions
-                    xdim = exif_data.get('SubIFD:ImageWidth')
-                    ydim = exif_data.get('SubIFD:ImageHeight')
+                xdim, ydim = _image_dimensions(exif_data)
 
                 if not xdim or not ydim:
                     if progress_callback:
@@ -498,12 +784,7 @@ class AnalysisRunner:
             progress_callback("Building file list: Searching source directory for DNG and ERF files...")
 
         # Find all DNG and ERF files recursively (this can take time for large directories)
-        image_extensions = ['.dng', '.DNG', '.erf', '.ERF']
-        image_files = []
-        for ext in image_extensions:
-            if progress_callback:
-                progress_callback(f"Building file list: Searching for *{ext} files...")
-            image_files.extend(source_dir.rglob(f'*{ext}'))
+        image_files = _find_image_files(source_dir)
 
         # Check for cancellation after file list is built
         if cancel_flag and cancel_flag():
@@ -526,7 +807,10 @@ class AnalysisRunner:
         # Calculate padding width for numbers
         num_width = len(str(total_files))
 
-        # Process each image file
+        # Check each image file against the database first, so that only new
+        # files are handed to exiftool
+        stored_sizes = db.get_file_sizes()
+        new_files = []
         for idx, file_path in enumerate(image_files):
             # Check for cancellation
             if cancel_flag and cancel_flag():
@@ -535,103 +819,84 @@ class AnalysisRunner:
                 return {'added': images_added, 'skipped': images_skipped}
 
             current = idx + 1
-            remaining = total_files - idx
 
             # Show which file we're checking
             if progress_callback:
                 progress_callback(f"Loading: Checking {current}/{total_files} - {file_path.name}")
 
             try:
-                # Calculate file hash
-                file_hash = db.calculate_file_hash(file_path)
-
-                # Check if image with this hash already exists
-                existing = db.get_image_by_hash(file_hash)
-
-                if existing is not None:
-                    # Image already exists in database - skip it
-                    logger.info(f"Skipping existing image: {file_path.name} (ID: {existing['id']})")
-                    if progress_callback:
-                        progress_callback(f"Loading: Skipped {current}/{total_files} - {file_path.name} (already in database)")
-                    images_skipped += 1
-                    continue
+                # Check if image with the same content already exists
+                existing = _find_stored_image(db, file_path, stored_sizes)
+            except Exception as e:
+                logger.error(f"Error processing {file_path.name}: {e}", exc_info=True)
+                if progress_callback:
+                    progress_callback(f"⚠ Error processing {file_path.name}: {e}")
+                images_skipped += 1
+                continue
 
-                # New image - analyze it
+            if existing is not None:
+                # Image already exists in database - skip it
+                logger.info(f"Skipping existing image: {file_path.name} (ID: {existing['id']})")
+                if progress_callback:
+                    progress_callback(f"Loading: Skipped {current}/{total_files} - {file_path.name} (already in database)")
+                images_skipped += 1
+            else:
                 logger.info(f"New image found: {file_path.name}")
+                new_files.append((current, file_path))
+
+        # Copies of a file loaded by this run are already in the database too
+        repeated = _find_repeated_files(db, [file_path for _, file_path in new_files])
+        for current, file_path in new_files:
+            if file_path in repeated:
+                logger.info(f"Skipping copy of a new image: {file_path.name}")
                 if progress_callback:
-                    progress_callback(f"Loading: Analyzing {current}/{total_files} - {file_path.name}")
+                    progress_callback(f"Loading: Skipped {current}/{total_files} - {file_path.name} (already in database)")
+                images_skipped += 1
+        new_files = [(current, file_path) for current, file_path in new_files if file_path not in repeated]
+
+        # Analyze each new image file (EXIF data is read in batches); results
+        # are written to the database in batches as well
+        pending_records = []
+
+        def write_pending_records():
+            nonlocal images_added, images_skipped
+            queued = len(pending_records)
+            inserted = _insert_records(db, pending_records, progress_callback)
+            images_added += inserted
+            images_skipped += queued - inserted
+
+        # Level fallbacks and EV of one measured file; its record is queued
+        def analyze(current, file_path, exif_data, measurement):
+            nonlocal images_skipped
+            if progress_callback:
+                progress_callback(f"Loading: Analyzing {current}/{total_files} - {file_path.name}")
 
-                # Get EXIF data
-                with get_exiftool_helper() as et:
-                    exif_list = et.get_metadata([str(file_path)])
-                    exif_data = exif_list[0] if exif_list else {}
-                    # Log EXIF keys related to white level
-                    white_keys = [k for k in exif_data.keys() if 'white' in k.lower() or 'bits' in k.lower()]
-                    logger.info(f"EXIF keys with 'white' or 'bits': {white_keys}")
+            try:
+                if isinstance(measurement, Exception):
+                    raise measurement
+                # Log EXIF keys related to white level (scans all keys: only
+                # when the log is written)
+                if logger.is_enabled():
+                    white_keys = [k for k in exif_data if 'white' in k.lower() or 'bits' in k.lower()]
+                    logger.debug(f"EXIF keys with 'white' or 'bits': {white_keys}")
 
-                # Process raw file for noise analysis
-                import rawpy
                 import numpy as np
 
-                raw = rawpy.imread(str(file_path))
-                image = raw.raw_image.copy()
-
-                # Get camera information for crop lookup
-                camera_make = exif_data.get('EXIF:Make', 'Unknown')
-                camera_model = exif_data.get('EXIF:Model', 'Unknown')
-                camera_serial = exif_data.get('EXIF:SerialNumber')
-
-                # Get or create camera to get camera_id for crop lookup
-                camera_id = db.get_or_create_camera(camera_make, camera_model, camera_serial)
-
-                # Apply crop from database if available, otherwise use hardcoded CAMERA_CROPS
-                crop_applied = False
-                camera_attrs = db.get_camera_attributes(camera_id)
-
-                if camera_attrs:
-                    x_min = camera_attrs.get('x_min')
-                    x_max = camera_attrs.get('x_max')
-                    y_min = camera_attrs.get('y_min')
-                    y_max = camera_attrs.get('y_max')
-
-                    if all(v is not None for v in [x_min, x_max, y_min, y_max]):
-                        logger.info(f"Applying database crop for {camera_model}: x[{x_min}:{x_max+1}], y[{y_min}:{y_max+1}]")
-                        image = image[y_min:y_max+1, x_min:x_max+1]
-                        crop_applied = True
-
-                # Fall back to hardcoded crops if no database crop
-                if not crop_applied and camera_model in Sensor.CAMERA_CROPS:
-                    logger.info(f"Applying hardcoded crop for {camera_model}")
-                    crop = Sensor.CAMERA_CROPS[camera_model]
-                    image = image[crop]
-
-                # Calculate noise statistics
-                noise_std = float(np.std(image))
-                noise_mean = float(np.mean(image))
+                # Noise statistics and levels reported by LibRaw
+                measured = measurement.result()
+                noise_std = measured['noise_std']
+                noise_mean = measured['noise_mean']
 
                 # Get black and white levels from raw file first, then EXIF as fallback
-                # Try to get from raw file (most accurate)
-                try:
-                    black_level = raw.black_level_per_channel[0] if hasattr(raw, 'black_level_per_channel') else None
-                    logger.info(f"Black level from raw: {black_level}")
-                except Exception as e:
-                    logger.warning(f"Failed to get black_level from raw: {e}")
-                    black_level = None
-
-                try:
-                    white_level = raw.camera_whitelevel_per_channel[0] if hasattr(raw, 'camera_whitelevel_per_channel') else None
-                    logger.info(f"White level from raw: {white_level}")
-                except Exception as e:
-                    logger.warning(f"Failed to get white_level from raw: {e}")
-                    white_level = None
+                black_level = measured['black_level']
+                logger.info(f"Black level from raw: {black_level}")
+                white_level = measured['white_level']
+                logger.info(f"White level from raw: {white_level}")
 
                 # Fallback to EXIF if not available in raw
                 if black_level is None:
-                    black_level = exif_data.get('SubIFD:BlackLevel')
-                    logger.info(f"Black level from EXIF SubIFD:BlackLevel: {black_level}")
-                    if black_level is None:
-                        black_level = exif_data.get('EXIF:BlackLevel')
-                        logger.info(f"Black level from EXIF EXIF:BlackLevel: {black_level}")
+                    black_level = _first_value(exif_data, 'SubIFD:BlackLevel', 'EXIF:BlackLevel')
+                    logger.info(f"Black level from EXIF (SubIFD, then EXIF): {black_level}")
                     if black_level is None:
                         black_level = 0
                         logger.info(f"Using default black_level: {black_level}")
@@ -639,17 +904,12 @@ class AnalysisRunner:
                         black_level = int(black_level.split()[0])
 
                 if white_level is None:
-                    white_level = exif_data.get('EXIF:WhiteLevel')
-                    logger.info(f"White level from EXIF EXIF:WhiteLevel: {white_level}")
-                    if white_level is None:
-                        # Try SubIFD as fallback
-                        white_level = exif_data.get('SubIFD:WhiteLevel')
-                        logger.info(f"White level from EXIF SubIFD:WhiteLevel: {white_level}")
+                    # EXIF first, SubIFD as fallback
+                    white_level = _first_value(exif_data, 'EXIF:WhiteLevel', 'SubIFD:WhiteLevel')
+                    logger.info(f"White level from EXIF (EXIF, then SubIFD): {white_level}")
                     if white_level is None:
                         # Last resort: calculate from BitsPerSample
-                        bits_per_sample = exif_data.get('EXIF:BitsPerSample')
-                        if bits_per_sample is None:
-                            bits_per_sample = exif_data.get('SubIFD:BitsPerSample')
+                        bits_per_sample = _first_value(exif_data, 'EXIF:BitsPerSample', 'SubIFD:BitsPerSample')
                         logger.info(f"BitsPerSample from EXIF: {bits_per_sample}")
                         if bits_per_sample is not None:
                             white_level = 2 ** int(bits_per_sample) - 1
@@ -662,7 +922,7 @@ class AnalysisRunner:
                 # Calculate EV: log2((white_level - black_level) / std)
                 logger.info(f"EV calculation for {file_path.name}: white_level={white_level}, black_level={black_level}, noise_std={noise_std}")
                 if not np.isnan(white_level) and noise_std > 0:
-                    ev = np.log((white_level - black_level) / noise_std) / np.log(2)
+                    ev = np.log2((white_level - black_level) / noise_std)
                     logger.info(f"Calculated EV={ev}")
                 else:
                     ev = np.nan
@@ -672,21 +932,11 @@ class AnalysisRunner:
                 iso = exif_data.get('EXIF:ISO')
                 exposure_time = exif_data.get('EXIF:ExposureTime')
 
-                raw.close()
-
                 # Extract camera info
-                camera_make = exif_data.get('EXIF:Make', 'Unknown')
-                camera_model = exif_data.get('EXIF:Model', 'Unknown')
-                camera_serial = exif_data.get('EXIF:SerialNumber')
+                camera_make, camera_model, camera_serial = _camera_info(exif_data)
 
                 # Get image dimensions from EXIF
-                xdim = exif_data.get('EXIF:ImageWidth') or exif_data.get('File:ImageWidth')
-                ydim = exif_data.get('EXIF:ImageHeight') or exif_data.get('File:ImageHeight')
-
-                if not xdim or not ydim:
-                    # Try SubIFD dimensions
-                    xdim = exif_data.get('SubIFD:ImageWidth')
-                    ydim = exif_data.get('SubIFD:ImageHeight')
+                xdim, ydim = _image_dimensions(exif_data)
 
                 # Send updated progress with file details
                 if progress_callback and xdim and ydim and iso:
@@ -698,48 +948,85 @@ class AnalysisRunner:
                     if progress_callback:
                         progress_callback(f"⚠ Skipping {file_path.name}: No dimensions found")
                     images_skipped += 1
-                    continue
+                    return
 
-                # Insert new image record
-                # Insert new image record
-                image_id = db.insert_image(
-                    file_path=file_path,
-                    xdim=int(xdim),
-                    ydim=int(ydim),
-                    camera_make=camera_make,
-                    camera_model=camera_model,
-                    camera_serial=camera_serial
-                )
-
-                # Insert analysis results with calculated values
-                db.insert_analysis_results(
-                    image_id=image_id,
-                    ev=float(ev) if not np.isnan(ev) else None,
-                    noise_std=noise_std,
-                    noise_mean=noise_mean
-                )
-
-                # Insert EXIF data with exposure settings and levels
-                db.insert_exif_data(
-                    image_id,
-                    exif_data,
-                    iso=iso,
-                    exposure_time=exposure_time,
-                    black_level=black_level,
-                    white_level=white_level
-                )
-
-                images_added += 1
+                # Queue new image record, analysis results with calculated
+                # values and EXIF data with exposure settings and levels
+                pending_records.append({
+                    'image': dict(
+                        file_path=file_path,
+                        xdim=int(xdim),
+                        ydim=int(ydim),
+                        camera_make=camera_make,
+                        camera_model=camera_model,
+                        camera_serial=camera_serial
+                    ),
+                    'analysis': dict(
+                        ev=float(ev) if not np.isnan(ev) else None,
+                        noise_std=noise_std,
+                        noise_mean=noise_mean
+                    ),
+                    'exif': dict(
+                        exif_dict=exif_data,
+                        iso=iso,
+                        exposure_time=exposure_time,
+                        black_level=black_level,
+                        white_level=white_level
+                    ),
+                })
 
-                if progress_callback and images_added % 10 == 0:
-                    progress_callback(f"[{current:>{num_width}}/{total_files}] ✓ Added {images_added}, skipped {images_skipped}")
+                if len(pending_records) >= _DB_BATCH_SIZE:
+                    write_pending_records()
+                    if progress_callback:
+                        progress_callback(f"[{current:>{num_width}}/{total_files}] ✓ Added {images_added}, skipped {images_skipped}")
 
             except Exception as e:
                 logger.error(f"Error processing {file_path.name}: {e}", exc_info=True)
                 if progress_callback:
                     progress_callback(f"⚠ Error processing {file_path.name}: {e}")
                 images_skipped += 1
-                continue
+
+        # Raw files are decoded and measured in worker processes while the
+        # next EXIF batches are read; database lookups, level fallbacks and
+        # writes stay in this process. At most two tasks per worker are in
+        # flight, so results are analyzed and written as the import goes
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+        cancelled = False
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            tasks = deque()
+            crop_cache = {}
+            exif_results = _iter_exif([file_path for _, file_path in new_files])
+            for (current, _), (file_path, exif_data) in zip(new_files, exif_results):
+                # Check for cancellation (images analyzed so far are kept)
+                if cancel_flag and cancel_flag():
+                    cancelled = True
+                    break
+                try:
+                    if isinstance(exif_data, Exception):
+                        raise exif_data
+                    crop = self._camera_crop(db, exif_data, crop_cache)
+                    measurement = executor.submit(_measure_raw_file, file_path, crop)
+                except Exception as e:
+                    measurement = e
+                tasks.append((current, file_path, exif_data, measurement))
+                if len(tasks) >= 2 * max_workers:
+                    analyze(*tasks.popleft())
+
+            while tasks and not cancelled:
+                if cancel_flag and cancel_flag():
+                    cancelled = True
+                    break
+                analyze(*tasks.popleft())
+
+            if cancelled:
+                executor.shutdown(cancel_futures=True)
+
+        write_pending_records()
+
+        if cancelled:
+            if progress_callback:
+                progress_callback("Load cancelled by user")
+            return {'added': images_added, 'skipped': images_skipped}
 
         if progress_callback:
             progress_callback(
@@ -748,6 +1035,53 @@ class AnalysisRunner:
 
         return {'added': images_added, 'skipped': images_skipped}
 
+    def _camera_crop(self, db, exif_data: Dict, cache: Optional[Dict] = None) -> Optional[tuple]:
+        """
+        Look up the sensor crop for the camera that took an image.
+
+        Args:
+            db: DatabaseManager
+            exif_data: EXIF metadata of the image
+            cache: Optional dictionary of crops by (make, model, serial),
+                   filled on first lookup; use one per run, so that edited
+                   camera attributes are picked up by the next run
+
+        Returns:
+            (row slice, column slice) from the camera attributes in the
+            database, else from Sensor.CAMERA_CROPS, or None for no crop
+        """
+        # Get camera information for crop lookup
+        camera_make, camera_model, camera_serial = _camera_info(exif_data)
+
+        # A run sees only a handful of cameras: look each one up once
+        camera_key = (camera_make, camera_model, camera_serial)
+        if cache is not None:
+            if camera_key not in cache:
+                cache[camera_key] = self._camera_crop(db, exif_data)
+            return cache[camera_key]
+
+        # Get or create camera to get camera_id for crop lookup
+        camera_id = db.get_or_create_camera(camera_make, camera_model, camera_serial)
+
+        # Apply crop from database if available, otherwise use hardcoded CAMERA_CROPS
+        camera_attrs = db.get_camera_attributes(camera_id)
+
+        if camera_attrs:
+            x_min = camera_attrs.get('x_min')
+            x_max = camera_attrs.get('x_max')
+            y_min = camera_attrs.get('y_min')
+            y_max = camera_attrs.get('y_max')
+
+            if all(v is not None for v in [x_min, x_max, y_min, y_max]):
+                logger.info(f"Applying database crop for {camera_model}: x[{x_min}:{x_max+1}], y[{y_min}:{y_max+1}]")
+                return (slice(y_min, y_max + 1), slice(x_min, x_max + 1))
+
+        # Fall back to hardcoded crops if no database crop
+        crop = Sensor.CAMERA_CROPS.get(camera_model)
+        if crop is not None:
+            logger.info(f"Applying hardcoded crop for {camera_model}")
+        return crop
+
     def rescan_database(self, progress_callback=None, reanalyze_existing=True, add_new_images=True, cancel_flag=None) -> Dict[str, int]:
         """
         Rescan database: remove missing images, re-analyze existing, optionally add new images.
@@ -839,12 +1173,8 @@ class AnalysisRunner:
                         progress_callback(f"Database Check: Image {current}/{total_db_images} - {camera_model} | ISO {iso} | {exposure_setting}")
 
                     # Process raw file for noise analysis
-                    import rawpy
                     import numpy as np
 
-                    raw = rawpy.imread(str(file_path))
-                    image = raw.raw_image.copy()
-
                     # Get camera_id for this image to look up crop settings
                     with db.get_connection() as conn:
                         cursor = conn.execute("SELECT camera_id FROM images WHERE id = ?", (image_id,))
@@ -852,7 +1182,7 @@ class AnalysisRunner:
                         camera_id = result['camera_id'] if result else None
 
                     # Apply crop from database if available, otherwise use hardcoded CAMERA_CROPS
-                    crop_applied = False
+                    crop = None
                     if camera_id:
                         camera_attrs = db.get_camera_attributes(camera_id)
                         if camera_attrs:
@@ -862,46 +1192,30 @@ class AnalysisRunner:
                             y_max = camera_attrs.get('y_max')
 
                             if all(v is not None for v in [x_min, x_max, y_min, y_max]):
-                                image = image[y_min:y_max+1, x_min:x_max+1]
-                                crop_applied = True
+                                crop = (slice(y_min, y_max + 1), slice(x_min, x_max + 1))
 
                     # Fall back to hardcoded crops if no database crop
-                    if not crop_applied and camera_model in Sensor.CAMERA_CROPS:
-                        crop = Sensor.CAMERA_CROPS[camera_model]
-                        image = image[crop]
-
-                    # Calculate noise statistics
-                    noise_std = float(np.std(image))
-                    noise_mean = float(np.mean(image))
-
-                    # Get black and white levels from raw file first, then EXIF as fallback
-                    # Try to get from raw file (most accurate)
-                    try:
-                        black_level = raw.black_level_per_channel[0] if hasattr(raw, 'black_level_per_channel') else None
-                    except:
-                        black_level = None
-
-                    try:
-                        white_level = raw.camera_whitelevel_per_channel[0] if hasattr(raw, 'camera_whitelevel_per_channel') else None
-                    except:
-                        white_level = None
+                    if crop is None:
+                        crop = Sensor.CAMERA_CROPS.get(camera_model)
+
+                    # Noise statistics of the crop (one pass, no frame copy) and
+                    # black and white levels from raw file first, then EXIF as fallback
+                    measured = _measure_raw_file(file_path, crop)
+                    noise_mean = measured['noise_mean']
+                    noise_std = measured['noise_std']
+                    black_level = measured['black_level']
+                    white_level = measured['white_level']
 
                     # Fallback to EXIF if not available in raw
                     if black_level is None:
-                        black_level = exif_data.get('SubIFD:BlackLevel')
-                        if black_level is None:
-                            black_level = 0
+                        black_level = _first_value(exif_data, 'SubIFD:BlackLevel', default=0)
 
                     if white_level is None:
-                        white_level = exif_data.get('EXIF:WhiteLevel')
-                        if white_level is None:
-                            # Try SubIFD as fallback
-                            white_level = exif_data.get('SubIFD:WhiteLevel')
+                        # EXIF first, SubIFD as fallback
+                        white_level = _first_value(exif_data, 'EXIF:WhiteLevel', 'SubIFD:WhiteLevel')
                         if white_level is None:
                             # Last resort: calculate from BitsPerSample
-                            bits_per_sample = exif_data.get('EXIF:BitsPerSample')
-                            if bits_per_sample is None:
-                                bits_per_sample = exif_data.get('SubIFD:BitsPerSample')
+                            bits_per_sample = _first_value(exif_data, 'EXIF:BitsPerSample', 'SubIFD:BitsPerSample')
                             if bits_per_sample is not None:
                                 white_level = 2 ** int(bits_per_sample) - 1
                             else:
@@ -942,12 +1256,7 @@ class AnalysisRunner:
                 progress_callback("Building file list: Searching source directory for DNG and ERF files...")
 
             # Find all DNG and ERF files recursively (this can take time for large directories)
-            image_extensions = ['.dng', '.DNG', '.erf', '.ERF']
-            image_files = []
-            for ext in image_extensions:
-                if progress_callback:
-                    progress_callback(f"Building file list: Searching for *{ext} files...")
-                image_files.extend(source_dir.rglob(f'*{ext}'))
+            image_files = _find_image_files(source_dir)
 
             total_files = len(image_files)
             if progress_callback:
@@ -963,6 +1272,8 @@ class AnalysisRunner:
             num_width = len(str(total_files))
 
             # Process each image file
+            stored_sizes = db.get_file_sizes()
+            crop_cache = {}
             for idx, file_path in enumerate(image_files):
                 # Check for cancellation
                 if cancel_flag and cancel_flag():
@@ -977,11 +1288,8 @@ class AnalysisRunner:
                     if progress_callback:
                         progress_callback(f"Scanning Files: Checking {current}/{total_files} - {file_path.name}")
 
-                    # Calculate file hash
-                    file_hash = db.calculate_file_hash(file_path)
-
-                    # Check if image with this hash already exists
-                    existing = db.get_image_by_hash(file_hash)
+                    # Check if image with the same content already exists
+                    existing = _find_stored_image(db, file_path, stored_sizes)
                     if existing:
                         images_skipped += 1
                         if progress_callback:
@@ -1013,60 +1321,23 @@ class AnalysisRunner:
                         progress_callback(f"Scanning Files: Image {current}/{total_files} - {camera_model} | ISO {iso} | {exposure_setting}")
 
                     # Process raw file for noise analysis
-                    import rawpy
                     import numpy as np
 
-                    raw = rawpy.imread(str(file_path))
-                    image = raw.raw_image.copy()
-
-                    # Get camera information for crop lookup
-                    camera_make = exif_data.get('EXIF:Make', 'Unknown')
-                    camera_model = exif_data.get('EXIF:Model', 'Unknown')
-                    camera_serial = exif_data.get('EXIF:SerialNumber')
+                    # Apply crop from database if available, otherwise use
+                    # hardcoded CAMERA_CROPS (looked up once per camera)
+                    crop = self._camera_crop(db, exif_data, crop_cache)
 
-                    # Get or create camera to get camera_id for crop lookup
-                    camera_id = db.get_or_create_camera(camera_make, camera_model, camera_serial)
-
-                    # Apply crop from database if available, otherwise use hardcoded CAMERA_CROPS
-                    crop_applied = False
-                    camera_attrs = db.get_camera_attributes(camera_id)
-
-                    if camera_attrs:
-                        x_min = camera_attrs.get('x_min')
-                        x_max = camera_attrs.get('x_max')
-                        y_min = camera_attrs.get('y_min')
-                        y_max = camera_attrs.get('y_max')
-
-                        if all(v is not None for v in [x_min, x_max, y_min, y_max]):
-                            image = image[y_min:y_max+1, x_min:x_max+1]
-                            crop_applied = True
-
-                    # Fall back to hardcoded crops if no database crop
-                    if not crop_applied and camera_model in Sensor.CAMERA_CROPS:
-                        crop = Sensor.CAMERA_CROPS[camera_model]
-                        image = image[crop]
-
-                    # Calculate noise statistics
-                    noise_std = float(np.std(image))
-                    noise_mean = float(np.mean(image))
-
-                    # Get black and white levels from raw file first, then EXIF as fallback
-                    # Try to get from raw file (most accurate)
-                    try:
-                        black_level = raw.black_level_per_channel[0] if hasattr(raw, 'black_level_per_channel') else None
-                    except:
-                        black_level = None
-
-                    try:
-                        white_level = raw.camera_whitelevel_per_channel[0] if hasattr(raw, 'camera_whitelevel_per_channel') else None
-                    except:
-                        white_level = None
+                    # Noise statistics of the crop (one pass, no frame copy) and
+                    # black and white levels from raw file first, then EXIF as fallback
+                    measured = _measure_raw_file(file_path, crop)
+                    noise_mean = measured['noise_mean']
+                    noise_std = measured['noise_std']
+                    black_level = measured['black_level']
+                    white_level = measured['white_level']
 
                     # Fallback to EXIF if not available in raw
                     if black_level is None:
-                        black_level = exif_data.get('SubIFD:BlackLevel')
-                        if black_level is None:
-                            black_level = 0
+                        black_level = _first_value(exif_data, 'SubIFD:BlackLevel', default=0)
 
                     if white_level is None:
                         white_level = exif_data.get('SubIFD:WhiteLevel')
@@ -1086,8 +1357,7 @@ class AnalysisRunner:
                         ev = None
 
                     # Get camera info
-                    camera_make = exif_data.get('EXIF:Make', 'Unknown')
-                    camera_serial = exif_data.get('EXIF:SerialNumber')
+                    camera_make, camera_model, camera_serial = _camera_info(exif_data)
 
                     # Get dimensions from EXIF
                     xdim = exif_data.get('SubIFD:ImageWidth')
@@ -1125,6 +1395,8 @@ class AnalysisRunner:
                         black_level=black_level,
                         white_level=white_level
                     )
+                    # Later copies of this file must be hashed to be recognized
+                    stored_sizes.add(file_path.stat().st_size)
 
                     images_added += 1
 
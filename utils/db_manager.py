@@ -18,6 +18,9 @@ from utils.app_logger import get_logger
 class DatabaseManager:
     """Manages SQLite database for image analysis"""
 
+    # Bytes read per call when hashing a file
+    HASH_CHUNK_SIZE = 1 << 20
+
     def __init__(self, db_path: Optional[Path] = None):
         """
         Initialize database manager.
@@ -64,6 +67,7 @@ class DatabaseManager:
             filename TEXT NOT NULL,
             file_type TEXT,
             file_hash TEXT UNIQUE,
+            file_fingerprint TEXT,
             file_size INTEGER,
             file_modified TIMESTAMP,
             xdim INTEGER NOT NULL,
@@ -146,11 +150,22 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 conn.executescript(schema_sql)
+                self._migrate_schema(conn)
             self.logger.info("Database schema initialized")
         except Exception as e:
             self.logger.error(f"Failed to initialize database: {e}", exc_info=True)
             raise
 
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """Add columns introduced after the initial schema to existing databases"""
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(images)")}
+        if 'file_fingerprint' not in columns:
+            conn.execute("ALTER TABLE images ADD COLUMN file_fingerprint TEXT")
+            self.logger.info("Added file_fingerprint column to images table")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_images_file_fingerprint ON images(file_fingerprint)"
+        )
+
     def calculate_file_hash(self, file_path: Path) -> str:
         """
         Calculate SHA256 hash of file.
@@ -162,12 +177,84 @@ class DatabaseManager:
             Hex digest of file hash
         """
         sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        # Read in 1 MB chunks into one reused buffer (unbuffered: no extra copy)
+        buffer = bytearray(self.HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                sha256_hash.update(view[:n])
         return sha256_hash.hexdigest()
 
+    def calculate_file_fingerprint(self, file_path: Path, sample_size: int = 65536) -> str:
+        """
+        Calculate a cheap fingerprint of a file from its first and last bytes,
+        size and modification time. Used to find a file's stored hash without
+        reading the whole file; not a content hash.
+
+        Args:
+            file_path: Path to file
+            sample_size: Bytes read from each end of the file
+
+        Returns:
+            Hex digest of the fingerprint
+        """
+        file_stat = file_path.stat()
+        fingerprint = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as f:
+            fingerprint.update(f.read(sample_size))
+            if file_stat.st_size > sample_size:
+                f.seek(max(sample_size, file_stat.st_size - sample_size))
+                fingerprint.update(f.read(sample_size))
+        fingerprint.update(file_stat.st_size.to_bytes(8, 'little'))
+        fingerprint.update(file_stat.st_mtime_ns.to_bytes(8, 'little'))
+        return fingerprint.hexdigest()
+
+    def lookup_file_hash(self, file_path: Path) -> str:
+        """
+        Get the SHA256 hash of a file, matching its fingerprint against stored
+        images first so a known, unchanged file is not read in full. On a miss
+        the full hash is calculated and the fingerprint is saved for next time.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Hex digest of file hash
+        """
+        fingerprint = self.calculate_file_fingerprint(file_path)
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT file_hash FROM images WHERE file_fingerprint = ?",
+                (fingerprint,)
+            ).fetchone()
+            if row and row['file_hash']:
+                return row['file_hash']
+
+        file_hash = self.calculate_file_hash(file_path)
+        with self.get_connection() as conn:
+            conn.execute(
+                "UPDATE images SET file_fingerprint = ? WHERE file_hash = ?",
+                (fingerprint, file_hash)
+            )
+        return file_hash
+
+    def get_file_sizes(self) -> set:
+        """
+        Get the sizes of all stored image files.
+
+        A file whose size is not among them cannot be a stored image, so it
+        does not need to be hashed to tell.
+
+        Returns:
+            Set of file sizes in bytes
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute("SELECT DISTINCT file_size FROM images")
+            return {row['file_size'] for row in cursor}
+
     def get_or_create_camera(self, make: str, model: str,
                             serial_number: Optional[str] = None) -> int:
         """
@@ -182,26 +269,31 @@ class DatabaseManager:
             Camera ID
         """
         with self.get_connection() as conn:
-            # Try to find existing camera
-            cursor = conn.execute(
-                """SELECT id FROM cameras
-                   WHERE make = ? AND model = ? AND
-                   (serial_number = ? OR (serial_number IS NULL AND ? IS NULL))""",
-                (make, model, serial_number, serial_number)
-            )
-            row = cursor.fetchone()
-
-            if row:
-                return row['id']
-
-            # Create new camera
-            cursor = conn.execute(
-                "INSERT INTO cameras (make, model, serial_number) VALUES (?, ?, ?)",
-                (make, model, serial_number)
-            )
-            camera_id = cursor.lastrowid
-            self.logger.info(f"Created camera: {make} {model} (ID: {camera_id})")
-            return camera_id
+            return self._get_or_create_camera(conn, make, model, serial_number)
+
+    def _get_or_create_camera(self, conn: sqlite3.Connection, make: str, model: str,
+                              serial_number: Optional[str] = None) -> int:
+        """get_or_create_camera on an open connection"""
+        # Try to find existing camera
+        cursor = conn.execute(
+            """SELECT id FROM cameras
+               WHERE make = ? AND model = ? AND
+               (serial_number = ? OR (serial_number IS NULL AND ? IS NULL))""",
+            (make, model, serial_number, serial_number)
+        )
+        row = cursor.fetchone()
+
+        if row:
+            return row['id']
+
+        # Create new camera
+        cursor = conn.execute(
+            "INSERT INTO cameras (make, model, serial_number) VALUES (?, ?, ?)",
+            (make, model, serial_number)
+        )
+        camera_id = cursor.lastrowid
+        self.logger.info(f"Created camera: {make} {model} (ID: {camera_id})")
+        return camera_id
 
     def insert_image(self, file_path: Path, xdim: int, ydim: int,
                     camera_make: str, camera_model: str,
@@ -222,35 +314,45 @@ class DatabaseManager:
         Returns:
             Image ID
         """
+        with self.get_connection() as conn:
+            return self._insert_image(conn, file_path, xdim, ydim, camera_make,
+                                      camera_model, file_type, camera_serial)
+
+    def _insert_image(self, conn: sqlite3.Connection, file_path: Path, xdim: int, ydim: int,
+                      camera_make: str, camera_model: str,
+                      file_type: Optional[str] = None,
+                      camera_serial: Optional[str] = None) -> int:
+        """insert_image on an open connection"""
         # Calculate derived values
         file_stat = file_path.stat()
         file_hash = self.calculate_file_hash(file_path)
+        file_fingerprint = self.calculate_file_fingerprint(file_path)
 
         # Get or create camera
-        camera_id = self.get_or_create_camera(camera_make, camera_model, camera_serial)
-
-        with self.get_connection() as conn:
-            cursor = conn.execute(
-                """INSERT INTO images
-                   (file_path, filename, file_type, file_hash, file_size, file_modified,
-                    xdim, ydim, camera_id, last_analyzed)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    str(file_path),
-                    file_path.name,
-                    file_type or file_path.suffix.upper().lstrip('.'),
-                    file_hash,
-                    file_stat.st_size,
-                    datetime.fromtimestamp(file_stat.st_mtime),
-                    xdim,
-                    ydim,
-                    camera_id,
-                    datetime.now()
-                )
+        camera_id = self._get_or_create_camera(conn, camera_make, camera_model, camera_serial)
+
+        cursor = conn.execute(
+            """INSERT INTO images
+               (file_path, filename, file_type, file_hash, file_fingerprint, file_size,
+                file_modified, xdim, ydim, camera_id, last_analyzed)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                str(file_path),
+                file_path.name,
+                file_type or file_path.suffix.upper().lstrip('.'),
+                file_hash,
+                file_fingerprint,
+                file_stat.st_size,
+                datetime.fromtimestamp(file_stat.st_mtime),
+                xdim,
+                ydim,
+                camera_id,
+                datetime.now()
             )
-            image_id = cursor.lastrowid
-            self.logger.info(f"Inserted image: {file_path.name} (ID: {image_id})")
-            return image_id
+        )
+        image_id = cursor.lastrowid
+        self.logger.info(f"Inserted image: {file_path.name} (ID: {image_id})")
+        return image_id
 
     def insert_analysis_results(self, image_id: int, ev: Optional[float] = None,
                                 noise_std: Optional[float] = None,
@@ -268,15 +370,22 @@ class DatabaseManager:
             Analysis result ID
         """
         with self.get_connection() as conn:
-            cursor = conn.execute(
-                """INSERT INTO analysis_results
-                   (image_id, ev, noise_std, noise_mean)
-                   VALUES (?, ?, ?, ?)""",
-                (image_id, ev, noise_std, noise_mean)
-            )
-            result_id = cursor.lastrowid
-            self.logger.debug(f"Inserted analysis results for image {image_id}")
-            return result_id
+            return self._insert_analysis_results(conn, image_id, ev, noise_std, noise_mean)
+
+    def _insert_analysis_results(self, conn: sqlite3.Connection, image_id: int,
+                                 ev: Optional[float] = None,
+                                 noise_std: Optional[float] = None,
+                                 noise_mean: Optional[float] = None) -> int:
+        """insert_analysis_results on an open connection"""
+        cursor = conn.execute(
+            """INSERT INTO analysis_results
+               (image_id, ev, noise_std, noise_mean)
+               VALUES (?, ?, ?, ?)""",
+            (image_id, ev, noise_std, noise_mean)
+        )
+        result_id = cursor.lastrowid
+        self.logger.debug(f"Inserted analysis results for image {image_id}")
+        return result_id
 
     def insert_exif_data(self, image_id: int, exif_dict: Dict[str, Any],
                         iso: Optional[int] = None,
@@ -301,6 +410,18 @@ class DatabaseManager:
         Returns:
             EXIF data ID
         """
+        with self.get_connection() as conn:
+            return self._insert_exif_data(conn, image_id, exif_dict, iso, exposure_time,
+                                          black_level, white_level, bits_per_sample, megapixels)
+
+    def _insert_exif_data(self, conn: sqlite3.Connection, image_id: int, exif_dict: Dict[str, Any],
+                          iso: Optional[int] = None,
+                          exposure_time: Optional[float] = None,
+                          black_level: Optional[Any] = None,
+                          white_level: Optional[Any] = None,
+                          bits_per_sample: Optional[int] = None,
+                          megapixels: Optional[float] = None) -> int:
+        """insert_exif_data on an open connection"""
         # Extract commonly queried fields
         date_taken = exif_dict.get('EXIF:DateTimeOriginal')
         orientation = exif_dict.get('EXIF:Orientation')
@@ -329,34 +450,74 @@ class DatabaseManager:
 
         # Calculate megapixels from image dimensions if not provided
         if megapixels is None:
-            with self.get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT xdim, ydim FROM images WHERE id = ?",
-                    (image_id,)
-                )
-                row = cursor.fetchone()
-                if row:
-                    xdim, ydim = row['xdim'], row['ydim']
-                    megapixels = (xdim * ydim) / 1_000_000.0
+            cursor = conn.execute(
+                "SELECT xdim, ydim FROM images WHERE id = ?",
+                (image_id,)
+            )
+            row = cursor.fetchone()
+            if row:
+                xdim, ydim = row['xdim'], row['ydim']
+                megapixels = (xdim * ydim) / 1_000_000.0
 
         # Convert arrays to JSON
         black_level_json = json.dumps(black_level) if isinstance(black_level, (list, tuple)) else black_level
         white_level_json = json.dumps(white_level) if isinstance(white_level, (list, tuple)) else white_level
 
+        cursor = conn.execute(
+            """INSERT INTO exif_data
+               (image_id, exif_json, iso, exposure_time,
+                black_level, white_level, bits_per_sample, megapixels,
+                date_taken, orientation, color_space, white_balance)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (image_id, json.dumps(exif_dict), iso, exposure_time,
+             black_level_json, white_level_json, bits_per_sample, megapixels,
+             date_taken, orientation, color_space, white_balance)
+        )
+        exif_id = cursor.lastrowid
+        self.logger.debug(f"Inserted EXIF data for image {image_id}")
+        return exif_id
+
+    def insert_images_bulk(self, records: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Insert several images with their analysis results and EXIF data in
+        one transaction, instead of one connection and commit per row.
+
+        Each record is inserted under its own savepoint: a record that fails
+        (e.g. a duplicate file) is rolled back and logged without affecting
+        the others.
+
+        Args:
+            records: One dictionary per image with the keys
+                'image': insert_image keyword arguments
+                'analysis': insert_analysis_results keyword arguments
+                            without image_id (optional)
+                'exif': insert_exif_data keyword arguments without image_id
+                        (optional)
+
+        Returns:
+            Image ID per record, or None where the record failed
+        """
+        image_ids = []
         with self.get_connection() as conn:
-            cursor = conn.execute(
-                """INSERT INTO exif_data
-                   (image_id, exif_json, iso, exposure_time,
-                    black_level, white_level, bits_per_sample, megapixels,
-                    date_taken, orientation, color_space, white_balance)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (image_id, json.dumps(exif_dict), iso, exposure_time,
-                 black_level_json, white_level_json, bits_per_sample, megapixels,
-                 date_taken, orientation, color_space, white_balance)
-            )
-            exif_id = cursor.lastrowid
-            self.logger.debug(f"Inserted EXIF data for image {image_id}")
-            return exif_id
+            conn.execute("BEGIN")
+            for record in records:
+                conn.execute("SAVEPOINT image_record")
+                try:
+                    image_id = self._insert_image(conn, **record['image'])
+                    if record.get('analysis') is not None:
+                        self._insert_analysis_results(conn, image_id, **record['analysis'])
+                    if record.get('exif') is not None:
+                        self._insert_exif_data(conn, image_id, **record['exif'])
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT image_record")
+                    self.logger.error(
+                        f"Failed to insert {Path(record['image']['file_path']).name}: {e}",
+                        exc_info=True
+                    )
+                    image_id = None
+                conn.execute("RELEASE SAVEPOINT image_record")
+                image_ids.append(image_id)
+        return image_ids
 
     def get_image_by_path(self, file_path: Path) -> Optional[Dict]:
         """Get image record by file path"""
@@ -378,49 +539,79 @@ class DatabaseManager:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def get_all_analysis_data(self, include_archived: bool = False) -> List[Dict]:
+    @staticmethod
+    def _analysis_data_query(include_archived: bool, time_alias: bool) -> str:
+        """SQL shared by get_all_analysis_data and get_all_analysis_dataframe"""
+        archived_filter = "" if include_archived else "AND i.archived = 0"
+        time_column = ",\n                e.exposure_time as time" if time_alias else ""
+
+        return f"""
+            SELECT
+                CASE
+                    WHEN e.megapixels IS NOT NULL THEN
+                        c.model || ' (' || ROUND(e.megapixels, 1) || 'MP)'
+                    ELSE
+                        c.model
+                END as camera,
+                e.iso,
+                e.exposure_time,
+                a.ev,
+                a.noise_std,
+                a.noise_mean,
+                i.file_path as source,
+                i.filename,
+                i.xdim,
+                i.ydim,
+                e.megapixels,
+                e.bits_per_sample,
+                e.black_level,
+                e.white_level{time_column}
+            FROM images i
+            LEFT JOIN exif_data e ON e.image_id = i.id
+            LEFT JOIN analysis_results a ON a.image_id = i.id
+            JOIN cameras c ON i.camera_id = c.id
+            WHERE 1=1 {archived_filter}
+            ORDER BY c.model, e.iso, e.exposure_time
+        """
+
+    def get_all_analysis_data(self, include_archived: bool = False,
+                              time_alias: bool = False) -> List[Dict]:
         """
         Get all analysis data (similar to CSV format).
 
         Args:
             include_archived: Include archived images
+            time_alias: Also return exposure_time as a trailing 'time' column
+                        (legacy name used by sensor_camera plots)
 
         Returns:
             List of dictionaries with analysis data
         """
-        archived_filter = "" if include_archived else "AND i.archived = 0"
-
         with self.get_connection() as conn:
-            cursor = conn.execute(f"""
-                SELECT
-                    CASE
-                        WHEN e.megapixels IS NOT NULL THEN
-                            c.model || ' (' || ROUND(e.megapixels, 1) || 'MP)'
-                        ELSE
-                            c.model
-                    END as camera,
-                    e.iso,
-                    e.exposure_time,
-                    a.ev,
-                    a.noise_std,
-                    a.noise_mean,
-                    i.file_path as source,
-                    i.filename,
-                    i.xdim,
-                    i.ydim,
-                    e.megapixels,
-                    e.bits_per_sample,
-                    e.black_level,
-                    e.white_level
-                FROM images i
-                LEFT JOIN exif_data e ON e.image_id = i.id
-                LEFT JOIN analysis_results a ON a.image_id = i.id
-                JOIN cameras c ON i.camera_id = c.id
-                WHERE 1=1 {archived_filter}
-                ORDER BY c.model, e.iso, e.exposure_time
-            """)
+            cursor = conn.execute(self._analysis_data_query(include_archived, time_alias))
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_all_analysis_dataframe(self, include_archived: bool = False,
+                                   time_alias: bool = False):
+        """
+        Get all analysis data as a pandas DataFrame.
+
+        Same rows and columns as get_all_analysis_data, but pandas builds the
+        columns straight from the cursor instead of from a list of dicts.
+
+        Args:
+            include_archived: Include archived images
+            time_alias: Also return exposure_time as a trailing 'time' column
+
+        Returns:
+            DataFrame with analysis data (no rows if the database is empty)
+        """
+        import pandas as pd
+
+        with self.get_connection() as conn:
+            conn.row_factory = None  # Plain tuples; pandas takes names from the cursor
+            return pd.read_sql_query(self._analysis_data_query(include_archived, time_alias), conn)
+
     def mark_archived(self, image_id: int, archived: bool = True) -> None:
         """Mark image as archived"""
         with self.get_connection() as conn:
@@ -3,12 +3,22 @@ Centralized ExifTool path resolution for both development and frozen (PyInstalle
 
 When running as a frozen app, returns the path to the bundled exiftool script
 and configures PERL5LIB. Otherwise returns 'exiftool' for system PATH lookup.
+
+get_exiftool_helper() lends out one long-running exiftool process
+(-stay_open) instead of starting a new Perl process for every lookup.
 """
 
 import sys
 import os
+import atexit
+import threading
 from pathlib import Path
 
+# Shared exiftool process, started on first use and stopped at shutdown
+_shared_helper = None
+# Held while a caller uses the shared process (one request at a time)
+_shared_lock = threading.RLock()
+
 
 def get_exiftool_path() -> str:
     """
@@ -32,7 +42,7 @@ def get_exiftool_path() -> str:
         return 'exiftool'
 
 
-def get_exiftool_helper(**kwargs):
+def _create_exiftool_helper(**kwargs):
     """
     Create an ExifToolHelper instance with the correct exiftool path.
 
@@ -40,7 +50,7 @@ def get_exiftool_helper(**kwargs):
         **kwargs: Additional keyword arguments passed to ExifToolHelper
 
     Returns:
-        exiftool.ExifToolHelper instance
+        exiftool.ExifToolHelper instance (not started)
     """
     import exiftool
 
@@ -49,3 +59,60 @@ def get_exiftool_helper(**kwargs):
         return exiftool.ExifToolHelper(executable=executable, **kwargs)
     else:
         return exiftool.ExifToolHelper(**kwargs)
+
+
+class _SharedExifToolHelper:
+    """Context manager that lends out the shared, running ExifToolHelper."""
+
+    def __enter__(self):
+        global _shared_helper
+        _shared_lock.acquire()
+        try:
+            if _shared_helper is None or not _shared_helper.running:
+                _shared_helper = _create_exiftool_helper()
+                _shared_helper.run()
+            return _shared_helper
+        except Exception:
+            _shared_lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Keep the process running for the next caller
+        _shared_lock.release()
+        return False
+
+
+def get_exiftool_helper(**kwargs):
+    """
+    Get an ExifToolHelper for use in a with-statement.
+
+    Without arguments the with-statement yields the shared exiftool process,
+    which stays running between calls; callers are serialized while they use
+    it. With arguments a separate ExifToolHelper is created, which starts and
+    stops its own process.
+
+    Args:
+        **kwargs: Additional keyword arguments passed to ExifToolHelper
+
+    Returns:
+        Context manager yielding an exiftool.ExifToolHelper
+    """
+    if kwargs:
+        return _create_exiftool_helper(**kwargs)
+    return _SharedExifToolHelper()
+
+
+def close_exiftool_helper() -> None:
+    """Stop the shared exiftool process if it is running."""
+    global _shared_helper
+    with _shared_lock:
+        if _shared_helper is not None:
+            try:
+                if _shared_helper.running:
+                    _shared_helper.terminate()
+            except Exception:
+                pass  # Process already gone
+            _shared_helper = None
+
+
+atexit.register(close_exiftool_helper)
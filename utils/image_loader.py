@@ -170,7 +170,7 @@ class ImageLoader:
 
         # Convert 16-bit to 8-bit for display
         if normalize_to_8bit and image_array.dtype == np.uint16:
-            image_array = (image_array / 256).astype(np.uint8)
+            image_array = (image_array >> 8).astype(np.uint8)
 
         self.cache.put(cache_key, image_array)
         return image_array
@@ -265,8 +265,8 @@ def normalize_for_display(image_array: np.ndarray) -> np.ndarray:
         Normalized 8-bit image array
     """
     if image_array.dtype == np.uint16:
-        # Convert 16-bit to 8-bit
-        return (image_array / 256).astype(np.uint8)
+        # Convert 16-bit to 8-bit (high byte, no float64 intermediate)
+        return (image_array >> 8).astype(np.uint8)
     elif image_array.dtype == np.float32 or image_array.dtype == np.float64:
         # Assume float values are in [0, 1] range
         return (image_array * 255).astype(np.uint8)
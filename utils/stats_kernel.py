@@ -0,0 +1,292 @@
+"""
+Fused kernels for raw sensor data.
+Computes mean, std, min and max in a single pass over the image instead of
+four separate numpy reductions, and maps raw values to 8-bit display values
+(linear range or 16-bit high byte) without a full-size float intermediate.
+Uses Numba when available, otherwise a cache-blocked numpy fallback.
+"""
+
+import threading
+import numpy as np
+from typing import Optional, Tuple
+
+# JIT compilation (optional)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Elements per block in the numpy fallback (~2 MB of uint16, stays in cache)
+_BLOCK_ELEMENTS = 1 << 20
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _fused_stats_2d(a, shift):
+        """Per-row partial sums/min/max, combined at the end (one pass)."""
+        rows, cols = a.shape
+        sums = np.zeros(rows, dtype=np.float64)
+        sumsqs = np.zeros(rows, dtype=np.float64)
+        mins = np.full(rows, np.inf)
+        maxs = np.full(rows, -np.inf)
+
+        for r in prange(rows):
+            s = 0.0
+            ss = 0.0
+            mn = np.inf
+            mx = -np.inf
+            for c in range(cols):
+                v = np.float64(a[r, c])
+                d = v - shift
+                s += d
+                ss += d * d
+                if v < mn:
+                    mn = v
+                if v > mx:
+                    mx = v
+            sums[r] = s
+            sumsqs[r] = ss
+            mins[r] = mn
+            maxs[r] = mx
+
+        return sums.sum(), sumsqs.sum(), mins.min(), maxs.max()
+
+    @njit(parallel=True, cache=True)
+    def _min_max_2d(a):
+        """Per-row min/max, combined at the end (one pass)."""
+        rows, cols = a.shape
+        mins = np.full(rows, np.inf)
+        maxs = np.full(rows, -np.inf)
+
+        for r in prange(rows):
+            mn = np.inf
+            mx = -np.inf
+            for c in range(cols):
+                v = np.float64(a[r, c])
+                if v < mn:
+                    mn = v
+                if v > mx:
+                    mx = v
+            mins[r] = mn
+            maxs[r] = mx
+
+        return mins.min(), maxs.max()
+
+    @njit(parallel=True, cache=True)
+    def _normalize_to_u8_2d(src, min_val, scale, dst):
+        """Fused subtract/scale/clip/cast into a preallocated uint8 buffer."""
+        rows, cols = src.shape
+        for r in prange(rows):
+            for c in range(cols):
+                v = (np.float32(src[r, c]) - min_val) * scale
+                if v < 0.0:
+                    v = 0.0
+                elif v > 255.0:
+                    v = 255.0
+                dst[r, c] = np.uint8(v)
+
+    @njit(parallel=True, cache=True)
+    def _high_byte_2d(src, dst):
+        """uint16 -> uint8 high byte (x >> 8) straight into the output buffer."""
+        rows, cols = src.shape
+        for r in prange(rows):
+            for c in range(cols):
+                dst[r, c] = np.uint8(src[r, c] >> 8)
+
+
+# Per-thread block buffers of the numpy fallback, reused across calls
+_scratch = threading.local()
+
+
+def _block_scratch(dtype: type, rows: int, cols: int) -> np.ndarray:
+    """Return a (rows, cols) view of this thread's scratch buffer for dtype."""
+    key = np.dtype(dtype).char
+    buffer = getattr(_scratch, key, None)
+    if buffer is None or buffer.size < rows * cols:
+        buffer = np.empty(rows * cols, dtype=dtype)
+        setattr(_scratch, key, buffer)
+    return buffer[:rows * cols].reshape(rows, cols)
+
+
+def _numpy_stats_2d(a: np.ndarray, shift: float) -> Tuple[float, float, float, float]:
+    """Blocked fallback: each block is reduced while it is still in cache."""
+    rows, cols = a.shape
+    block_rows = max(1, _BLOCK_ELEMENTS // max(cols, 1))
+    exact = a.dtype.kind in 'ui' and a.dtype.itemsize <= 2
+    work_dtype = np.int64 if exact else np.float64
+    offset = int(shift) if exact else shift
+
+    total = 0
+    total_sq = 0
+    mn = None
+    mx = None
+    for start in range(0, rows, block_rows):
+        block = a[start:start + block_rows]
+        # Center into the reused buffer: no allocation per block or per file
+        centered = _block_scratch(work_dtype, block.shape[0], cols)
+        np.subtract(block, offset, out=centered, dtype=work_dtype)
+        if exact:
+            # Integer sums are exact; squares of 16-bit values fit in 64 bits
+            total += int(centered.sum())
+            total_sq += int(np.dot(centered.ravel(), centered.ravel()))
+            # Reduce the dense copy rather than the (possibly cropped, strided) block
+            block_min = int(centered.min()) + int(shift)
+            block_max = int(centered.max()) + int(shift)
+        else:
+            total += float(centered.sum())
+            total_sq += float(np.dot(centered.ravel(), centered.ravel()))
+            block_min = block.min()
+            block_max = block.max()
+        mn = block_min if mn is None else min(mn, block_min)
+        mx = block_max if mx is None else max(mx, block_max)
+
+    return total, total_sq, float(mn), float(mx)
+
+
+def _numpy_min_max_2d(a: np.ndarray) -> Tuple[float, float]:
+    """Blocked fallback: max is taken while the block is still in cache after min."""
+    rows, cols = a.shape
+    block_rows = max(1, _BLOCK_ELEMENTS // max(cols, 1))
+    mn = None
+    mx = None
+    for start in range(0, rows, block_rows):
+        block = a[start:start + block_rows]
+        block_min = block.min()
+        block_max = block.max()
+        mn = block_min if mn is None else min(mn, block_min)
+        mx = block_max if mx is None else max(mx, block_max)
+    return float(mn), float(mx)
+
+
+def _numpy_normalize_to_u8_2d(src: np.ndarray, min_val: float, scale: float,
+                              dst: np.ndarray) -> None:
+    """Blocked fallback: float32 scratch is limited to one block."""
+    rows, cols = src.shape
+    block_rows = max(1, _BLOCK_ELEMENTS // max(cols, 1))
+    for start in range(0, rows, block_rows):
+        work = src[start:start + block_rows].astype(np.float32)
+        work -= np.float32(min_val)
+        work *= np.float32(scale)
+        np.clip(work, 0.0, 255.0, out=work)
+        dst[start:start + block_rows] = work
+
+
+def normalize_to_u8(src: np.ndarray, min_val: float, max_val: float,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Map [min_val, max_val] linearly onto 0-255.
+
+    Equivalent to ((src - min_val) / (max_val - min_val) * 255).astype(np.uint8)
+    with values outside the range clipped, but without allocating a full-size
+    float32 copy of src.
+
+    Args:
+        src: 2D image array (any numeric dtype, may be a strided view)
+        min_val: Value mapped to 0
+        max_val: Value mapped to 255
+        out: Optional C-contiguous uint8 buffer with src.shape to write into
+
+    Returns:
+        The uint8 display array (out if given)
+    """
+    if out is None:
+        out = np.empty(src.shape, dtype=np.uint8)
+
+    if max_val <= min_val:
+        out.fill(0)
+        return out
+
+    scale = 255.0 / (float(max_val) - float(min_val))
+    if NUMBA_AVAILABLE:
+        _normalize_to_u8_2d(src, np.float32(min_val), np.float32(scale), out)
+    else:
+        _numpy_normalize_to_u8_2d(src, min_val, scale, out)
+    return out
+
+
+def high_byte_to_u8(src: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert 16-bit data to 8-bit display values by keeping the high byte.
+
+    Equivalent to (src / 65535 * 255).astype(np.uint8) within 1 LSB, without
+    a float intermediate.
+
+    Args:
+        src: uint16 image array (may be a strided view)
+        out: Optional C-contiguous uint8 buffer with src.shape to write into
+
+    Returns:
+        The uint8 display array (out if given)
+    """
+    if out is None:
+        out = np.empty(src.shape, dtype=np.uint8)
+
+    if NUMBA_AVAILABLE and src.ndim == 2:
+        _high_byte_2d(src, out)
+    else:
+        np.right_shift(src, 8, out=out, casting='unsafe')
+    return out
+
+
+def image_stats(image: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Calculate mean, standard deviation, min and max in one pass.
+
+    Equivalent to (np.mean, np.std, np.min, np.max) with ddof=0. Sums are
+    accumulated around the first pixel value to avoid cancellation in the
+    variance of dark frames.
+
+    Args:
+        image: Image array (typically 2D uint16 raw data, may be a strided view)
+
+    Returns:
+        Tuple of (mean, std, min, max) as Python floats
+    """
+    if image.size == 0:
+        raise ValueError("Cannot compute statistics of an empty image")
+
+    if image.ndim == 2:
+        a = image
+    elif image.ndim == 1:
+        a = image.reshape(1, -1)
+    else:
+        a = image.reshape(-1, image.shape[-1])
+    shift = float(a.flat[0])
+
+    if NUMBA_AVAILABLE:
+        total, total_sq, mn, mx = _fused_stats_2d(a, shift)
+    else:
+        total, total_sq, mn, mx = _numpy_stats_2d(a, shift)
+
+    n = a.size
+    mean_offset = total / n
+    variance = max(total_sq / n - mean_offset * mean_offset, 0.0)
+
+    return float(shift + mean_offset), float(np.sqrt(variance)), float(mn), float(mx)
+
+
+def min_max(image: np.ndarray) -> Tuple[float, float]:
+    """
+    Calculate min and max in one pass (instead of image.min() and image.max()).
+
+    Args:
+        image: Image array (typically 2D uint16 raw data, may be a strided view)
+
+    Returns:
+        Tuple of (min, max) as Python floats
+    """
+    if image.size == 0:
+        raise ValueError("Cannot compute min/max of an empty image")
+
+    if image.ndim == 2:
+        a = image
+    elif image.ndim == 1:
+        a = image.reshape(1, -1)
+    else:
+        a = image.reshape(-1, image.shape[-1])
+
+    if NUMBA_AVAILABLE:
+        mn, mx = _min_max_2d(a)
+        return float(mn), float(mx)
+    return _numpy_min_max_2d(a)
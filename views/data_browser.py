@@ -14,7 +14,7 @@ import pandas as pd
 from typing import Optional, List, Any
 from pathlib import Path
 
-from models.data_model import DataModel
+from models.data_model import DataModel, RowView, sorted_unique
 
 
 def format_exposure_time(exposure_time: float) -> str:
@@ -354,28 +354,23 @@ class DataBrowser(QWidget):
                     filters[prev_filter_type] = selected_values
 
             # Apply previous filters to get data source
-            if filters:
-                data_source = self.data_model.full_data.copy()
-                for field, values in filters.items():
-                    data_source = data_source[data_source[field].isin(values)]
-            else:
-                data_source = self.data_model.full_data
+            data_source = self.data_model.get_matching_rows(filters)
 
         # Get unique values from the filtered data source
         if filter_type == 'camera':
-            values = sorted(data_source['camera'].unique().tolist()) if 'camera' in data_source.columns else []
+            values = sorted_unique(data_source['camera']) if 'camera' in data_source.columns else []
             items = [str(v) for v in values]
         elif filter_type == 'iso':
-            values = sorted([x for x in data_source['iso'].unique().tolist() if pd.notna(x)]) if 'iso' in data_source.columns else []
+            values = sorted_unique(data_source['iso']) if 'iso' in data_source.columns else []
             items = [str(v) for v in values]
         elif filter_type == 'exposure_time':
-            values = sorted([x for x in data_source['exposure_time'].unique().tolist() if pd.notna(x)]) if 'exposure_time' in data_source.columns else []
+            values = sorted_unique(data_source['exposure_time']) if 'exposure_time' in data_source.columns else []
             items = [format_exposure_time(v) for v in values]
         elif filter_type == 'bits_per_sample':
-            values = sorted([x for x in data_source['bits_per_sample'].unique().tolist() if pd.notna(x)]) if 'bits_per_sample' in data_source.columns else []
+            values = sorted_unique(data_source['bits_per_sample']) if 'bits_per_sample' in data_source.columns else []
             items = [f"{v} bit" for v in values]
         elif filter_type == 'megapixels':
-            values = sorted([x for x in data_source['megapixels'].unique().tolist() if pd.notna(x)]) if 'megapixels' in data_source.columns else []
+            values = sorted_unique(data_source['megapixels']) if 'megapixels' in data_source.columns else []
             items = [f"{v:.1f} MP" for v in values]
         else:
             values = []
@@ -482,8 +477,8 @@ class DataBrowser(QWidget):
                 ]
                 filters[filter_type] = selected_values
 
-        # Apply combined filters
-        self.data_model.filter_by_multiple_fields(filters)
+        # Apply combined filters (one mask over the full dataset)
+        self.data_model.apply_filters(fields=filters)
 
         # Update table
         self._update_table()
@@ -722,6 +717,18 @@ class DataBrowser(QWidget):
         """
         return self.data_model.get_row(row)
 
+    def get_row_view(self, row: int) -> RowView:
+        """
+        Get the selection fields of a specific row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            RowView for the row
+        """
+        return self.data_model.get_row_view(row)
+
     def get_selected_row(self) -> Optional[int]:
         """Get currently selected row index"""
         indexes = self.table_view.selectionModel().selectedRows()
@@ -15,6 +15,7 @@ from typing import Optional, Dict, Any
 from pathlib import Path
 
 from utils.image_loader import get_image_loader, normalize_for_display
+from utils.stats_kernel import image_stats, normalize_to_u8
 from views.image_window import ImageWindow
 
 
@@ -126,8 +127,8 @@ class ImageViewer(QWidget):
             # Load raw data directly without color processing (greyscale)
             logger.debug("Loading raw greyscale data")
             with rawpy.imread(str(file_path)) as raw:
-                # Get raw pixel data (greyscale)
-                raw_data = raw.raw_image.copy()
+                # Get raw pixel data (greyscale); a view into rawpy's buffer
+                raw_data = raw.raw_image
 
                 # Apply camera-specific crop if available
                 crop = Sensor.CAMERA_CROPS.get(camera_model) if camera_model else None
@@ -135,31 +136,33 @@ class ImageViewer(QWidget):
                     logger.debug(f"Applying crop for {camera_model}")
                     raw_data = raw_data[crop]
 
-                # Calculate statistics
-                mean_val = float(np.mean(raw_data))
-                std_val = float(np.std(raw_data))
+                # Contiguous copy of the cropped region (the buffer is freed on close)
+                raw_data = raw_data.copy()
+
+                # Calculate statistics in one pass over the frame
+                mean_val, std_val, min_val, max_val = image_stats(raw_data)
                 ydim, xdim = raw_data.shape
                 bit_depth = raw_data.dtype.itemsize * 8
-                min_val = int(np.min(raw_data))
-                max_val = int(np.max(raw_data))
+                min_val = int(min_val)
+                max_val = int(max_val)
 
                 logger.debug(f"Image loaded, shape: {raw_data.shape}, dtype: {raw_data.dtype}, greyscale")
 
-                # Normalize to 8-bit for display
+                # Display data: uint16 frames go to Qt as Grayscale16 without an 8-bit pass
                 if raw_data.dtype == np.uint16:
-                    display_array = (raw_data.astype(np.float32) / 65535.0 * 255.0).astype(np.uint8)
+                    display_array = raw_data
+                    image_format = QImage.Format.Format_Grayscale16
                 elif raw_data.dtype == np.uint8:
                     display_array = raw_data
+                    image_format = QImage.Format.Format_Grayscale8
                 else:
                     # For other types, normalize to full range
-                    if max_val > min_val:
-                        display_array = ((raw_data.astype(np.float32) - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                    else:
-                        display_array = np.zeros_like(raw_data, dtype=np.uint8)
+                    display_array = normalize_to_u8(raw_data, min_val, max_val)
+                    image_format = QImage.Format.Format_Grayscale8
 
                 # Convert to QImage (greyscale)
-                bytes_per_line = xdim
-                qimage = QImage(display_array.data, xdim, ydim, bytes_per_line, QImage.Format.Format_Grayscale8)
+                bytes_per_line = display_array.strides[0]
+                qimage = QImage(display_array.data, xdim, ydim, bytes_per_line, image_format)
                 pixmap = QPixmap.fromImage(qimage)
                 logger.debug(f"QPixmap created, size: {pixmap.width()}x{pixmap.height()}, greyscale")
 
@@ -180,40 +183,17 @@ class ImageViewer(QWidget):
             try:
                 from utils.db_manager import get_db_manager
                 db = get_db_manager()
-                file_hash = db.calculate_file_hash(Path(file_path))
+                file_hash = db.lookup_file_hash(Path(file_path))
                 camera_id = db.get_camera_id_by_file_hash(file_hash)
                 logger.debug(f"Looked up camera_id={camera_id} from file hash")
             except Exception as e:
                 logger.debug(f"Could not look up camera ID: {e}")
 
-            # Store for popup window
-            self.current_pixmap = pixmap
-            self.current_display_array = display_array
-            self.current_file_path = file_path
-            self.current_camera_model = camera_model
-            self.current_raw_data = raw_data
-            self.current_stats = stats
-            self.current_file_hash = file_hash
-            self.current_camera_id = camera_id
-
-            # Load and display metadata
-            logger.debug("Loading metadata")
-            self._load_metadata(file_path)
-
-            # Enable pop out button
-            self.btn_pop_out_image.setEnabled(True)
-
-            # Update image window if it's open
-            if self.image_window and self.image_window.isVisible():
-                self.image_window.load_image(
-                    pixmap, display_array, file_path,
-                    stats=stats, raw_data=raw_data,
-                    file_hash=file_hash, camera_id=camera_id
-                )
-
-            # Emit signal
-            logger.info(f"Image loaded successfully: {Path(file_path).name}")
-            self.image_loaded.emit(file_path)
+            self.show_raw_data(
+                file_path, display_array, stats, raw_data,
+                file_hash=file_hash, camera_id=camera_id,
+                camera_model=camera_model, pixmap=pixmap
+            )
 
         except Exception as e:
             logger.error(f"Failed to load image: {file_path}", exc_info=True)
@@ -221,6 +201,73 @@ class ImageViewer(QWidget):
             self.status_label.setText(f"Error: {str(e)}")
             raise
 
+    def show_raw_data(self, file_path: str, display_array: np.ndarray,
+                      stats: Dict[str, Any], raw_data: np.ndarray,
+                      file_hash: Optional[str] = None, camera_id: Optional[int] = None,
+                      camera_model: Optional[str] = None,
+                      pixmap: Optional[QPixmap] = None) -> None:
+        """
+        Display raw data decoded elsewhere (e.g. on a background thread).
+
+        Args:
+            file_path: Path to image file
+            display_array: Numpy array for pixel inspection
+            stats: Dictionary with image statistics
+            raw_data: Greyscale sensor data (cropped)
+            file_hash: Optional file hash for database lookup
+            camera_id: Optional camera ID for loading/saving attributes
+            camera_model: Camera model used for the crop
+            pixmap: Optional display pixmap; None renders it from raw_data
+                    when the image window is shown
+        """
+        from utils.app_logger import get_logger
+        logger = get_logger()
+
+        # Store for popup window
+        self.current_pixmap = pixmap
+        self.current_display_array = display_array
+        self.current_file_path = file_path
+        self.current_camera_model = camera_model
+        self.current_raw_data = raw_data
+        self.current_stats = stats
+        self.current_file_hash = file_hash
+        self.current_camera_id = camera_id
+
+        # Load and display metadata
+        logger.debug("Loading metadata")
+        self._load_metadata(file_path)
+
+        # Enable pop out button
+        self.btn_pop_out_image.setEnabled(True)
+
+        # Update image window if it's open
+        if self.is_image_window_open():
+            self.image_window.load_image(
+                pixmap, display_array, file_path,
+                stats=stats, raw_data=raw_data,
+                file_hash=file_hash, camera_id=camera_id
+            )
+
+        # Emit signal
+        logger.info(f"Image loaded successfully: {Path(file_path).name}")
+        self.image_loaded.emit(file_path)
+
+    def show_preview(self, pixmap: QPixmap, file_path: str) -> None:
+        """
+        Show a quick preview (e.g. embedded JPEG) in the open image window
+        while the raw data of file_path is decoded.
+
+        Args:
+            pixmap: Preview pixmap to display
+            file_path: Path to the file being loaded
+        """
+        if self.is_image_window_open():
+            self.image_window.show_preview(pixmap, file_path)
+
+    def is_image_window_open(self) -> bool:
+        """Check whether the popped out image window is visible"""
+        return self.image_window is not None and self.image_window.isVisible()
+
     def _numpy_to_pixmap(self, image_array: np.ndarray) -> QPixmap:
         """
         Convert numpy array to QPixmap.
@@ -458,7 +505,8 @@ class ImageViewer(QWidget):
 
     def _on_pop_out_image(self) -> None:
         """Pop out the image window"""
-        if self.current_pixmap is None or self.current_display_array is None or not self.current_file_path:
+        # The pixmap may be None: the window then renders it from the raw data
+        if self.current_display_array is None or not self.current_file_path:
             return
 
         # Create window if it doesn't exist
@@ -16,6 +16,8 @@ import numpy as np
 from pathlib import Path
 from typing import Optional, Callable
 
+from utils.stats_kernel import image_stats, min_max, normalize_to_u8
+
 
 class ZoomableGraphicsView(QGraphicsView):
     """Graphics view with zoom and pan capabilities"""
@@ -423,6 +425,8 @@ class ImageWindow(QDialog):
         self.current_leaky_pixels = None  # List of (y, x) coordinates of leaky pixels
         self.original_width = None  # Original image width before crop
         self.original_height = None  # Original image height before crop
+        self._display_buffer = None  # Reused 8-bit render target (QPixmap.fromImage copies it)
+        self._display_qimage = None  # QImage wrapping _display_buffer
 
         # Projection window (created on demand)
         self.projection_window = None
@@ -674,7 +678,8 @@ class ImageWindow(QDialog):
         Load and display an image.
 
         Args:
-            pixmap: QPixmap to display
+            pixmap: QPixmap to display (may be None if stats and raw_data are
+                    given, the image is then rendered from raw_data)
             display_array: Numpy array for pixel inspection
             file_path: Path to the file
             stats: Optional dictionary with image statistics
@@ -693,7 +698,7 @@ class ImageWindow(QDialog):
             try:
                 from utils.db_manager import get_db_manager
                 db = get_db_manager()
-                file_hash = db.calculate_file_hash(Path(file_path))
+                file_hash = db.lookup_file_hash(Path(file_path))
                 self.current_file_hash = file_hash
 
                 # Look up camera ID from hash
@@ -710,7 +715,8 @@ class ImageWindow(QDialog):
         # Store original dimensions and uncropped data (before any cropping)
         if raw_data is not None:
             self.original_height, self.original_width = raw_data.shape
-            self.current_raw_data_uncropped = raw_data.copy()  # Save uncropped for projections
+            # Raw arrays are never modified in place, so views are kept, not copies
+            self.current_raw_data_uncropped = raw_data  # Save uncropped for projections
         else:
             self.original_width = stats.get('width') if stats else None
             self.original_height = stats.get('height') if stats else None
@@ -742,10 +748,9 @@ class ImageWindow(QDialog):
                         # Recalculate statistics on cropped data
                         if stats:
                             ydim, xdim = raw_data.shape
-                            mean_val = float(np.mean(raw_data))
-                            std_val = float(np.std(raw_data))
-                            min_val = int(np.min(raw_data))
-                            max_val = int(np.max(raw_data))
+                            mean_val, std_val, min_val, max_val = image_stats(raw_data)
+                            min_val = int(min_val)
+                            max_val = int(max_val)
 
                             stats = {
                                 'bit_depth': stats.get('bit_depth', 16),
@@ -768,7 +773,7 @@ class ImageWindow(QDialog):
         # Store the cropped data as both current and original
         # Original is the base data after crop but before leaky pixel removal
         self.current_raw_data = raw_data
-        self.current_raw_data_original = raw_data.copy() if raw_data is not None else None
+        self.current_raw_data_original = raw_data
 
         # Update filename with full path
         self.filename_label.setText(file_path)
@@ -782,43 +787,32 @@ class ImageWindow(QDialog):
             scale_mode = self.scale_mode_combo.currentText()
             print(f"Applying scaling on load: Scale Mode={scale_mode}")
 
-            # Start with raw data
-            working_data = raw_data.astype(np.float32)
+            display_buffer = self._get_display_buffer(raw_data.shape)
 
             # Apply scale mode transformation
             if scale_mode == "Linear":
                 # Linear: map from stats min/max to 0-255
                 min_val = stats.get('min', 0)
                 max_val = stats.get('max', 65535)
-                if max_val > min_val:
-                    display_array = ((working_data - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                else:
-                    display_array = np.zeros_like(raw_data, dtype=np.uint8)
+                display_array = normalize_to_u8(raw_data, min_val, max_val, out=display_buffer)
 
             elif scale_mode == "Log":
                 # Log: apply log transformation, then map to 0-255
-                working_data = np.log10(working_data + 1.0)
+                working_data = np.log10(raw_data.astype(np.float32) + 1.0)
                 max_log = np.log10(65536.0)
-                display_array = np.clip(working_data / max_log * 255.0, 0, 255).astype(np.uint8)
+                np.clip(working_data / max_log * 255.0, 0, 255, out=display_buffer, casting='unsafe')
+                display_array = display_buffer
 
             elif scale_mode == "Normalization":
                 # Normalization: stretch actual min/max to full 0-255 range
-                min_val = np.min(working_data)
-                max_val = np.max(working_data)
-                if max_val > min_val:
-                    display_array = ((working_data - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                else:
-                    display_array = np.zeros_like(raw_data, dtype=np.uint8)
+                min_val, max_val = min_max(raw_data)
+                display_array = normalize_to_u8(raw_data, min_val, max_val, out=display_buffer)
 
             elif scale_mode == "Equalization":
                 # Equalization: redistribute intensity values via histogram equalization
                 # First normalize to 0-255 range for histogram
-                min_val = np.min(working_data)
-                max_val = np.max(working_data)
-                if max_val > min_val:
-                    normalized = ((working_data - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                else:
-                    normalized = np.zeros_like(raw_data, dtype=np.uint8)
+                min_val, max_val = min_max(raw_data)
+                normalized = normalize_to_u8(raw_data, min_val, max_val, out=display_buffer)
 
                 # Compute histogram
                 hist, _ = np.histogram(normalized.flatten(), bins=256, range=(0, 256))
@@ -830,20 +824,15 @@ class ImageWindow(QDialog):
                 cdf_normalized = ((cdf - cdf.min()) * 255 / (cdf.max() - cdf.min())).astype(np.uint8)
 
                 # Map pixel values through the normalized CDF
-                display_array = cdf_normalized[normalized]
+                display_buffer[...] = cdf_normalized[normalized]
+                display_array = display_buffer
 
             else:
                 # Fallback to linear
-                display_array = (working_data / 65535.0 * 255.0).astype(np.uint8)
-
-            # Store for QImage
-            self._temp_display_array = display_array
+                display_array = normalize_to_u8(raw_data, 0, 65535, out=display_buffer)
 
             # Create new pixmap with scaled data
-            ydim, xdim = raw_data.shape
-            bytes_per_line = xdim
-            qimage = QImage(display_array.data, xdim, ydim, bytes_per_line, QImage.Format.Format_Grayscale8)
-            pixmap = QPixmap.fromImage(qimage)
+            pixmap = self._display_pixmap()
 
         # Display in graphics view
         self.pixmap_item.setPixmap(pixmap)
@@ -887,6 +876,83 @@ class ImageWindow(QDialog):
         # Automatically find leaky pixels
         self._on_find_leaky_pixels()
 
+    def show_preview(self, pixmap: QPixmap, file_path: str) -> None:
+        """
+        Show a quick preview (e.g. embedded JPEG) while raw data is loading.
+
+        Statistics and pixel inspection stay disabled until replace_full_res()
+        delivers the decoded raw data.
+
+        Args:
+            pixmap: Preview pixmap to display
+            file_path: Path to the file being loaded
+        """
+        self.current_file_path = file_path
+        self.current_raw_data = None
+        self.current_raw_data_original = None
+        self.current_raw_data_uncropped = None
+        self.current_stats = None
+
+        self.filename_label.setText(file_path)
+        self.pixmap_item.setPixmap(pixmap)
+        self.graphics_scene.setSceneRect(QRectF(pixmap.rect()))
+        self.graphics_view.set_image(None)
+        self.status_bar.showMessage(f"Preview: {Path(file_path).name} - loading raw data...")
+
+        if self.fit_to_window_checkbox.isChecked():
+            self.graphics_view.fit_to_window()
+            self._update_zoom_label()
+
+    def replace_full_res(self, display_array: np.ndarray,
+                         stats: dict, raw_data: np.ndarray,
+                         file_hash: str = None, camera_id: int = None,
+                         file_path: str = None) -> None:
+        """
+        Replace the preview shown by show_preview() with full-resolution raw data.
+
+        The pixmap is rendered from raw_data with the current scale mode.
+
+        Args:
+            display_array: Numpy array for pixel inspection
+            stats: Dictionary with image statistics
+            raw_data: Raw image data
+            file_hash: Optional file hash for database lookup
+            camera_id: Optional camera ID for loading/saving attributes
+            file_path: Path to the file (defaults to the previewed file)
+        """
+        self.load_image(
+            None, display_array, file_path or self.current_file_path,
+            stats=stats, raw_data=raw_data,
+            file_hash=file_hash, camera_id=camera_id
+        )
+
+    def _get_display_buffer(self, shape: tuple) -> np.ndarray:
+        """
+        Get the reusable 8-bit render buffer, reallocating only on shape change.
+
+        Args:
+            shape: (height, width) of the image being rendered
+
+        Returns:
+            C-contiguous uint8 array of the given shape
+        """
+        if self._display_buffer is None or self._display_buffer.shape != shape:
+            height, width = shape
+            self._display_buffer = np.empty(shape, dtype=np.uint8)
+            # QImage header over the buffer, built once per size
+            self._display_qimage = QImage(self._display_buffer.data, width, height, width,
+                                          QImage.Format.Format_Grayscale8)
+        return self._display_buffer
+
+    def _display_pixmap(self) -> QPixmap:
+        """
+        Convert the current contents of the display buffer to a pixmap.
+
+        Returns:
+            QPixmap of the display buffer (Grayscale8, no format conversion)
+        """
+        return QPixmap.fromImage(self._display_qimage, Qt.ImageConversionFlag.NoFormatConversion)
+
     def _delayed_fit_to_window(self):
         """Delayed fit to window - ensures window is sized first"""
         self.graphics_view.fit_to_window()
@@ -1073,48 +1139,35 @@ class ImageWindow(QDialog):
             else:
                 raw_data = self.current_raw_data_original if self.current_raw_data_original is not None else self.current_raw_data
 
-            ydim, xdim = raw_data.shape
-
-            # Start with raw data
-            working_data = raw_data.astype(np.float32)
+            display_buffer = self._get_display_buffer(raw_data.shape)
 
             # Apply scaling based on mode
             if scale_mode == "Linear":
                 # Linear: map from stats min/max to 0-255
                 min_val = self.current_stats.get('min', 0)
                 max_val = self.current_stats.get('max', 65535)
-                if max_val > min_val:
-                    display_array = ((working_data - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                else:
-                    display_array = np.zeros_like(raw_data, dtype=np.uint8)
+                display_array = normalize_to_u8(raw_data, min_val, max_val, out=display_buffer)
 
             elif scale_mode == "Log":
                 # Log: apply log transformation, then map to 0-255
                 print(f"  Applying log scaling")
-                working_data = np.log10(working_data + 1.0)
+                working_data = np.log10(raw_data.astype(np.float32) + 1.0)
                 max_log = np.log10(65536.0)
-                display_array = np.clip(working_data / max_log * 255.0, 0, 255).astype(np.uint8)
+                np.clip(working_data / max_log * 255.0, 0, 255, out=display_buffer, casting='unsafe')
+                display_array = display_buffer
 
             elif scale_mode == "Normalization":
                 # Normalization: stretch actual min/max to full 0-255 range
-                min_val = np.min(working_data)
-                max_val = np.max(working_data)
+                min_val, max_val = min_max(raw_data)
                 print(f"  Normalizing from {min_val:.2f} to {max_val:.2f}")
-                if max_val > min_val:
-                    display_array = ((working_data - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                else:
-                    display_array = np.zeros_like(raw_data, dtype=np.uint8)
+                display_array = normalize_to_u8(raw_data, min_val, max_val, out=display_buffer)
 
             elif scale_mode == "Equalization":
                 # Equalization: redistribute intensity values via histogram equalization
                 print(f"  Applying histogram equalization")
-                min_val = np.min(working_data)
-                max_val = np.max(working_data)
+                min_val, max_val = min_max(raw_data)
                 print(f"  Input range: {min_val:.2f} to {max_val:.2f}")
-                if max_val > min_val:
-                    normalized = ((working_data - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                else:
-                    normalized = np.zeros_like(raw_data, dtype=np.uint8)
+                normalized = normalize_to_u8(raw_data, min_val, max_val, out=display_buffer)
 
                 # Compute histogram
                 hist, _ = np.histogram(normalized.flatten(), bins=256, range=(0, 256))
@@ -1126,25 +1179,18 @@ class ImageWindow(QDialog):
                 cdf_normalized = ((cdf - cdf.min()) * 255 / (cdf.max() - cdf.min())).astype(np.uint8)
 
                 # Map pixel values through the normalized CDF
-                display_array = cdf_normalized[normalized]
+                display_buffer[...] = cdf_normalized[normalized]
+                display_array = display_buffer
                 print(f"  Histogram equalized: CDF range {cdf.min()} to {cdf.max()}")
 
             else:
                 # Fallback: use linear mode
                 min_val = self.current_stats.get('min', 0)
                 max_val = self.current_stats.get('max', 65535)
-                if max_val > min_val:
-                    display_array = ((working_data - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-                else:
-                    display_array = np.zeros_like(raw_data, dtype=np.uint8)
-
-            # Store the display array to keep it alive for QImage
-            self._temp_display_array = display_array
+                display_array = normalize_to_u8(raw_data, min_val, max_val, out=display_buffer)
 
-            # Convert to QImage and update display
-            bytes_per_line = xdim
-            qimage = QImage(display_array.data, xdim, ydim, bytes_per_line, QImage.Format.Format_Grayscale8)
-            pixmap = QPixmap.fromImage(qimage)
+            # Convert the render buffer and update display
+            pixmap = self._display_pixmap()
 
             print(f"  Updating display with new pixmap ({pixmap.width()}x{pixmap.height()})")
             self.pixmap_item.setPixmap(pixmap)
@@ -1193,8 +1239,8 @@ class ImageWindow(QDialog):
 
             # Use original data for finding leaky pixels
             raw_data = self.current_raw_data_original if self.current_raw_data_original is not None else self.current_raw_data
-            mean_val = float(np.mean(raw_data))
-            std_val = float(np.std(raw_data))
+            # One pass with float64 sums; np.std would build a full-frame float64 temporary
+            mean_val, std_val, _, _ = image_stats(raw_data)
             threshold = mean_val + sigma * std_val
 
             # Find leaky pixels (values > threshold)
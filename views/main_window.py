@@ -8,7 +8,7 @@ from PyQt6.QtWidgets import (
     QSplitter, QTabWidget, QMenuBar, QMenu, QToolBar,
     QStatusBar, QMessageBox, QFileDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QAction, QKeySequence
 from typing import Optional
 
@@ -289,13 +289,18 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self) -> None:
         """Connect signals between components"""
-        # When row is selected in data browser, load image
-        self.data_browser.row_selected.connect(self._on_row_selected)
+        # Row selection is handled by AppController, which loads the image
+        # into image_viewer on a background thread
 
         # When data browser emits status message, show in status bar
         self.data_browser.status_message.connect(self.status_bar.showMessage)
 
-        # When data browser filters change, update plot
+        # When data browser filters change, update plot. Debounced so a burst of
+        # filter changes renders the plot once, with the final filter state
+        self._plot_update_timer = QTimer(self)
+        self._plot_update_timer.setSingleShot(True)
+        self._plot_update_timer.setInterval(150)
+        self._plot_update_timer.timeout.connect(self._update_plot_from_filter)
         self.data_browser.data_filtered.connect(self._on_data_filtered)
 
         # When plot viewer camera selection changes, update data browser
@@ -1697,63 +1702,25 @@ Database Location:
                 f"Failed to clear database:\n{str(e)}"
             )
 
-    def _on_row_selected(self, row_index: int) -> None:
-        """Handle row selection in data browser"""
+    def _on_data_filtered(self) -> None:
+        """Handle data browser filter changes - schedule a plot update"""
         from utils.app_logger import get_logger
+        import traceback
         logger = get_logger()
 
-        try:
-            logger.info(f"Row selected: {row_index}")
-            row_data = self.data_browser.get_row_data(row_index)
-
-            # Extract file information
-            camera = row_data.get('camera', '')
-            iso = row_data.get('iso', '')
-            exposure_time = row_data.get('exposure_time', '')
-            source = row_data.get('source', '')
-
-            logger.debug(f"Row data: camera={camera}, iso={iso}, exposure_time={exposure_time}, source={source}")
-
-            # Try to load image using the file path from data browser
-            logger.debug("Getting file path for row")
-            file_path = self.data_browser.get_file_path_for_row(row_index)
-            logger.debug(f"File path resolved: {file_path}")
-
-            if file_path:
-                try:
-                    logger.info(f"Loading image: {file_path}")
-                    self.image_viewer.load_image(file_path, camera_model=camera)
-                    self.tab_widget.setCurrentIndex(0)  # Switch to image viewer tab
-                    self.status_bar.showMessage(
-                        f"✓ Loaded: {camera} | ISO {iso} | Exp: {exposure_time}s | File: {source}"
-                    )
-                    logger.info("Image loaded and displayed successfully")
-                except Exception as img_error:
-                    logger.error(f"Failed to load image: {img_error}", exc_info=True)
-                    self.status_bar.showMessage(
-                        f"✗ Load failed: {camera} | ISO {iso} | File: {source} | Error: {str(img_error)}"
-                    )
-            else:
-                logger.warning(f"File path not found for row {row_index}, source: {source}")
-                self.status_bar.showMessage(
-                    f"⚠️ File not found: {camera} | ISO {iso} | File: {source}"
-                )
+        # Log the call stack to see where this is being called from
+        stack = ''.join(traceback.format_stack()[-4:-1])
+        logger.info(f"Filter changed - scheduling plot update\nCall stack:\n{stack}")
 
-        except Exception as e:
-            logger.error(f"Error in row selection: {e}", exc_info=True)
-            self.status_bar.showMessage(f"Error: {str(e)}")
+        # Restart the debounce timer; only the last change in a burst renders
+        self._plot_update_timer.start()
 
-    def _on_data_filtered(self) -> None:
-        """Handle data browser filter changes - update plot with filtered data"""
+    def _update_plot_from_filter(self) -> None:
+        """Update plot with the current filtered data"""
         from utils.app_logger import get_logger
-        import traceback
         logger = get_logger()
 
         try:
-            # Log the call stack to see where this is being called from
-            stack = ''.join(traceback.format_stack()[-4:-1])
-            logger.info(f"Filter changed - updating plot\nCall stack:\n{stack}")
-
             # Get filtered data from data browser
             filtered_data = self.data_browser.get_filtered_data()
 
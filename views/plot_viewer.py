@@ -452,9 +452,10 @@ class PlotViewer(QWidget):
         fig = go.Figure()
         color_sequence = pc.qualitative.Plotly
 
-        cameras = sorted(data['camera'].unique())
-        for i, camera in enumerate(cameras):
-            camera_data = data[data['camera'] == camera].sort_values('iso')
+        # camera is categorical: observed=True skips cameras filtered out of the data
+        camera_groups = data.groupby('camera', observed=True, sort=True)
+        for i, (camera, camera_data) in enumerate(camera_groups):
+            camera_data = camera_data.sort_values('iso')
             color = color_sequence[i % len(color_sequence)]
 
             # Create custom hover text with formatted values
@@ -514,9 +515,10 @@ class PlotViewer(QWidget):
         fig = go.Figure()
         color_sequence = pc.qualitative.Plotly
 
-        cameras = sorted(data['camera'].unique())
-        for i, camera in enumerate(cameras):
-            camera_data = data[data['camera'] == camera].sort_values('time')
+        # camera is categorical: observed=True skips cameras filtered out of the data
+        camera_groups = data.groupby('camera', observed=True, sort=True)
+        for i, (camera, camera_data) in enumerate(camera_groups):
+            camera_data = camera_data.sort_values('time')
             color = color_sequence[i % len(color_sequence)]
 
             # Create custom hover text with formatted values